@@ -0,0 +1,390 @@
+"""
+HC09 CSV Editor - benchmark suite (headless; never imports tkinter)
+- Generates a synthetic franchise export in a temp folder: play / drpk / slri / trvw / coch / gmvw
+  with the real column codes (STAT_META, PLAYER_MAX_HARDCODED, IMMUTABLE_KEYS, TEAM_NAMES ids)
+- Times load_csv (dict + columnar), load_all, save_csv, swap_players_safe / swap_players_many, roster filter/sort,
+  pick sort and pick moves (acquire); --json writes the results so runs can be compared for regressions
+- --readers: DictReader vs positional fast reader on play.csv
+- --roundtrip-check: load / edit / save round trips keep data and in-place view updates keep order
+  (exit status 1 otherwise)
+- --import-check: `import guiHC09` must not load tkinter and must stay under IMPORT_BUDGET_MS
+  (exit status 1 otherwise)
+
+Run:
+  python bench_hc09.py [--rows 3000] [--cols 300] [--pick-years 3] [--staff 200] [--repeat 3] [--json out.json]
+  python bench_hc09.py --readers [--rows 3000] [--cols 300]
+  python bench_hc09.py --roundtrip-check
+  python bench_hc09.py --import-check [--budget-ms 150]
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from guiHC09 import (
+    CSVModel, EditEngine, EXPORT_FILES, TABLES, IMMUTABLE_KEYS, PLAYER_MAX_HARDCODED, STAT_META, TEAM_NAMES,
+    PLAYER_FIRST_NAME_CODE, PLAYER_LAST_NAME_CODE, PLAYER_POS_CODE, AGE_COL, YEARS_COL,
+    DRAFT_PICK_ID, DRAFT_PICK_NUM, DRAFT_PICK_YEAR, SALARY_CAP_KEY,
+    pick_sort_key, roster_sort_key, run_edit_script, swap_players_safe,
+)
+
+IMPORT_BUDGET_MS = 150  # generous: a warm `import guiHC09` takes ~50 ms, tkinter alone adds ~20 ms
+
+SWAP_PAIRS = 1000  # swap_players_safe calls per timed run
+ROUNDS = 7  # drpk.csv: picks per team per year
+
+FIRST_NAMES = ["John", "Mike", "Chris", "Tom", "Dan", "Josh", "Matt", "Ryan", "Kevin", "Marcus"]
+LAST_NAMES = ["Smith", "Johnson", "Brown", "Jones", "Miller", "Davis", "Wilson", "Moore", "Taylor", "Allen"]
+
+def player_headers(n_cols):
+    """Real play.csv codes first, padded with filler columns up to n_cols."""
+    heads = sorted(IMMUTABLE_KEYS) + [PLAYER_FIRST_NAME_CODE, PLAYER_LAST_NAME_CODE, PLAYER_POS_CODE, AGE_COL, YEARS_COL]
+    heads += list(STAT_META) + list(PLAYER_MAX_HARDCODED.values())
+    i = 0
+    while len(heads) < n_cols:
+        heads.append(f"X{i:03d}")
+        i += 1
+    return heads
+
+def _write_csv(path, heads, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(heads)
+        w.writerows(rows)
+    return path
+
+def write_play_csv(path, n_rows, n_cols, seed=1):
+    rnd = random.Random(seed)
+    heads = player_headers(n_cols)
+    team_ids = list(TEAM_NAMES)
+
+    def cell(i, h):
+        if h == "PGID" or h == "POID":
+            return str(i)
+        if h == "TGID":
+            return rnd.choice(team_ids)
+        if h == PLAYER_FIRST_NAME_CODE:
+            return rnd.choice(FIRST_NAMES)
+        if h == PLAYER_LAST_NAME_CODE:
+            return rnd.choice(LAST_NAMES)
+        if h == PLAYER_POS_CODE:
+            return str(rnd.randint(0, 20))
+        if h == AGE_COL:
+            return str(rnd.randint(21, 38))
+        if h == YEARS_COL:
+            return str(rnd.randint(0, 15))
+        return str(rnd.randint(25, 99))
+
+    return _write_csv(path, heads, ([cell(i, h) for h in heads] for i in range(n_rows)))
+
+def write_drpk_csv(path, n_years=3, seed=1):
+    """ROUNDS picks per team per year; year offsets skip 2 like real exports (0, 1, 3, ...)."""
+    rnd = random.Random(seed)
+    teams = [t for t in TEAM_NAMES if int(t) <= 32]
+    years = [y if y < 2 else y + 1 for y in range(n_years)]
+    rows = []
+    for y in years:
+        for num in range(ROUNDS * len(teams)):
+            # picks change hands: roughly one in eight is owned by another team
+            owner = teams[num % len(teams)] if rnd.random() > 0.125 else rnd.choice(teams)
+            rows.append([owner, str(num), str(y)])
+    rnd.shuffle(rows)
+    return _write_csv(path, [DRAFT_PICK_ID, DRAFT_PICK_NUM, DRAFT_PICK_YEAR], rows)
+
+def write_slri_csv(path):
+    return _write_csv(path, [SALARY_CAP_KEY, "SCMN", "SCYR"], [["123000000", "0", "2009"]])
+
+def write_staff_csv(path, n_rows, coaches=False, seed=1):
+    """trvw.csv / gmvw.csv (TGID, SKPT), or coch.csv with names and the coach skill columns."""
+    rnd = random.Random(seed)
+    team_ids = list(TEAM_NAMES)
+    heads = ["TGID", "SKPT"]
+    if coaches:
+        heads += ["CFNM", "CLNM", "CSPC", "SKPC", "SKPA", "SKPF", "CHEM"]
+    rows = []
+    for _ in range(n_rows):
+        row = [rnd.choice(team_ids), str(rnd.randint(0, 131071))]
+        if coaches:
+            row += [rnd.choice(FIRST_NAMES), rnd.choice(LAST_NAMES)] + [str(rnd.randint(1, 7)) for _ in range(5)]
+        rows.append(row)
+    return _write_csv(path, heads, rows)
+
+def write_export(folder, n_rows, n_cols, pick_years=3, n_staff=200, seed=1):
+    """All six CSVs under their standard names (EXPORT_FILES); returns table -> path."""
+    paths = {t: os.path.join(folder, name) for t, name in EXPORT_FILES.items()}
+    write_play_csv(paths["players"], n_rows, n_cols, seed)
+    write_drpk_csv(paths["picks"], pick_years, seed)
+    write_slri_csv(paths["salaries"])
+    write_staff_csv(paths["trainers"], n_staff, seed=seed)
+    write_staff_csv(paths["coaches"], n_staff, coaches=True, seed=seed)
+    write_staff_csv(paths["gms"], n_staff, seed=seed)
+    return paths
+
+# -----------------------------
+# Suite
+# -----------------------------
+def _time(fn, repeat, setup=None):
+    """Best / mean wall time of fn(setup()) over `repeat` runs (setup is not timed)."""
+    runs = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        t0 = time.perf_counter()
+        fn(arg)
+        runs.append(time.perf_counter() - t0)
+    return {"best_s": min(runs), "mean_s": sum(runs) / len(runs), "runs": len(runs)}
+
+def _load_all(paths, columnar=False):
+    m = CSVModel(columnar=columnar)
+    m.load_all(paths["players"], paths["picks"], paths["salaries"],
+               paths["trainers"], paths["coaches"], paths["gms"])
+    return m
+
+def run_suite(paths, repeat=3, seed=1):
+    """Time each hot path against the export in `paths`; returns name -> timing dict."""
+    results = {}
+    play = paths["players"]
+
+    for columnar in (False, True):
+        name = f"load_csv[{'columnar' if columnar else 'dict'}]"
+        results[name] = _time(lambda _: CSVModel(columnar=columnar).load_csv(play), repeat)
+    results["load_all"] = _time(lambda _: _load_all(paths), repeat)
+
+    model = _load_all(paths)
+    out_dir = tempfile.mkdtemp(prefix="hc09bench_save_")
+    out_file = os.path.join(out_dir, os.path.basename(play))
+
+    def save(_):
+        out = model.save_csv(model.players, model.player_headers, out_file)
+        os.remove(out)
+
+    results["save_csv"] = _time(save, repeat)
+    os.rmdir(out_dir)
+
+    rnd = random.Random(seed)
+    n = len(model.players)
+    pairs = [(rnd.randrange(n), rnd.randrange(n)) for _ in range(SWAP_PAIRS)]
+
+    def swaps(_):
+        rows = model.players
+        for a, b in pairs:
+            swap_players_safe(rows[a], rows[b], IMMUTABLE_KEYS)
+
+    results[f"swap_players_safe[x{SWAP_PAIRS}]"] = _time(swaps, repeat)
+    # model path, one pair at a time vs one batch (N-for-N trades: one undo entry, indexes updated
+    # once). Both run the same per-cell loop, which journals every changed cell; that journaling,
+    # not the per-call overhead the batch saves, is what separates them from swap_players_safe.
+    results[f"swap_players[x{SWAP_PAIRS}]"] = _time(lambda _: [model.swap_players(a, b) for a, b in pairs], repeat)
+    results[f"swap_players_many[x{SWAP_PAIRS}]"] = _time(lambda _: model.swap_players_many(pairs), repeat)
+
+    def rosters(_):
+        players = model.players
+        for tid in TEAM_NAMES:
+            sorted(model.players_for_team(tid), key=lambda i: roster_sort_key(players[i]))
+
+    results[f"roster_sort[x{len(TEAM_NAMES)} teams]"] = _time(rosters, repeat)
+    results[f"roster_cached[x{len(TEAM_NAMES)} teams]"] = _time(lambda _: [model.roster(t) for t in TEAM_NAMES], repeat)
+    results["pick_sort[row keys]"] = _time(lambda _: sorted(model.picks, key=pick_sort_key), repeat)
+    model.sorted_picks()  # builds the pick index once, like the first Draft Picks refresh
+    results["pick_sort[pick index]"] = _time(lambda _: model.sorted_picks(), repeat)
+
+    engine = EditEngine(model)
+    teams = [t for t in TEAM_NAMES if int(t) <= 32]
+    moves = [(rnd.randrange(len(model.picks)), rnd.choice(teams)) for _ in range(SWAP_PAIRS)] if model.picks else []
+
+    def pick_moves(_):
+        for idx, tid in moves:
+            engine.move_pick(idx, tid)
+            model.pick_position(idx)
+
+    results[f"pick_move[x{len(moves)}]"] = _time(pick_moves, repeat)
+    return results
+
+def print_results(results):
+    print(f"{'benchmark':<32}{'best ms':>12}{'mean ms':>12}")
+    for name, r in results.items():
+        print(f"{name:<32}{r['best_s'] * 1000:>12.2f}{r['mean_s'] * 1000:>12.2f}")
+
+def write_json(path, results, config):
+    doc = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": config,
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+
+def bench_reader(path, n_rows, repeat):
+    print(f"{'reader':<12}{'storage':<10}{'best s':>10}{'rows/s':>14}")
+    for fast in (False, True):
+        for columnar in (False, True):
+            best = None
+            for _ in range(repeat):
+                m = CSVModel(columnar=columnar)
+                m.fast_reader = fast
+                t0 = time.perf_counter()
+                m.load_csv(path)
+                dt = time.perf_counter() - t0
+                best = dt if best is None else min(best, dt)
+            name = "positional" if fast else "DictReader"
+            print(f"{name:<12}{'columnar' if columnar else 'dict':<10}{best:>10.3f}{n_rows / best:>14,.0f}")
+
+def import_time_ms(module="guiHC09"):
+    """
+    Cumulative import time of `module` in a fresh interpreter (python -X importtime),
+    and whether that import pulled in tkinter.
+    """
+    code = f"import sys, {module}; print('tkinter' in sys.modules)"
+    here = os.path.dirname(os.path.abspath(__file__))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=here, capture_output=True, text=True, check=True)
+    for line in proc.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000.0, proc.stdout.strip() == "True"
+    raise RuntimeError(f"no importtime line for {module}")
+
+def check_import_budget(budget_ms=IMPORT_BUDGET_MS, repeat=5):
+    """Best of `repeat` fresh imports; returns True if tkinter stays unloaded and the budget holds."""
+    runs = [import_time_ms() for _ in range(repeat)]
+    best = min(ms for ms, _ in runs)
+    uses_tk = any(tk for _, tk in runs)
+    print(f"import guiHC09: best {best:.1f} ms of {repeat} (budget {budget_ms} ms), "
+          f"tkinter {'LOADED' if uses_tk else 'not loaded'}")
+    return best <= budget_ms and not uses_tk
+
+def _csv_lines(path):
+    with open(path, "rb") as f:
+        return f.read().split(b"\r\n")
+
+def check_roundtrip():
+    """
+    Save round trip on a small export (coch.csv + play.csv): a coach with blank CSPC..CHEM gets the
+    "1" defaults the editor shows; they alone must not make coch.csv unsaved, but must be written
+    once another coach is edited and the table saved. Then a patch made after the undo journal
+    was trimmed must replay every edit (players, coaches, trainers, picks) onto a fresh load, and
+    the Draft Picks tab's in-place update must keep the model's order over package trades.
+    Returns True if every check passes.
+    """
+    checks = []
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {"players": write_play_csv(os.path.join(tmp, "play.csv"), 5, 40)}
+        paths["coaches"] = _write_csv(os.path.join(tmp, "coch.csv"),
+                                      ["TGID", "CFNM", "CLNM", "SKPT", "CSPC", "SKPC", "SKPA", "SKPF", "CHEM"],
+                                      [["1", "A", "B", "100", "", "", "", "", ""],
+                                       ["2", "C", "D", "200", "3", "3", "3", "3", "3"]])
+
+        for edit in (False, True):
+            m = CSVModel(columnar=True)
+            m.load_all(paths["players"], coach_path=paths["coaches"])
+            if edit:
+                EditEngine(m).set_skpt("coaches", 1, 5)
+            saved = {t: m.save_table(t) for t in m.dirty_tables()}
+            if not edit:
+                checks.append(("load defaults alone leave coch.csv clean and unsaved", "coaches" not in saved))
+                continue
+            lines = _csv_lines(saved["coaches"]) if "coaches" in saved else []
+            checks.append(("blank coach defaults saved with another coach's edit",
+                           len(lines) > 1 and lines[1] == b"1,A,B,100,1,1,1,1,1"))
+            checks.append(("edited coach row written", len(lines) > 2 and lines[2] == b"2,C,D,5,3,3,3,3,3"))
+            checks.append(("play.csv not saved for a coach-only edit", "players" not in saved))
+            for out in saved.values():
+                os.remove(out)
+        outs, _ = run_edit_script([{"op": "raw", "player": 0, "col": AGE_COL, "value": "30"}], paths)
+        checks.append(("players-only script leaves coch.csv unwritten",
+                       [os.path.basename(o) for o in outs] == ["play_modified.csv"]))
+        for out in outs:
+            os.remove(out)
+
+        # patch replay: edits (incl. coaches sharing a team) exported after the undo journal was
+        # trimmed must reproduce the edited tables on a fresh load of the same export
+        paths = write_export(tmp, 300, 60, n_staff=96)
+        edited = _load_all(paths, columnar=True)
+        edited.journal.max_cells = 50  # force _trim to drop the oldest undo entries
+        engine = EditEngine(edited)
+        engine.set_name(0, "Zed", "Patchcheck")
+        engine.bulk_stat("PSPD", "add", 3, engine.filter_players(team="1"), "both")
+        engine.set_skpt("coaches", 5, 4242)
+        engine.set_staff_value("coaches", 7, "CHEM", 6)
+        engine.set_skpt("trainers", 3, 77)
+        engine.move_pick(0, "14")
+        patch = engine.make_patch()
+        fresh = _load_all(paths, columnar=True)
+        report = EditEngine(fresh).apply_patch(patch)
+        same = all(fresh.column_values(t, h) == edited.column_values(t, h)
+                   for t, (headers_attr, _) in TABLES.items() for h in getattr(edited, headers_attr))
+        checks.append(("patch survives journal trim and replays every table", same))
+        checks.append(("patch replay has no unmatched / ambiguous rows",
+                       not report["unmatched"] and not report["ambiguous"]))
+
+        # Draft Picks tab after package trades: replay App._update_pick_items (detach every moved
+        # item, then move each to model.pick_positions) on a list standing in for the Treeview
+        model = _load_all(paths)
+        engine = EditEngine(model)
+        tree = model.sorted_picks()
+        rnd = random.Random(7)
+        teams = sorted(TEAM_NAMES, key=int)
+        in_order = True
+        for _ in range(200):
+            a, b = rnd.sample(teams, 2)
+            a_picks, b_picks = model.team_picks(a), model.team_picks(b)
+            moved = engine.trade_picks(a, b, rnd.sample(a_picks, min(3, len(a_picks))),
+                                       rnd.sample(b_picks, min(2, len(b_picks))))
+            gone = set(moved)
+            tree = [i for i in tree if i not in gone]
+            for pos, idx in model.pick_positions(moved):
+                tree.insert(pos, idx)
+            in_order = in_order and tree == model.sorted_picks()
+        checks.append(("pick tree order matches the model after package trades", in_order))
+
+    for name, ok in checks:
+        print(f"{'ok  ' if ok else 'FAIL'} {name}")
+    return all(ok for _, ok in checks)
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark the HC09 CSV editor on a synthetic export.")
+    ap.add_argument("--rows", type=int, default=3000, help="players in play.csv")
+    ap.add_argument("--cols", type=int, default=300, help="columns in play.csv")
+    ap.add_argument("--pick-years", type=int, default=3, help=f"draft years in drpk.csv ({ROUNDS} rounds x 32 teams each)")
+    ap.add_argument("--staff", type=int, default=200, help="rows in trvw.csv / coch.csv / gmvw.csv")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", default="", help="write the results to this file")
+    ap.add_argument("--readers", action="store_true", help="compare the play.csv readers and exit")
+    ap.add_argument("--import-check", action="store_true", help="check the import-time budget and exit")
+    ap.add_argument("--roundtrip-check", action="store_true", help="check load/edit/save round trips and exit")
+    ap.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    args = ap.parse_args()
+
+    if args.import_check:
+        sys.exit(0 if check_import_budget(args.budget_ms) else 1)
+    if args.roundtrip_check:
+        sys.exit(0 if check_roundtrip() else 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.readers:
+            path = write_play_csv(os.path.join(tmp, "play.csv"), args.rows, args.cols, args.seed)
+            print(f"play.csv: {args.rows:,} rows x {args.cols} columns ({os.path.getsize(path) / 1e6:.1f} MB)")
+            bench_reader(path, args.rows, args.repeat)
+            return
+
+        paths = write_export(tmp, args.rows, args.cols, args.pick_years, args.staff, args.seed)
+        print(f"play.csv: {args.rows:,} rows x {args.cols} columns ({os.path.getsize(paths['players']) / 1e6:.1f} MB), "
+              f"drpk.csv: {args.pick_years * ROUNDS * 32:,} picks, staff: {args.staff:,} rows each")
+        results = run_suite(paths, args.repeat, args.seed)
+        print_results(results)
+        if args.json:
+            config = {k: getattr(args, k) for k in ("rows", "cols", "pick_years", "staff", "repeat", "seed")}
+            write_json(args.json, results, config)
+            print(f"results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2599 @@
+"""
+HC09 CSV Editor - core: constants, utilities, CSVModel, EditEngine and the headless CLI.
+Imports no tkinter, so scripts and display-less servers can use it directly
+(guiHC09.py re-exports everything here).
+"""
+
+import csv
+import functools
+import hashlib
+import heapq
+import io
+import json
+import marshal
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from operator import itemgetter
+
+# -----------------------------
+# CONSTANTS / METADATA
+# -----------------------------
+TEAM_NAMES = {
+    "1": "Bears (Chicago)", "2": "Bengals (Cincinnati)", "3": "Bills (Buffalo)", "4": "Broncos (Denver)",
+    "5": "Browns (Cleveland)", "6": "Buccaneers (Tampa Bay)", "7": "Cardinals (Arizona)", "8": "Chargers (Los Angeles)",
+    "9": "Chiefs (Kansas City)", "10": "Colts (Indianapolis)", "11": "Cowboys (Dallas)", "12": "Dolphins (Miami)",
+    "13": "Eagles (Philadelphia)", "14": "Falcons (Atlanta)", "15": "49ers (San Francisco)", "16": "Giants (New York)",
+    "17": "Jaguars (Jacksonville)", "18": "Jets (New York)", "19": "Lions (Detroit)", "20": "Packers (Green Bay)",
+    "21": "Panthers (Carolina)", "22": "Patriots (New England)", "23": "Raiders (Las Vegas)", "24": "Rams (Los Angeles)",
+    "25": "Ravens (Baltimore)", "26": "Commanders (Washington)", "27": "Saints (New Orleans)", "28": "Seahawks (Seattle)",
+    "29": "Steelers (Pittsburgh)", "30": "Titans (Tennessee)", "31": "Vikings (Minnesota)", "32": "Texans (Houston)",
+    "33": "Free Agents", "1015": "Draft Class"
+}
+
+PLAYER_FIRST_NAME_CODE = "PFNA"
+PLAYER_LAST_NAME_CODE = "PLNA"
+PLAYER_POS_CODE = "PPOS"
+PREFERRED_TEAM_COLS = ["TID", "TEAM", "TMID", "TGID"]  # TGID last as fallback
+
+DRAFT_PICK_ID = "DPID"
+DRAFT_PICK_NUM = "DPNM"
+DRAFT_PICK_YEAR = "DPYO"
+
+SALARY_CAP_KEY = "SCAD"
+PLAYER_CONTRACT_MAX_VALUE = 4_294_967_295
+SALARY_CAP_MAX_VALUE = 4_294_967_295  # 0xFFFFFFFF
+AGE_COL = "PAGE"
+YEARS_COL = "PYRP"
+AGE_MAX_VALUE = 99
+YEARS_MAX_VALUE = 30
+
+# Bulk stat editor operations (EditEngine.bulk_stat)
+BULK_STAT_OPS = ("set", "add", "scale")
+BULK_STAT_TARGETS = ("cur", "max", "both")
+
+# Staff (trainer / coach / GM) numeric columns: column -> (min, max)
+SKPT_MAX_VALUE = 131071
+STAFF_NUMERIC_RANGES = {
+    "SKPT": (0, SKPT_MAX_VALUE),
+    "CSPC": (1, 7), "SKPC": (1, 7), "SKPA": (1, 7), "SKPF": (1, 7), "CHEM": (1, 7),
+}
+
+POSITIONS = {
+    "0": "QB", "1": "HB", "2": "FB", "3": "WR", "4": "TE",
+    "5": "LT", "6": "LG", "7": "C", "8": "RG", "9": "RT",
+    "10": "LE", "11": "RE", "12": "DT", "13": "LOLB", "14": "MLB",
+    "15": "ROLB", "16": "CB", "17": "FS", "18": "SS", "19": "K", "20": "P"
+}
+
+# Position display order (QB, HB, FB, WR, TE, OL, DL, LB, CB, FS, SS, K, P)
+POSITION_ORDER = {
+    "0": 0,    # QB
+    "1": 1,    # HB
+    "2": 2,    # FB
+    "3": 3,    # WR
+    "4": 4,    # TE
+    "5": 5,    # LT
+    "6": 6,    # LG
+    "7": 7,    # C
+    "8": 8,    # RG
+    "9": 9,    # RT
+    "10": 10,  # LE
+    "12": 11,  # DT
+    "11": 12,  # RE
+    "13": 13,  # LOLB
+    "14": 14,  # MLB
+    "15": 15,  # ROLB
+    "16": 16,  # CB
+    "17": 17,  # FS
+    "18": 18,  # SS
+    "19": 19,  # K
+    "20": 20,  # P
+}
+# Columns behind roster_sort_key: editing one of these (or the team column) repositions the row
+ROSTER_SORT_COLUMNS = (PLAYER_POS_CODE, PLAYER_FIRST_NAME_CODE, PLAYER_LAST_NAME_CODE)
+
+STAT_MAX_VALUE = 99
+
+# Background loading: progress is reported (and cancel checked) every LOAD_CHUNK_ROWS rows;
+# the UI polls the loader thread every LOAD_POLL_MS milliseconds.
+LOAD_CHUNK_ROWS = 500
+LOAD_POLL_MS = 50
+
+# CSVModel.load_all modes: the six CSVs are independent, so they can be parsed concurrently.
+LOAD_SEQUENTIAL = "sequential"
+LOAD_THREADS = "threads"      # keeps progress / cancel reporting
+LOAD_PROCESSES = "processes"  # true parallel parsing; progress is reported per finished file
+
+# Undo/redo journal: oldest entries are dropped once this many cell deltas are held
+JOURNAL_MAX_CELLS = 200_000
+
+# Patch files (EditEngine.make_patch / apply_patch): rows are matched by these identity columns
+# (picks by their original owner + number + year; row position when a table has none of them).
+# A trailing PATCH_ROW_KEY adds the row's occurrence number among rows with the same key values
+# (file order), for staff tables where a team can have several rows.
+PATCH_FORMAT = "hc09-patch"
+PATCH_VERSION = 2  # 2: staff keys end in the occurrence number
+PATCH_ROW_KEY = "#"  # key column name used for positional (row index) keys
+PATCH_KEYS = {
+    "players": ("PGID",),
+    "picks": ("DPID", "DPNM", "DPYO"),
+    "salaries": (),
+    "trainers": ("TGID", PATCH_ROW_KEY),
+    "coaches": ("TGID", "CFNM", "CLNM", PATCH_ROW_KEY),
+    "gms": ("TGID", PATCH_ROW_KEY),
+}
+
+# Edit scripts (EditEngine.apply): op -> (player keys, each given as a row index or as <key>_pgid,
+# other required keys). Optional keys in EDIT_OP_LISTS must be JSON lists when present.
+EDIT_OPS = {
+    "name": (("player",), ()),
+    "stat": (("player",), ("stat",)),
+    "age": (("player",), ()),
+    "bulk_stat": ((), ("stat", "mode", "value")),
+    "contract": (("player",), ()),
+    "raw": (("player",), ("col", "value")),
+    "swap": (("a", "b"), ()),
+    "swap_many": ((), ("pairs",)),
+    "pick": ((), ("row", "to")),
+    "pick_trade": ((), ("a", "b")),
+    "skpt": ((), ("table", "row", "value")),
+    "staff": ((), ("table", "row", "col", "value")),
+    "cap": ((), ("value",)),
+}
+EDIT_OP_LISTS = ("positions", "a_picks", "b_picks")
+
+# Name search indexes (NameIndex) kept by CSVModel: table -> (first name column, last name column)
+NAME_INDEX_COLUMNS = {
+    "players": (PLAYER_FIRST_NAME_CODE, PLAYER_LAST_NAME_CODE),
+    "coaches": ("CFNM", "CLNM"),
+}
+FUZZY_MIN_RATIO = 0.75  # NameIndex.find: similarity (difflib ratio) a close spelling needs
+
+# Opt-in hot-path timing (Profiler): off unless HC09_PROFILE is set (non-empty, not "0") or
+# the CLI gets --profile-out; while off nothing is wrapped, so the timed methods cost nothing extra
+PROFILE_ENV = "HC09_PROFILE"
+PROFILE_WINDOW = 1000  # most recent samples kept per timed method (p50 / p95 are over these)
+PROFILE_MODEL_METHODS = ("load_all", "save_csv", "save_table")  # save_table is the GUI's save path
+
+# Loaded tables: model attribute -> (headers attribute, path attribute)
+TABLES = {
+    "players": ("player_headers", "play_path"),
+    "picks": ("pick_headers", "drpk_path"),
+    "salaries": ("salary_headers", "slri_path"),
+    "trainers": ("trainer_headers", "trainer_path"),
+    "coaches": ("coach_headers", "coach_path"),
+    "gms": ("gm_headers", "gm_path"),
+}
+
+# -----------------------------
+# Stat descriptions (only these appear in the Stat Editor)
+# -----------------------------
+STAT_META = {
+    "PSPD": ("Speed", "Top-end running speed"),
+    "PAGI": ("Agility", "Change of direction / lateral movement"),
+    "PACC": ("Acceleration", "Burst to top speed"),
+    "PSTR": ("Strength", "Power of player (blocking/tackling)"),
+    "PAWR": ("Awareness", "Football IQ and reaction time"),
+    "PSTA": ("Stamina", "Fatigue resistance"),
+    "PINJ": ("Injury", "Durability / injury resistance"),
+    "PLTR": ("Trucking", "Run through tackles / power after contact"),
+    "PTGH": ("Toughness", "Plays through hits / durability vs big contact"),
+    "PELU": ("Elusiveness", "Jukes and evasive moves"),
+    "PBCV": ("Vision", "Ball carrier vision / cutbacks"),
+    "PLSA": ("Stiff Arm", "Stiff-arm effectiveness"),
+    "PLSM": ("Spin Move", "Spin move success"),
+    "PLJM": ("Juke Move", "Juke effectiveness"),
+    "PCAR": ("Carrying", "Ball security"),
+    "PTHP": ("Throw Power", "QB arm strength"),
+    "PTHA": ("Throw Accuracy", "Overall QB accuracy"),
+    "PCTH": ("Catching", "Catch reliability"),
+    "PLSC": ("Spectacular Catch", "Aggressive catches"),
+    "PLCI": ("Catch In Traffic", "Catches through contact"),
+    "PLRR": ("Route Running", "Route precision"),
+    "PLRL": ("Release", "Beating press coverage"),
+    "PJMP": ("Jump", "Vertical leap"),
+    "PPBK": ("Pass Block", "Pass protection"),
+    "PPBS": ("Pass Block Power", "Anchor vs power rush"),
+    "PPBF": ("Pass Block Finesse", "Mirror finesse rush"),
+    "PRBK": ("Run Block", "Run blocking"),
+    "PRBS": ("Run Block Strength", "Run blocking strength / anchor"),
+    "PLIB": ("Impact Blocking", "Dominant run-game blocks"),
+    "PTAK": ("Tackling", "Tackle success"),
+    "PLHT": ("Hit Power", "Big hit strength"),
+    "PRBF": ("Pass Rush Finesse", "Speed/finesse rush"),
+    "PLPm": ("Power Move", "DL power pass rush move"),
+    "PFMS": ("Finesse Move", "DL finesse pass rush move"),
+    "PBSG": ("Block Shed", "Shedding blockers"),
+    "PLPU": ("Pursuit", "Closing speed & angles"),
+    "PLPR": ("Play Recognition", "Reads plays faster"),
+    "PLMC": ("Man Coverage", "Man-to-man coverage"),
+    "PLZC": ("Zone Coverage", "Zone awareness"),
+    "PLPE": ("Press", "Jam WRs at line"),
+    "PKPR": ("Kick Power", "Kicker leg strength"),
+    "PKAC": ("Kick Accuracy", "FG accuracy"),
+    "PKRT": ("Kick Return", "Return ability"),
+    "PLRN": ("Learning", "Development speed"),
+}
+
+# -----------------------------
+# HARD-CODED MAX columns (matches YOUR header dump)
+# Case-sensitive.
+# -----------------------------
+PLAYER_MAX_HARDCODED = {
+    "PSPD": "PSDX",
+    "PAGI": "PAGX",
+    "PACC": "PACX",
+    "PSTR": "PSTX",
+    "PAWR": "PAWX",
+    "PSTA": "PSAX",
+    "PINJ": "PINX",
+    "PLTR": "PLTX",
+    "PTGH": "PTGX",
+    "PELU": "PELX",
+    "PBCV": "PBCX",
+    "PLSA": "PLSX",
+    "PLSM": "PSMx",   # lowercase x in your file
+    "PLJM": "PLJX",
+    "PCAR": "PCAX",
+    "PTHP": "PTPX",
+    "PTHA": "PTAX",
+    "PCTH": "PCTX",
+    "PLSC": "PSCX",
+    "PLCI": "PLCX",
+    "PLRR": "PRRX",
+    "PLRL": "PRLX",
+    "PJMP": "PJMX",
+    "PPBK": "PPBX",
+    "PPBS": "PPSX",
+    "PPBF": "PPFX",
+    "PRBK": "PRBX",
+    "PRBS": "PRSX",
+    "PLIB": "PIBX",
+    "PTAK": "PTKX",
+    "PLHT": "PLHX",
+    "PRBF": "PRFX",
+    "PLPm": "PPMX",
+    "PFMS": "PFMX",
+    "PBSG": "PBSX",
+    "PLPU": "PPUX",
+    "PLPR": "PPRX",
+    "PLMC": "PLMX",
+    "PLZC": "PLZX",
+    "PLPE": "PPEX",
+    "PKPR": "PKPX",
+    "PKAC": "PKAX",
+    "PKRT": "PKRX",
+    "PLRN": "PLRX",
+}
+
+# -----------------------------
+# HC09-safe trade: do NOT swap these keys
+# Add more here if you discover crashy fields in your file.
+# -----------------------------
+IMMUTABLE_KEYS = {
+    "TGID",  # team ownership in your export
+    "PGID",  # player global ID
+    "POID",  # often a portrait / appearance / internal reference
+}
+
+# -----------------------------
+# Utilities
+# -----------------------------
+def _norm_key(s: str) -> str:
+    """Keep case EXACT. Only remove invisible junk that breaks exact matches."""
+    if s is None:
+        return s
+    return (
+        s.replace("\ufeff", "")
+         .replace("\xa0", " ")
+         .replace("\r", "")
+         .replace("\n", "")
+         .replace("\t", " ")
+         .strip()
+    )
+
+class LoadCancelled(Exception):
+    """Raised inside CSVModel.load_csv / load_all when the cancel event is set."""
+
+class EditError(ValueError):
+    """Raised by EditEngine for an edit that cannot be applied (bad value, unknown row/column)."""
+
+def clamp_stat(v: int) -> int:
+    return max(0, min(STAT_MAX_VALUE, v))
+
+def parse_int(raw):
+    """Integer only; raises EditError otherwise (ratings, ages and the like never take "90.5")."""
+    try:
+        return int(str(raw).strip())
+    except ValueError:
+        raise EditError(f"Invalid integer: {raw!r}") from None
+
+def parse_int_lenient(raw):
+    """Integer or float truncated to int (e.g. "131071.0"), as the SKPT / cap / contract fields always took."""
+    try:
+        return parse_int(raw)
+    except EditError:
+        try:
+            return int(float(str(raw).strip()))
+        except (ValueError, OverflowError):
+            raise EditError(f"Invalid number: {raw!r}") from None
+
+def safe_int(s):
+    try:
+        if s is None:
+            return None
+        s = str(s).strip()
+        if s == "":
+            return None
+        return int(s)
+    except Exception:
+        return None
+
+def detect_team_col_case_sensitive(headers):
+    hs = set(headers or [])
+    for c in PREFERRED_TEAM_COLS:
+        if c in hs:
+            return c
+    return None
+
+def build_player_max_map(headers):
+    """Use ONLY hard-coded mapping that exists in THIS file's headers."""
+    hs = set(headers or [])
+    out = {}
+    for base, mx in PLAYER_MAX_HARDCODED.items():
+        if base in STAT_META and mx in hs:
+            out[base] = mx
+    return out
+
+def detect_contract_columns(headers):
+    """Best-effort detection for player salary/bonus columns in play.csv."""
+    headers = headers or []
+
+    def pick_column(exact_candidates, contains_candidates):
+        upper_map = {h.upper(): h for h in headers}
+        for candidate in exact_candidates:
+            hit = upper_map.get(candidate.upper())
+            if hit:
+                return hit
+        for h in headers:
+            hu = h.upper()
+            if any(token in hu for token in contains_candidates):
+                return h
+        return ""
+
+    salary_col = pick_column(
+        ["PSAL", "SALARY", "SALR", "SALA", "SALY", "CSAL"],
+        ["SAL"]
+    )
+    bonus_col = pick_column(
+        ["PBON", "BONUS", "BONU", "BONS", "PBON"],
+        ["BON"]
+    )
+    return salary_col, bonus_col
+
+def sanitize_name(raw: str, max_len: int = 15) -> str:
+    """
+    HC09 can crash on weird chars / long strings.
+    - Keep letters, space, apostrophe, hyphen, period
+    - Collapse spaces
+    - Trim length
+    """
+    if raw is None:
+        return ""
+    s = raw.strip()
+    s = re.sub(r"[^A-Za-z\.\'\-\s]", "", s)  # drop weird chars
+    s = re.sub(r"\s+", " ", s).strip()
+    if len(s) > max_len:
+        s = s[:max_len].strip()
+    return s
+
+def swap_players_safe(p1: dict, p2: dict, immutable_keys: set):
+    """
+    HC09-safe swap:
+    swap all values for keys that exist in BOTH dicts, except immutable keys.
+    """
+    # only swap keys shared by both rows
+    shared_keys = set(p1.keys()) & set(p2.keys())
+    for k in shared_keys:
+        if k in immutable_keys:
+            continue
+        p1[k], p2[k] = p2[k], p1[k]
+
+def roster_sort_key(row):
+    """Players tab roster order: position (POSITION_ORDER), then first name, then last name."""
+    return (
+        POSITION_ORDER.get((row.get(PLAYER_POS_CODE, "") or "").strip(), 999),
+        (row.get(PLAYER_FIRST_NAME_CODE, "") or "").strip(),
+        (row.get(PLAYER_LAST_NAME_CODE, "") or "").strip(),
+    )
+
+def _pick_order(year, num):
+    """(year offset, round, pick number) ordering of one pick; blanks sort last."""
+    return (
+        year if year is not None else 999,
+        num // 32 + 1 if num is not None else 999,
+        num if num is not None else 999,
+    )
+
+def pick_sort_key(row):
+    """Draft Picks tab order: owning team (DPID), then year offset (DPYO), round and pick number (DPNM)."""
+    tid = safe_int(row.get(DRAFT_PICK_ID, ""))
+    return (tid if tid is not None else 99999,) + _pick_order(
+        safe_int(row.get(DRAFT_PICK_YEAR, "")), safe_int(row.get(DRAFT_PICK_NUM, "")))
+
+# -----------------------------
+# Columnar storage
+# -----------------------------
+class _Missing:
+    """Cell never set for this row (key absent, like a dict without that key)."""
+    __slots__ = ()
+
+    def __reduce__(self):
+        return "_MISSING"  # pickle by reference, so tables survive a process-pool round trip
+
+    def __repr__(self):
+        return "<missing>"
+
+_MISSING = _Missing()
+
+class ColumnTable:
+    """
+    Column-oriented row store: one list per header plus a shared header -> slot schema.
+    Cell values are interned per table, so repeated values ("0", "99", team ids...) are
+    stored once. Indexing returns a RowView, so row.get(col) / row[col] = v keep working.
+    """
+    def __init__(self, headers=None):
+        self.headers = []   # list[str] in slot order
+        self.schema = {}    # header -> slot
+        self.columns = []   # list[list[str | None]]
+        self.extras = {}    # row idx -> list[str] (ragged rows, DictReader's restkey=None)
+        self._pool = {}     # value interning pool
+        self._n = 0
+        for h in headers or []:
+            self.add_column(h)
+
+    @classmethod
+    def from_columns(cls, headers, columns, n, extras=None):
+        """Wrap ready-made column lists (e.g. from a snapshot) without copying them."""
+        table = cls()
+        table.headers = list(headers)
+        table.schema = {h: i for i, h in enumerate(table.headers)}
+        table.columns = columns
+        table.extras = extras or {}
+        table._n = n
+        return table
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [RowView(self, i) for i in range(*idx.indices(self._n))]
+        if idx < 0:
+            idx += self._n
+        if not 0 <= idx < self._n:
+            raise IndexError("row index out of range")
+        return RowView(self, idx)
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield RowView(self, i)
+
+    def _intern(self, v):
+        if v.__class__ is str:
+            return self._pool.setdefault(v, v)
+        return v
+
+    def add_column(self, name, default=_MISSING):
+        if name in self.schema:
+            return self.schema[name]
+        slot = len(self.columns)
+        self.schema[name] = slot
+        self.headers.append(name)
+        self.columns.append([self._intern(default)] * self._n)
+        return slot
+
+    def append(self, mapping):
+        """Append one row given as a mapping (e.g. a DictReader row)."""
+        i = self._n
+        for k in mapping:
+            if k is not None and k not in self.schema:
+                self.add_column(k)
+        for h, col in zip(self.headers, self.columns):
+            col.append(self._intern(mapping.get(h, _MISSING)))
+        if mapping.get(None) is not None:
+            self.extras[i] = mapping[None]
+        self._n += 1
+
+    def append_values(self, values):
+        """
+        Append one row given positionally in slot order (csv.reader output).
+        Short rows are padded with None and surplus cells kept as extras, like DictReader.
+        """
+        cols = self.columns
+        width = len(cols)
+        if len(values) > width:
+            self.extras[self._n] = values[width:]
+        elif len(values) < width:
+            values = values + [None] * (width - len(values))
+        intern = self._pool.setdefault
+        for col, v in zip(cols, values):
+            col.append(intern(v, v))
+        self._n += 1
+
+    def column(self, name):
+        """Backing list for a whole column (read-only use; write through set())."""
+        return self.columns[self.schema[name]]
+
+    def get(self, idx, key, default=None):
+        if key is None:
+            return self.extras.get(idx, default)
+        slot = self.schema.get(key)
+        if slot is None:
+            return default
+        v = self.columns[slot][idx]
+        return default if v is _MISSING else v
+
+    def set(self, idx, key, value):
+        if key is None:
+            self.extras[idx] = value
+            return
+        slot = self.schema.get(key)
+        if slot is None:
+            slot = self.add_column(key)
+        self.columns[slot][idx] = self._intern(value)
+
+    def iter_values(self, headers):
+        """Yield each row as a list of cell values in `headers` order ("" for absent cells)."""
+        cols = [self.columns[self.schema[h]] if h in self.schema else None for h in headers]
+        for i in range(self._n):
+            out = []
+            for col in cols:
+                v = col[i] if col is not None else _MISSING
+                out.append("" if v is _MISSING or v is None else v)
+            if i in self.extras:
+                out.extend(self.extras[i])
+            yield out
+
+    def row_values(self, idx, headers):
+        """One row as a list of cell values in `headers` order (same rules as iter_values)."""
+        out = []
+        for h in headers:
+            v = self.get(idx, h)
+            out.append("" if v is None else v)
+        if idx in self.extras:
+            out.extend(self.extras[idx])
+        return out
+
+class RowView(MutableMapping):
+    """Dict-like view of one ColumnTable row."""
+    __slots__ = ("_table", "_idx")
+
+    def __init__(self, table, idx):
+        self._table = table
+        self._idx = idx
+
+    @property
+    def index(self):
+        return self._idx
+
+    def __getitem__(self, key):
+        v = self._table.get(self._idx, key, _MISSING)
+        if v is _MISSING:
+            raise KeyError(key)
+        return v
+
+    def get(self, key, default=None):
+        return self._table.get(self._idx, key, default)
+
+    def __setitem__(self, key, value):
+        self._table.set(self._idx, key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        if key is None:
+            del self._table.extras[self._idx]
+        else:
+            self._table.columns[self._table.schema[key]][self._idx] = _MISSING
+
+    def __contains__(self, key):
+        return self._table.get(self._idx, key, _MISSING) is not _MISSING
+
+    def __iter__(self):
+        t, i = self._table, self._idx
+        for h, col in zip(t.headers, t.columns):
+            if col[i] is not _MISSING:
+                yield h
+        if i in t.extras:
+            yield None
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"RowView({dict(self.items())!r})"
+
+# -----------------------------
+# Byte-level CSV source tracking (byte-preserving saves)
+# -----------------------------
+COPY_BLOCK_SIZE = 1 << 20  # bytes per read when copying unchanged rows
+BACKUP_SUFFIX = ".bak"     # in-place saves keep the previous file as <name>.csv.bak (one, rotating)
+
+# Binary snapshot cache: <name>.csv.hc09snap holds the parsed table (marshal; a value pool plus
+# one packed array of pool codes per column), valid while the CSV's size and mtime - or,
+# failing mtime, its content hash - still match.
+SNAPSHOT_SUFFIX = ".hc09snap"
+SNAPSHOT_MAGIC = "HC09SNAP"
+SNAPSHOT_VERSION = 1
+
+class CSVSource:
+    """
+    The file a table's rows currently match: identity (path/size/mtime), the parsed
+    headers and the byte offset where the header and each row end.
+    """
+    __slots__ = ("path", "size", "mtime_ns", "headers", "header_end", "row_ends", "newline")
+
+    def __init__(self, path, size, mtime_ns, headers=None):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.headers = headers or []
+        self.header_end = 0
+        self.row_ends = array("Q")   # row i spans [row_ends[i-1] (or header_end), row_ends[i])
+        self.newline = "\r\n"
+
+    def set_header_end(self, data, pos):
+        self.header_end = pos
+        head = data[:pos]
+        if head.endswith(b"\r\n"):
+            self.newline = "\r\n"
+        elif head.endswith(b"\n"):
+            self.newline = "\n"
+        elif head.endswith(b"\r"):
+            self.newline = "\r"
+
+    def matches(self, headers, n_rows):
+        """True if the file is unchanged on disk and still lines up with these headers/rows."""
+        if self.headers != list(headers) or len(self.row_ends) != n_rows:
+            return False
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        return st.st_size == self.size and st.st_mtime_ns == self.mtime_ns
+
+class _CSVFeed:
+    """Feeds csv.reader decoded lines from raw file bytes while tracking the byte offset consumed."""
+    def __init__(self, data):
+        self.data = data
+        self.total = len(data)
+        self.pos = 0
+
+    def lines(self):
+        # bytes.splitlines splits on \r\n, \n and \r only - the same lines a newline="" text file yields
+        for raw in self.data.splitlines(keepends=True):
+            text = raw.decode("utf-8-sig" if self.pos == 0 else "utf-8")
+            self.pos += len(raw)
+            yield text
+
+def _copy_range(src, dst, start, end):
+    src.seek(start)
+    left = end - start
+    while left > 0:
+        chunk = src.read(min(COPY_BLOCK_SIZE, left))
+        if not chunk:
+            raise OSError(f"{src.name} changed while saving")
+        dst.write(chunk)
+        left -= len(chunk)
+
+def _content_digest(data):
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+def _table_columns(rows, headers):
+    """(column headers, columns, extras) of a loaded table, for snapshots."""
+    if isinstance(rows, ColumnTable):
+        return rows.headers, rows.columns, rows.extras
+    col_headers = list(dict.fromkeys(headers))
+    columns = [[r.get(h) for r in rows] for h in col_headers]
+    extras = {i: r[None] for i, r in enumerate(rows) if r.get(None) is not None}
+    return col_headers, columns, extras
+
+def _encode_columns(columns):
+    """Dictionary-encode columns: (value pool, array typecode, packed codes, column-major)."""
+    pool = {}
+    codes = array("I")
+    for col in columns:
+        codes.extend([pool.setdefault(v, len(pool)) for v in col])
+    if len(pool) <= 0xFFFF:
+        codes = array("H", codes)
+    return list(pool), codes.typecode, codes.tobytes()
+
+def _decode_columns(values, typecode, packed, n_cols, n_rows):
+    codes = array(typecode)
+    codes.frombytes(packed)
+    get = values.__getitem__
+    return [list(map(get, codes[c * n_rows:(c + 1) * n_rows])) for c in range(n_cols)]
+
+def _fsync_dir(path):
+    """Flush a directory entry change (rename) to disk where the OS supports it."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _replace_with_backup(tmp, path):
+    """Atomically move tmp over path, keeping the previous file as path + BACKUP_SUFFIX."""
+    if os.path.exists(path):
+        shutil.copymode(path, tmp)  # mkstemp creates 0600 files
+        bak = path + BACKUP_SUFFIX
+        if os.path.exists(bak):
+            os.remove(bak)
+        try:
+            os.link(path, bak)  # no copy, and `path` never disappears
+        except OSError:
+            shutil.copy2(path, bak)
+    os.replace(tmp, path)
+    _fsync_dir(os.path.dirname(os.path.abspath(path)))
+
+def _row_values(rows, idx, headers):
+    """Cell values of rows[idx] in `headers` order for csv.writer (absent/None -> "", extras appended)."""
+    if isinstance(rows, ColumnTable):
+        return rows.row_values(idx, headers)
+    r = rows[idx]
+    out = [r.get(h, "") for h in headers]
+    extras = r.get(None)
+    if extras:
+        out.extend(extras)
+    return out
+
+# -----------------------------
+# Undo / redo journal
+# -----------------------------
+class EditJournal:
+    """
+    Undo/redo history of cell deltas (table, row, column, old, new); old/new is _MISSING for
+    an absent cell. Each entry is [label, deltas]; group() collects a multi-cell operation
+    (swap, bulk edit, ...) into one entry. Memory is bounded by max_cells deltas in total.
+    CSVModel records into it from set_cell/set_cells/swap_players and replays it in undo/redo.
+    `origins` keeps the old values of entries dropped by the size limit, so first_values() (and
+    with it EditEngine.make_patch) still sees the value every cell had before its first edit.
+    """
+    def __init__(self, max_cells=JOURNAL_MAX_CELLS):
+        self.max_cells = max_cells
+        self.undo_stack = []
+        self.redo_stack = []
+        self._cells = 0          # deltas held in both stacks
+        self.origins = {}        # (table, idx, col) -> old value from the oldest trimmed entry
+        self._group = None       # entry being collected by group()
+        self._depth = 0
+        self._paused = 0
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self._cells = 0
+        self.origins.clear()
+
+    def record(self, table, idx, col, old, new):
+        if self._paused:
+            return
+        if self._group is not None:
+            self._group[1].append((table, idx, col, old, new))
+            return
+        self._push([f"{table} row {idx}: {col}", [(table, idx, col, old, new)]])
+
+    def record_many(self, label, deltas):
+        """Record a list of deltas at once (joins an open group, else becomes one entry)."""
+        if self._paused or not deltas:
+            return
+        if self._group is not None:
+            self._group[1].extend(deltas)
+            return
+        self._push([label, list(deltas)])
+
+    @contextmanager
+    def group(self, label):
+        """Record everything inside the block as one undo entry (nesting joins the outer group)."""
+        if self._depth == 0:
+            self._group = [label, []]
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                entry, self._group = self._group, None
+                if entry[1]:
+                    self._push(entry)
+
+    @contextmanager
+    def paused(self):
+        """Edits inside the block are not recorded (used while replaying undo/redo)."""
+        self._paused += 1
+        try:
+            yield
+        finally:
+            self._paused -= 1
+
+    def _push(self, entry):
+        # a new edit invalidates everything that could have been redone
+        for _, deltas in self.redo_stack:
+            self._cells -= len(deltas)
+        self.redo_stack.clear()
+        self.undo_stack.append(entry)
+        self._cells += len(entry[1])
+        self._trim()
+
+    def _trim(self):
+        # always keep the newest entry, even if it alone is over the limit
+        first = self.origins.setdefault  # oldest entry first, so the earliest old value wins
+        while self._cells > self.max_cells and len(self.undo_stack) > 1:
+            deltas = self.undo_stack.pop(0)[1]
+            self._cells -= len(deltas)
+            for table, idx, col, old, _ in deltas:
+                first((table, idx, col), old)
+
+    def first_values(self):
+        """(table, idx, col) -> value before the cell's first edit still on the undo stack or trimmed."""
+        first = {}
+        for _, deltas in reversed(self.undo_stack):
+            for table, idx, col, old, _ in reversed(deltas):
+                first[(table, idx, col)] = old
+        first.update(self.origins)
+        return first
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def undo_label(self):
+        return self.undo_stack[-1][0] if self.undo_stack else ""
+
+    def redo_label(self):
+        return self.redo_stack[-1][0] if self.redo_stack else ""
+
+# -----------------------------
+# Name search index
+# -----------------------------
+def _trigrams(s):
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+class NameIndex:
+    """
+    Substring search over a table's first/last name columns. Names are lowercased once and
+    every trigram maps to the rows containing it, so a query only verifies the rows sharing
+    all of its trigrams. 1-2 character queries are answered from a small cache filled on
+    first use. Matching follows the coach filter: "first last" must match both names,
+    anything else may match either name.
+    """
+    def __init__(self, first_col, last_col):
+        self.first_col = first_col
+        self.last_col = last_col
+        self.first = []   # lowercased first names by row
+        self.last = []    # lowercased last names by row
+        self._grams = {}  # trigram -> set of rows
+        self._short = {}  # 1-2 character term -> set of rows (lazy)
+
+    def build(self, first_values, last_values):
+        self.first = [(v or "").lower() for v in first_values]
+        self.last = [(v or "").lower() for v in last_values]
+        # names repeat a lot, so index each distinct name once
+        by_name = {}
+        for names in (self.first, self.last):
+            for i, s in enumerate(names):
+                rows = by_name.get(s)
+                if rows is None:
+                    by_name[s] = [i]
+                else:
+                    rows.append(i)
+        grams = {}
+        for s, rows in by_name.items():
+            for gram in _trigrams(s):
+                posting = grams.get(gram)
+                if posting is None:
+                    grams[gram] = set(rows)
+                else:
+                    posting.update(rows)
+        self._grams = grams
+        self._short = {}
+
+    def update(self, idx, first, last):
+        """Re-index one row after its names changed."""
+        first, last = (first or "").lower(), (last or "").lower()
+        old = _trigrams(self.first[idx]) | _trigrams(self.last[idx])
+        new = _trigrams(first) | _trigrams(last)
+        for gram in old - new:
+            rows = self._grams[gram]
+            rows.discard(idx)
+            if not rows:
+                del self._grams[gram]
+        for gram in new - old:
+            self._grams.setdefault(gram, set()).add(idx)
+        self.first[idx], self.last[idx] = first, last
+        for term, rows in self._short.items():
+            if term in first or term in last:
+                rows.add(idx)
+            else:
+                rows.discard(idx)
+
+    def _candidates(self, term):
+        if len(term) < 3:
+            rows = self._short.get(term)
+            if rows is None:
+                first, last = self.first, self.last
+                rows = self._short[term] = {i for i in range(len(first)) if term in first[i] or term in last[i]}
+            return rows
+        sets = [self._grams.get(term[i:i + 3]) for i in range(len(term) - 2)]
+        if any(s is None for s in sets):
+            return set()
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def search(self, query):
+        """Set of matching rows; None for an empty query (no filter)."""
+        q = (query or "").strip().lower()
+        if not q:
+            return None
+        first, last = self.first, self.last
+        parts = q.split()
+        if len(parts) == 2:
+            f, l = parts
+            cand = self._candidates(f) & self._candidates(l)
+            return {i for i in cand if f in first[i] and l in last[i]}
+        return {i for i in self._candidates(q) if q in first[i] or q in last[i]}
+
+    def find(self, query, limit=50):
+        """
+        Ranked rows for a search box: names starting with the query first (full name, first
+        or last; "first last" as two prefixes), then other substring matches, then - while
+        short of `limit` - close spellings (see _fuzzy).
+        """
+        q = (query or "").strip().lower()
+        if not q:
+            return []
+        first, last = self.first, self.last
+        parts = q.split()
+
+        def rank(i):
+            f, l = first[i], last[i]
+            if len(parts) == 2:
+                prefix = f.startswith(parts[0]) and l.startswith(parts[1])
+            else:
+                prefix = f.startswith(q) or l.startswith(q) or f"{f} {l}".startswith(q)
+            return (0 if prefix else 1, l, f, i)
+
+        hits = self.search(q)
+        out = [i for *_, i in heapq.nsmallest(limit, map(rank, hits))]
+        if len(out) < limit:
+            out += self._fuzzy(parts, hits, limit - len(out))
+        return out
+
+    def _fuzzy(self, parts, exclude, limit):
+        """
+        Close spellings: rows sharing a trigram (or the first two letters) with a query word,
+        scored by difflib ratio per distinct name; scores below FUZZY_MIN_RATIO are dropped.
+        """
+        from difflib import SequenceMatcher  # only needed once a query has no exact hits
+        words = [w for w in parts if len(w) >= 3]
+        if not words:
+            return []
+        cand = set()
+        for w in words:
+            cand |= self._candidates(w[:2])
+            for gram in _trigrams(w):
+                cand |= self._grams.get(gram, set())
+        cand -= exclude
+
+        ratios = {}  # (word, name) -> ratio; names repeat, so score each pair once
+
+        def ratio(word, name):
+            r = ratios.get((word, name))
+            if r is None:
+                sm = SequenceMatcher(None, word, name)
+                r = ratios[(word, name)] = sm.ratio() if sm.real_quick_ratio() >= FUZZY_MIN_RATIO else 0.0
+            return r
+
+        scored = []
+        for i in cand:
+            f, l = self.first[i], self.last[i]
+            if len(words) == 2:
+                score = (ratio(words[0], f) + ratio(words[1], l)) / 2
+            else:
+                w = " ".join(words)
+                score = max(ratio(w, f), ratio(w, l), ratio(w, f"{f} {l}"))
+            if score >= FUZZY_MIN_RATIO:
+                scored.append((-score, l, f, i))
+        return [i for *_, i in heapq.nsmallest(limit, scored)]
+
+# -----------------------------
+# Hot-path timing (opt-in)
+# -----------------------------
+class Profiler:
+    """
+    Rolling latency stats (count, p50, p95, max) per timed method. instrument() swaps a class's
+    methods for timing wrappers; nothing is wrapped unless profiling is enabled.
+    """
+    def __init__(self, window=PROFILE_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()  # load_all runs on a worker thread in the GUI
+        self._samples = {}  # name -> deque of the last `window` durations (seconds)
+        self._totals = {}  # name -> [count, max seconds] over the whole session
+
+    def record(self, name, secs):
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+                self._totals[name] = [0, 0.0]
+            samples.append(secs)
+            totals = self._totals[name]
+            totals[0] += 1
+            totals[1] = max(totals[1], secs)
+
+    def wrap(self, name, fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - t0)
+        timed._profiled = True
+        return timed
+
+    def instrument(self, cls, names):
+        """Time `cls.<name>` for each name (as "Class.name"); already wrapped methods are skipped."""
+        for name in names:
+            fn = getattr(cls, name, None)
+            if callable(fn) and not getattr(fn, "_profiled", False):
+                setattr(cls, name, self.wrap(f"{cls.__name__}.{name}", fn))
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+    def stats(self):
+        """One dict per timed method (times in ms), slowest p95 first."""
+        with self._lock:
+            items = [(name, sorted(s), self._totals[name]) for name, s in self._samples.items()]
+        out = []
+        for name, s, (count, worst) in items:
+            n = len(s)
+            out.append({
+                "name": name,
+                "count": count,
+                "p50_ms": s[min(n - 1, n // 2)] * 1000,
+                "p95_ms": s[min(n - 1, int(n * 0.95))] * 1000,
+                "max_ms": worst * 1000,
+            })
+        out.sort(key=lambda st: st["p95_ms"], reverse=True)
+        return out
+
+    def report(self):
+        lines = [f"{'method':<40}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+        for st in self.stats():
+            lines.append(f"{st['name']:<40}{st['count']:>8}{st['p50_ms']:>10.2f}{st['p95_ms']:>10.2f}{st['max_ms']:>10.2f}")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"window": self.window, "stats": self.stats()}, f, indent=2)
+
+_profiler = None
+
+def enable_profiling():
+    """Start timing the model hot paths (idempotent); returns the shared Profiler."""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+        _profiler.instrument(CSVModel, PROFILE_MODEL_METHODS)
+    return _profiler
+
+def get_profiler():
+    """The shared Profiler, or None while profiling is off (enabled on first call if HC09_PROFILE is set)."""
+    if _profiler is None and os.environ.get(PROFILE_ENV, "0") not in ("", "0"):
+        enable_profiling()
+    return _profiler
+
+# -----------------------------
+# CSV model
+# -----------------------------
+class CSVModel:
+    def __init__(self, columnar=False, snapshots=False):
+        # columnar=True stores each table as a ColumnTable instead of list[dict]
+        self.columnar = columnar
+        # snapshots=True reads/writes <name>.csv.hc09snap next to each CSV (see _load_table)
+        self.snapshots = snapshots
+        # fast_reader=False uses the original DictReader path (kept for comparison / benchmarks)
+        self.fast_reader = True
+
+        self.play_path = ""
+        self.drpk_path = ""
+        self.slri_path = ""
+        # Optional staff CSVs
+        self.trainer_path = ""
+        self.coach_path = ""
+        self.gm_path = ""
+
+        self.players = []          # list[dict] (or ColumnTable)
+        self.player_headers = []   # list[str]
+        self.picks = []            # list[dict] (or ColumnTable)
+        self.pick_headers = []     # list[str]
+        self.salaries = []         # list[dict] (or ColumnTable)
+        self.salary_headers = []   # list[str]
+
+        self.trainers = []         # list[dict] (or ColumnTable)
+        self.trainer_headers = []  # list[str]
+        self.coaches = []          # list[dict] (or ColumnTable)
+        self.coach_headers = []    # list[str]
+        self.gms = []              # list[dict] (or ColumnTable)
+        self.gm_headers = []       # list[str]
+
+        self.team_col = None
+        self.max_map = {}
+        self.load_timings = {}     # path -> (seconds, rows) from the last load_all
+        self.dirty = {}            # table -> set[int] of row indices edited since load/save
+        self.dirty_callback = None # called with no args whenever the set of dirty tables changes
+        self.defaulted = {}        # table -> set[int] of rows given default values at load (not edits)
+        self.sources = {}          # table -> CSVSource of the file its rows currently match
+        self._team_index = {}      # team id -> ascending list[int] of player row indices
+        self.journal = EditJournal()  # undo/redo history of every set_cell/set_cells/swap_players
+        self.name_index = {}       # table -> NameIndex over NAME_INDEX_COLUMNS (kept current by edits)
+        self._int_cache = {}       # (table, col) -> [int | None] per row, see int_column()
+        self._rosters = {}         # team id -> sorted [(roster_sort_key, idx)], built per team by roster()
+        self._roster_keys = {}     # player idx -> (team id, sort key) of its entry in a cached roster
+        self._pick_teams = None    # DPID (int, None = unparseable) -> sorted [(year, round, pick, idx)]
+        self._pick_slot = []       # pick idx -> (DPID, entry) it is filed under in _pick_teams
+        self._pick_years = None    # cached pick_year_display() over all picks
+
+    def load_csv(self, path, progress=None, cancel=None):
+        """
+        Parse one CSV into (rows, headers).
+        Rows are streamed in chunks of LOAD_CHUNK_ROWS: after each chunk
+        progress(path, rows_read, bytes_read, total_bytes) is called and, if the
+        `cancel` threading.Event is set, LoadCancelled is raised.
+        """
+        rows, headers, _ = self._load_table(path, progress, cancel)
+        return rows, headers
+
+    def _load_table(self, path, progress=None, cancel=None):
+        """load_csv() that also returns the CSVSource (row byte spans) used for byte-preserving saves."""
+        if not path or not os.path.isfile(path):
+            return [], [], None
+        st = os.stat(path)
+        data = digest = None
+        snap = self._read_snapshot(path) if self.snapshots else None
+        if snap is not None and snap[2] == st.st_size and snap[3] != st.st_mtime_ns:
+            # touched but maybe not changed: fall back to the content hash
+            with open(path, "rb") as f:
+                data = f.read()
+            digest = _content_digest(data)
+            if digest != snap[4]:
+                snap = None
+        elif snap is not None and snap[2] != st.st_size:
+            snap = None
+        if snap is not None:
+            rows, headers, source = self._from_snapshot(path, snap, st)
+            self._load_checkpoint(path, len(rows), st.st_size, st.st_size, progress, cancel)
+            return rows, headers, source
+
+        if data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+        source = CSVSource(path, len(data), st.st_mtime_ns)
+        feed = _CSVFeed(data)
+        if self.fast_reader:
+            rows, headers = self._read_positional(feed, path, progress, cancel, source)
+        else:
+            rows, headers = self._read_dictreader(feed, path, progress, cancel, source)
+        source.headers = list(headers)
+        self._load_checkpoint(path, len(rows), feed.total, feed.total, progress, cancel)
+        if self.snapshots:
+            self._write_snapshot(path, rows, headers, source, digest or _content_digest(data))
+        return rows, headers, source
+
+    # ---------- Binary snapshots ----------
+    def _read_snapshot(self, path):
+        """Parsed snapshot tuple for `path`, or None if missing / unreadable / another version."""
+        try:
+            with open(path + SNAPSHOT_SUFFIX, "rb") as f:
+                snap = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(snap, tuple) or len(snap) != 15 or snap[:2] != (SNAPSHOT_MAGIC, SNAPSHOT_VERSION):
+            return None
+        return snap
+
+    def _write_snapshot(self, path, rows, headers, source, digest):
+        col_headers, columns, extras = _table_columns(rows, headers)
+        values, typecode, packed = _encode_columns(columns)
+        snap = (SNAPSHOT_MAGIC, SNAPSHOT_VERSION, source.size, source.mtime_ns, digest,
+                list(headers), list(col_headers), len(rows), values, typecode, packed, extras,
+                source.header_end, source.row_ends.tobytes(), source.newline)
+        out = path + SNAPSHOT_SUFFIX
+        tmp = f"{out}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                marshal.dump(snap, f)
+            os.replace(tmp, out)
+        except (OSError, ValueError):
+            # the cache is best effort (read-only folder, unmarshallable value...)
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _from_snapshot(self, path, snap, st):
+        (_, _, size, _, _, headers, col_headers, n, values, typecode, packed, extras,
+         header_end, row_ends, newline) = snap
+        columns = _decode_columns(values, typecode, packed, len(col_headers), n)
+        if self.columnar:
+            rows = ColumnTable.from_columns(col_headers, columns, n, extras)
+        else:
+            rows = [dict(zip(col_headers, vals)) for vals in zip(*columns)] if columns else [{} for _ in range(n)]
+            for i, extra in extras.items():
+                rows[i][None] = extra
+        source = CSVSource(path, size, st.st_mtime_ns, list(headers))
+        source.header_end = header_end
+        source.row_ends.frombytes(row_ends)
+        source.newline = newline
+        return rows, headers, source
+
+    def _read_dictreader(self, feed, path, progress, cancel, source):
+        """Reference reader: csv.DictReader + _norm_key on every key of every row."""
+        reader = csv.DictReader(feed.lines())
+        raw_headers = reader.fieldnames or []
+        source.set_header_end(feed.data, feed.pos)
+        headers = [_norm_key(h) for h in raw_headers]
+        rows = ColumnTable(headers) if self.columnar else []
+        row_ends = source.row_ends
+        n = 0
+        for row in reader:
+            cleaned = {}
+            for k, v in row.items():
+                nk = _norm_key(k)
+                cleaned[nk] = v
+            rows.append(cleaned)
+            row_ends.append(feed.pos)
+            n += 1
+            if n % LOAD_CHUNK_ROWS == 0:
+                self._load_checkpoint(path, n, feed.pos, feed.total, progress, cancel)
+        return rows, headers
+
+    def _read_positional(self, feed, path, progress, cancel, source):
+        """
+        Fast reader: normalize the header row once, then build rows positionally from
+        csv.reader output. Ragged rows match DictReader: blank lines are skipped, short
+        rows are padded with None and surplus cells go under the None key.
+        """
+        reader = csv.reader(feed.lines())
+        headers = [_norm_key(h) for h in next(reader, [])]
+        source.set_header_end(feed.data, feed.pos)
+        width = len(headers)
+        if self.columnar:
+            rows = ColumnTable(headers)
+            # duplicate (normalized) headers share a slot, so positions no longer line up
+            positional = len(rows.headers) == width
+        else:
+            rows = []
+        row_ends = source.row_ends
+        n = 0
+        for values in reader:
+            if not values:
+                continue
+            if self.columnar and positional:
+                rows.append_values(values)
+            else:
+                row = dict(zip(headers, values))
+                if len(values) > width:
+                    row[None] = values[width:]
+                elif len(values) < width:
+                    for h in headers[len(values):]:
+                        row[h] = None
+                rows.append(row)
+            row_ends.append(feed.pos)
+            n += 1
+            if n % LOAD_CHUNK_ROWS == 0:
+                self._load_checkpoint(path, n, feed.pos, feed.total, progress, cancel)
+        return rows, headers
+
+    def _load_checkpoint(self, path, rows, bytes_read, total, progress, cancel):
+        if cancel is not None and cancel.is_set():
+            raise LoadCancelled(path)
+        if progress is not None:
+            progress(path, rows, bytes_read, total)
+
+    def save_csv(self, rows, headers, original_file, source=None, dirty_rows=None, in_place=False):
+        """
+        Write rows to a new <name>_modified[_N] file next to original_file and return its path.
+        in_place=True instead streams to a temp file in the same folder, fsyncs it and
+        atomically renames it over original_file (previous version kept as <name>.bak).
+        With a `source` (from load) and the set of `dirty_rows`, unchanged rows are copied
+        byte-for-byte from the source file; see _write_rows().
+        """
+        out, _ = self._save_rows(rows, headers, original_file, source, dirty_rows, in_place)
+        return out
+
+    def _save_rows(self, rows, headers, original_file, source=None, dirty_rows=None, in_place=False):
+        if not original_file:
+            raise ValueError("No original file path to save.")
+        if in_place:
+            folder, name = os.path.split(os.path.abspath(original_file))
+            fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=folder)
+            os.close(fd)
+            try:
+                written = self._write_rows(tmp, rows, headers, source, dirty_rows, fsync=True)
+                _replace_with_backup(tmp, original_file)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                raise
+            written.path = original_file
+            written.mtime_ns = os.stat(original_file).st_mtime_ns
+            return original_file, written
+        base, ext = os.path.splitext(original_file)
+        out = f"{base}_modified{ext}"
+        n = 1
+        while os.path.exists(out):
+            out = f"{base}_modified_{n}{ext}"
+            n += 1
+        return out, self._write_rows(out, rows, headers, source, dirty_rows)
+
+    def _write_rows(self, out, rows, headers, source=None, dirty_rows=None, fsync=False):
+        """
+        Write `rows` to `out` and return a CSVSource describing the written file.
+        If `source` still matches its file (same size/mtime, same headers and row count),
+        runs of clean rows are copied from it in large blocks and only `dirty_rows` are
+        re-serialized (in the source's line-ending style). Otherwise every row is written
+        like csv.DictWriter would (utf-8, CRLF).
+        """
+        n = len(rows)
+        reuse = source is not None and dirty_rows is not None and source.matches(headers, n)
+        newline = source.newline if reuse else "\r\n"
+        buf = io.StringIO()
+        w = csv.writer(buf, lineterminator=newline)
+
+        def encode(values):
+            buf.seek(0)
+            buf.truncate()
+            w.writerow(values)
+            return buf.getvalue().encode("utf-8")
+
+        written = CSVSource(out, 0, 0, list(headers))
+        written.newline = newline
+        row_ends = written.row_ends
+        pos = 0
+        with open(out, "wb") as dst:
+            if reuse:
+                old_ends = source.row_ends
+                with open(source.path, "rb") as src:
+                    _copy_range(src, dst, 0, source.header_end)
+                    pos = written.header_end = source.header_end
+                    i = 0
+                    for d in sorted(d for d in dirty_rows if 0 <= d < n) + [n]:
+                        if d > i:
+                            # clean run i..d-1: one block copy, spans shift by a constant
+                            start = old_ends[i - 1] if i else source.header_end
+                            end = old_ends[d - 1]
+                            _copy_range(src, dst, start, end)
+                            shift = pos - start
+                            row_ends.extend([e + shift for e in old_ends[i:d]])
+                            pos += end - start
+                        if d < n:
+                            b = encode(_row_values(rows, d, headers))
+                            dst.write(b)
+                            pos += len(b)
+                            row_ends.append(pos)
+                        i = d + 1
+                    # anything after the last row (trailing blank lines)
+                    tail = old_ends[n - 1] if n else source.header_end
+                    _copy_range(src, dst, tail, source.size)
+                    pos += source.size - tail
+            else:
+                b = encode(headers)
+                dst.write(b)
+                pos = written.header_end = len(b)
+                for i in range(n):
+                    b = encode(_row_values(rows, i, headers))
+                    dst.write(b)
+                    pos += len(b)
+                    row_ends.append(pos)
+            if fsync:
+                dst.flush()
+                os.fsync(dst.fileno())
+        written.size = pos
+        written.mtime_ns = os.stat(out).st_mtime_ns
+        return written
+
+    def _timed_load(self, path, progress=None, cancel=None):
+        t0 = time.perf_counter()
+        rows, headers, source = self._load_table(path, progress, cancel)
+        return rows, headers, source, time.perf_counter() - t0
+
+    def load_all(self, play_path, drpk_path="", slri_path="", trainer_path="", coach_path="", gm_path="",
+                 progress=None, cancel=None, mode=LOAD_SEQUENTIAL):
+        """
+        Load every table. `progress` / `cancel` are passed through to load_csv().
+        mode: LOAD_SEQUENTIAL, LOAD_THREADS or LOAD_PROCESSES (see constants).
+        Per-file parse times end up in self.load_timings.
+        """
+        self.play_path = play_path or ""
+        self.drpk_path = drpk_path or ""
+        self.slri_path = slri_path or ""
+        self.trainer_path = trainer_path or ""
+        self.coach_path = coach_path or ""
+        self.gm_path = gm_path or ""
+
+        jobs = {table: getattr(self, path_attr) for table, (_, path_attr) in TABLES.items()
+                if getattr(self, path_attr)}
+        results = {}
+        if mode == LOAD_SEQUENTIAL or len(jobs) < 2:
+            for table, path in jobs.items():
+                results[table] = self._timed_load(path, progress, cancel)
+        elif mode == LOAD_THREADS:
+            from concurrent.futures import ThreadPoolExecutor  # deferred: keeps `import hc09_core` fast
+            with ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="csv-load") as ex:
+                futures = {t: ex.submit(self._timed_load, p, progress, cancel) for t, p in jobs.items()}
+                results = {t: f.result() for t, f in futures.items()}
+        elif mode == LOAD_PROCESSES:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as ex:
+                futures = {t: ex.submit(_load_csv_job, p, self.columnar, self.fast_reader, self.snapshots)
+                           for t, p in jobs.items()}
+                for t, f in futures.items():
+                    results[t] = f.result()
+                    size = os.path.getsize(jobs[t])
+                    self._load_checkpoint(jobs[t], len(results[t][0]), size, size, progress, cancel)
+        else:
+            raise ValueError(f"Unknown load mode: {mode}")
+
+        self.load_timings = {}
+        self.dirty = {}
+        self.defaulted = {}
+        self.sources = {}
+        self._int_cache = {}
+        self._pick_teams = None
+        self.journal.clear()
+        for table, (headers_attr, _) in TABLES.items():
+            rows, headers, source, secs = results.get(table, ([], [], None, 0.0))
+            setattr(self, table, rows)
+            setattr(self, headers_attr, headers)
+            if source is not None:
+                self.sources[table] = source
+            if table in jobs:
+                self.load_timings[jobs[table]] = (secs, len(rows))
+
+        if not self.players:
+            raise ValueError("play.csv loaded 0 players/rows.")
+
+        self.team_col = detect_team_col_case_sensitive(self.player_headers)
+        self.max_map = build_player_max_map(self.player_headers)
+        self.build_team_index()
+        # Ensure coach extra fields exist in headers and set defaults
+        coach_extra = ["CSPC", "SKPC", "SKPA", "SKPF", "CHEM"]
+        if self.coach_headers is None:
+            self.coach_headers = []
+        for f in coach_extra:
+            if f not in self.coach_headers:
+                self.coach_headers.append(f)
+        # Ensure each coach row has defaults (1..7 range default 1). Not journaled and not dirty
+        # (they are not edits); save_table writes them out once coch.csv is saved for a real edit.
+        defaulted = set()
+        for i, r in enumerate(self.coaches):
+            for f in coach_extra:
+                if (r.get(f, "") or "").strip() == "":
+                    r[f] = "1"
+                    defaulted.add(i)
+        if defaulted:
+            self.defaulted["coaches"] = defaulted
+        self.build_name_indexes()
+
+    def load_timing_report(self):
+        """One line per file from the last load_all, slowest first (the first line is the critical path)."""
+        items = sorted(self.load_timings.items(), key=lambda kv: kv[1][0], reverse=True)
+        return [f"{os.path.basename(p)}: {secs:.3f}s ({rows:,} rows)" for p, (secs, rows) in items]
+
+    def player_name(self, row):
+        fn = (row.get(PLAYER_FIRST_NAME_CODE, "") or "").strip()
+        ln = (row.get(PLAYER_LAST_NAME_CODE, "") or "").strip()
+        nm = f"{fn} {ln}".strip()
+        return nm if nm else "(No Name)"
+
+    def player_pos(self, row):
+        code = (row.get(PLAYER_POS_CODE, "") or "").strip()
+        return POSITIONS.get(code, "UNK")
+
+    def player_team_id(self, row):
+        if not self.team_col:
+            return ""
+        return (row.get(self.team_col, "") or "").strip()
+
+    def set_player_team_id(self, idx, tid):
+        if not self.team_col:
+            return
+        self.set_cell("players", idx, self.team_col, str(tid))
+
+    # ---------- Edits ----------
+    def set_cell(self, table, idx, col, value):
+        """
+        Write one cell of a loaded table ("players", "picks", "coaches", ...).
+        All edits go through here so indexes and dirty tracking stay current.
+        """
+        row = getattr(self, table)[idx]
+        old = row[col] if col in row else _MISSING
+        if old == value:
+            return
+        is_team_col = table == "players" and col == self.team_col
+        if is_team_col:
+            old_tid = self.player_team_id(row)
+        if value is _MISSING:
+            del row[col]  # undo of a write that created the cell
+        else:
+            row[col] = value
+        if is_team_col:
+            self._reindex_player_team(idx, old_tid, self.player_team_id(row))
+        if table in self.name_index:
+            self._reindex_names(table, (idx,), col)
+        if self._int_cache:
+            self._update_int_cache(table, (idx,), col)
+        if table == "players" and self._rosters:
+            self._reposition_rosters((idx,), col)
+        elif table == "picks" and self._pick_teams is not None:
+            self._reposition_picks((idx,), col)
+        self.journal.record(table, idx, col, old, value)
+        self.mark_dirty(table, idx)
+
+    def set_cells(self, table, col, updates):
+        """
+        Batch form of set_cell() for one column: `updates` maps row index -> value.
+        Columnar tables are written straight into the column list. Returns the changed row indices.
+        """
+        rows = getattr(self, table)
+        changed = []
+        if (table == "players" and col == self.team_col) or not isinstance(rows, ColumnTable):
+            with self.journal.group(f"{table}: {col} x{len(updates)}"):
+                for idx, value in updates.items():
+                    row = rows[idx]
+                    if row.get(col) != value or col not in row:
+                        self.set_cell(table, idx, col, value)
+                        changed.append(idx)
+            return changed
+        slot = rows.schema.get(col)
+        if slot is None:
+            slot = rows.add_column(col)
+        data, intern = rows.columns[slot], rows._pool.setdefault
+        deltas = []
+        for idx, value in updates.items():
+            old = data[idx]
+            if old != value:  # _MISSING never equals a value
+                data[idx] = intern(value, value) if value.__class__ is str else value
+                deltas.append((table, idx, col, old, value))
+                changed.append(idx)
+        if table in self.name_index:
+            self._reindex_names(table, changed, col)
+        if self._int_cache:
+            self._update_int_cache(table, changed, col)
+        if table == "players" and self._rosters:
+            self._reposition_rosters(changed, col)
+        elif table == "picks" and self._pick_teams is not None:
+            self._reposition_picks(changed, col)
+        self.journal.record_many(f"{table}: {col} x{len(changed)}", deltas)
+        self.mark_dirty_rows(table, changed)
+        return changed
+
+    def column_values(self, table, col):
+        """One whole column as a list (read-only; "" for absent cells)."""
+        rows = getattr(self, table)
+        if isinstance(rows, ColumnTable):
+            if col not in rows.schema:
+                return [""] * len(rows)
+            return ["" if v is _MISSING or v is None else v for v in rows.column(col)]
+        return [r.get(col, "") or "" for r in rows]
+
+    def swap_players(self, idx1, idx2, immutable_keys=IMMUTABLE_KEYS):
+        """swap_players_safe() on two player rows by index, keeping the team index current."""
+        self.swap_players_many([(idx1, idx2)], immutable_keys, label=f"Swap players {idx1} <-> {idx2}")
+
+    def swappable_columns(self, immutable_keys=IMMUTABLE_KEYS):
+        """play.csv columns a safe swap exchanges: every header except immutable_keys."""
+        return [h for h in self.player_headers if h not in immutable_keys]
+
+    def swap_players_many(self, pairs, immutable_keys=IMMUTABLE_KEYS, label=None):
+        """
+        HC09-safe swap of several (idx1, idx2) pairs, in order, as one undo entry. The swappable
+        columns are worked out once (swappable_columns) rather than per pair; cells absent from
+        either row stay put, like swap_players_safe(). Indexes are updated once at the end.
+        """
+        rows = self.players
+        cols = self.swappable_columns(immutable_keys)
+        if isinstance(rows, ColumnTable):
+            data = [(c, rows.columns[rows.schema[c]]) for c in cols if c in rows.schema]
+        else:
+            # one C-level fetch of every swappable value per row instead of 4 lookups per column
+            get = itemgetter(*cols) if len(cols) > 1 else (lambda r: tuple(r[c] for c in cols))
+        touched = []
+        with self.journal.group(label or f"Swap {len(pairs)} player pairs"):
+            for idx1, idx2 in pairs:
+                p1, p2 = rows[idx1], rows[idx2]
+                t1, t2 = self.player_team_id(p1), self.player_team_id(p2)
+                deltas = []
+                if isinstance(rows, ColumnTable):
+                    for c, column in data:
+                        a, b = column[idx1], column[idx2]
+                        if a != b and a is not _MISSING and b is not _MISSING:
+                            column[idx1], column[idx2] = b, a
+                            deltas.append(("players", idx1, c, a, b))
+                            deltas.append(("players", idx2, c, b, a))
+                else:
+                    try:
+                        v1, v2 = get(p1), get(p2)
+                    except KeyError:  # short row: absent cells stay put
+                        v1 = [p1.get(c, _MISSING) for c in cols]
+                        v2 = [p2.get(c, _MISSING) for c in cols]
+                    for c, a, b in zip(cols, v1, v2):
+                        if a != b and a is not _MISSING and b is not _MISSING:
+                            p1[c], p2[c] = b, a
+                            deltas.append(("players", idx1, c, a, b))
+                            deltas.append(("players", idx2, c, b, a))
+                # journal only the cells that actually changed
+                self.journal.record_many(f"Swap players {idx1} <-> {idx2}", deltas)
+                self._reindex_player_team(idx1, t1, self.player_team_id(p1))
+                self._reindex_player_team(idx2, t2, self.player_team_id(p2))
+                touched += (idx1, idx2)
+        if "players" in self.name_index:
+            self._reindex_names("players", touched)
+        if self._int_cache:
+            self._update_int_cache("players", touched)
+        if self._rosters:
+            self._reposition_rosters(dict.fromkeys(touched))
+        self.mark_dirty_rows("players", touched)
+
+    # ---------- Undo / redo ----------
+    def undo(self):
+        """Revert the newest journal entry; returns (label, tables touched) or None."""
+        return self._replay(self.journal.undo_stack, self.journal.redo_stack, undo=True)
+
+    def redo(self):
+        """Re-apply the newest undone entry; returns (label, tables touched) or None."""
+        return self._replay(self.journal.redo_stack, self.journal.undo_stack, undo=False)
+
+    def _replay(self, source, target, undo):
+        if not source:
+            return None
+        entry = source.pop()
+        label, deltas = entry
+        # O(changed cells): each delta is written back through set_cell (indexes, dirty state)
+        with self.journal.paused():
+            if undo:
+                for table, idx, col, old, _ in reversed(deltas):
+                    self.set_cell(table, idx, col, old)
+            else:
+                for table, idx, col, _, new in deltas:
+                    self.set_cell(table, idx, col, new)
+        target.append(entry)
+        return label, {d[0] for d in deltas}
+
+    # ---------- Dirty tracking ----------
+    def mark_dirty(self, table, idx):
+        rows = self.dirty.get(table)
+        if rows is None:
+            rows = self.dirty[table] = set()
+            rows.add(idx)
+            if self.dirty_callback is not None:
+                self.dirty_callback()
+        else:
+            rows.add(idx)
+
+    def mark_dirty_rows(self, table, idxs):
+        if idxs:
+            self.mark_dirty(table, idxs[0])
+            self.dirty[table].update(idxs)
+
+    def is_dirty(self, table):
+        return bool(self.dirty.get(table))
+
+    def dirty_tables(self):
+        """Tables with unsaved edits, in TABLES order."""
+        return [t for t in TABLES if self.dirty.get(t)]
+
+    def dirty_files(self):
+        """File names of the tables with unsaved edits (for status display)."""
+        return [os.path.basename(getattr(self, TABLES[t][1])) for t in self.dirty_tables()]
+
+    def clear_dirty(self, table):
+        if self.dirty.pop(table, None) is not None and self.dirty_callback is not None:
+            self.dirty_callback()
+
+    def save_table(self, table, in_place=False):
+        """
+        Save one loaded table via save_csv() and clear its dirty state; returns the written path.
+        Rows defaulted at load are written along with the edits.
+        """
+        headers_attr, path_attr = TABLES[table]
+        rows = self.dirty.get(table, set()) | self.defaulted.get(table, set())
+        out, source = self._save_rows(getattr(self, table), getattr(self, headers_attr), getattr(self, path_attr),
+                                      self.sources.get(table), rows, in_place)
+        # the written file now holds every edit, so later saves copy from it
+        self.sources[table] = source
+        self.defaulted.pop(table, None)
+        self.clear_dirty(table)
+        return out
+
+    # ---------- Name search indexes ----------
+    def build_name_indexes(self):
+        self.name_index = {}
+        for table, (first_col, last_col) in NAME_INDEX_COLUMNS.items():
+            headers = getattr(self, TABLES[table][0]) or []
+            if first_col in headers or last_col in headers:
+                index = NameIndex(first_col, last_col)
+                index.build(self.column_values(table, first_col), self.column_values(table, last_col))
+                self.name_index[table] = index
+
+    def _reindex_names(self, table, idxs, col=None):
+        """Keep the table's NameIndex current for rows whose name cells (or `col` = None: any cell) changed."""
+        index = self.name_index[table]
+        if col is not None and col not in (index.first_col, index.last_col):
+            return
+        rows = getattr(self, table)
+        for idx in idxs:
+            row = rows[idx]
+            index.update(idx, row.get(index.first_col, ""), row.get(index.last_col, ""))
+
+    def search_names(self, table, query):
+        """Rows of `table` whose names match `query` (see NameIndex.search); None = no filter / no index."""
+        index = self.name_index.get(table)
+        return index.search(query) if index is not None else None
+
+    def find_names(self, table, query, limit=50):
+        """Ranked rows for a search box, prefix matches first, then fuzzy (see NameIndex.find)."""
+        index = self.name_index.get(table)
+        return index.find(query, limit) if index is not None else []
+
+    # ---------- Typed column caches ----------
+    def int_column(self, table, col):
+        """
+        Column `col` of `table` parsed with safe_int (None for blank / non-numeric cells). Built on
+        first use and kept current by every write path, so sorts and checks never re-parse cells.
+        Read-only for callers.
+        """
+        cache = self._int_cache.get((table, col))
+        if cache is None:
+            values = self.column_values(table, col)
+            parsed = {v: safe_int(v) for v in set(values)}  # columns repeat a few values many times
+            cache = self._int_cache[(table, col)] = [parsed[v] for v in values]
+        return cache
+
+    def _update_int_cache(self, table, idxs, col=None):
+        """Re-parse the cached ints of rows `idxs` (one column, or col=None: every cached column)."""
+        rows = getattr(self, table)
+        if col is not None:
+            cache = self._int_cache.get((table, col))
+            if cache is not None:
+                for idx in idxs:
+                    cache[idx] = safe_int(rows[idx].get(col))
+            return
+        for (t, c), cache in self._int_cache.items():
+            if t == table:
+                for idx in idxs:
+                    cache[idx] = safe_int(rows[idx].get(c))
+
+    # ---------- Draft pick index ----------
+    def _pick_entry(self, idx):
+        years = self.int_column("picks", DRAFT_PICK_YEAR)
+        nums = self.int_column("picks", DRAFT_PICK_NUM)
+        return _pick_order(years[idx], nums[idx]) + (idx,)
+
+    def _build_pick_index(self):
+        teams = {}
+        ids = self.int_column("picks", DRAFT_PICK_ID)
+        for idx in range(len(self.picks)):
+            teams.setdefault(ids[idx], []).append(self._pick_entry(idx))
+        for entries in teams.values():
+            entries.sort()
+        self._pick_teams = teams
+        self._pick_slot = [None] * len(self.picks)
+        for team, entries in teams.items():
+            for e in entries:
+                self._pick_slot[e[-1]] = (team, e)
+        self._pick_years = None
+
+    def team_picks(self, tid):
+        """Pick row indices owned by team `tid` (DPID), by year offset, round and pick number."""
+        if self._pick_teams is None:
+            self._build_pick_index()
+        return [e[-1] for e in self._pick_teams.get(safe_int(tid), ())]
+
+    def _pick_team_order(self):
+        # numeric DPIDs ascending, unparseable ones last (as pick_sort_key)
+        return sorted(self._pick_teams, key=lambda t: 99999 if t is None else t)
+
+    def sorted_picks(self):
+        """Pick row indices in Draft Picks tab order (pick_sort_key order, from the pick index)."""
+        if self._pick_teams is None:
+            self._build_pick_index()
+        return [e[-1] for t in self._pick_team_order() for e in self._pick_teams[t]]
+
+    def pick_position(self, idx):
+        """Position of pick `idx` in sorted_picks(), without building the whole order."""
+        if self._pick_teams is None:
+            self._build_pick_index()
+        owner, entry = self._pick_slot[idx]
+        before = 0
+        for t in self._pick_team_order():
+            if t == owner:
+                return before + bisect_left(self._pick_teams[t], entry)
+            before += len(self._pick_teams[t])
+        raise KeyError(idx)
+
+    def pick_positions(self, idxs):
+        """
+        (position, idx) of several refiled picks, ascending. A view that detaches all of them first
+        and reinserts them in this order lands each one on its sorted_picks() position.
+        """
+        return sorted((self.pick_position(idx), idx) for idx in dict.fromkeys(idxs))
+
+    def pick_year_display(self, idxs=None):
+        """Year offset -> sequential display number (0, 1, 3 -> 1, 2, 3) over picks `idxs` (None = all, cached)."""
+        if idxs is None and self._pick_teams is not None and self._pick_years is not None:
+            return self._pick_years
+        years = self.int_column("picks", DRAFT_PICK_YEAR)
+        present = set(years) if idxs is None else {years[i] for i in idxs}
+        present.discard(None)
+        mapping = {y: n for n, y in enumerate(sorted(present), 1)}
+        if idxs is None and self._pick_teams is not None:
+            self._pick_years = mapping
+        return mapping
+
+    def _reposition_picks(self, idxs, col=None):
+        """Refile picks whose owner / year / number changed (col=None: any column may have)."""
+        if col is not None and col not in (DRAFT_PICK_ID, DRAFT_PICK_NUM, DRAFT_PICK_YEAR):
+            return
+        if col != DRAFT_PICK_ID:
+            self._pick_years = None  # a year offset may have changed
+        ids = self.int_column("picks", DRAFT_PICK_ID)
+        teams = self._pick_teams
+        for idx in idxs:
+            owner, entry = self._pick_slot[idx]
+            entries = teams[owner]
+            del entries[bisect_left(entries, entry)]
+            if not entries:
+                del teams[owner]
+            entry = self._pick_entry(idx)
+            insort(teams.setdefault(ids[idx], []), entry)
+            self._pick_slot[idx] = (ids[idx], entry)
+
+    # ---------- Team -> roster index ----------
+    def _scan_team_index(self):
+        index = {}
+        if not self.team_col:
+            return index
+        for i, r in enumerate(self.players):
+            index.setdefault(self.player_team_id(r), []).append(i)
+        return index
+
+    def build_team_index(self):
+        self._team_index = self._scan_team_index()
+        self._rosters = {}
+        self._roster_keys = {}
+
+    def players_for_team(self, tid):
+        """Row indices (ascending) of the players on team `tid`; all rows if there is no team column."""
+        if not self.team_col:
+            return list(range(len(self.players)))
+        return list(self._team_index.get(tid, ()))
+
+    # ---------- Sorted rosters ----------
+    def roster(self, tid):
+        """
+        Row indices of team `tid` in roster order (roster_sort_key, then row index). Sorted once
+        per team; edits then move only the changed row (see _reposition_rosters).
+        """
+        tkey = tid if self.team_col else None  # no team column: one roster of every player
+        entries = self._rosters.get(tkey)
+        if entries is None:
+            rows = self.players
+            entries = self._rosters[tkey] = sorted((roster_sort_key(rows[i]), i) for i in self.players_for_team(tid))
+            for key, i in entries:
+                self._roster_keys[i] = (tkey, key)
+        return [i for _, i in entries]
+
+    def roster_position(self, tid, idx):
+        """Position of player `idx` in roster(tid), or None if it is not on that (cached) roster."""
+        tkey = tid if self.team_col else None
+        entry = self._roster_keys.get(idx)
+        if entry is None or entry[0] != tkey:
+            return None
+        return bisect_left(self._rosters[tkey], (entry[1], idx))
+
+    def _reposition_rosters(self, idxs, col=None):
+        """Move rows whose sort key or team changed (col=None: any column may have) within the cached rosters."""
+        if col is not None and col != self.team_col and col not in ROSTER_SORT_COLUMNS:
+            return
+        rows = self.players
+        for idx in idxs:
+            old = self._roster_keys.pop(idx, None)
+            if old is not None:
+                entries = self._rosters[old[0]]
+                del entries[bisect_left(entries, (old[1], idx))]
+            tkey = self.player_team_id(rows[idx]) if self.team_col else None
+            entries = self._rosters.get(tkey)
+            if entries is not None:
+                key = roster_sort_key(rows[idx])
+                insort(entries, (key, idx))
+                self._roster_keys[idx] = (tkey, key)
+
+    def _reindex_player_team(self, idx, old_tid, new_tid):
+        if not self.team_col or old_tid == new_tid:
+            return
+        lst = self._team_index.get(old_tid)
+        if lst:
+            pos = bisect_left(lst, idx)
+            if pos < len(lst) and lst[pos] == idx:
+                del lst[pos]
+            if not lst:
+                del self._team_index[old_tid]
+        insort(self._team_index.setdefault(new_tid, []), idx)
+
+    def check_team_index(self):
+        """
+        Compare the incrementally maintained team index with a full rescan.
+        Returns the sorted team ids whose rosters differ (empty list = consistent).
+        """
+        fresh = self._scan_team_index()
+        return sorted(tid for tid in set(fresh) | set(self._team_index)
+                      if fresh.get(tid, []) != self._team_index.get(tid, []))
+
+def _load_csv_job(path, columnar, fast_reader, snapshots):
+    """Process-pool worker for LOAD_PROCESSES: parse one CSV, return (rows, headers, source, seconds)."""
+    model = CSVModel(columnar=columnar, snapshots=snapshots)
+    model.fast_reader = fast_reader
+    return model._timed_load(path)
+
+# -----------------------------
+# Headless edit engine
+# -----------------------------
+# Standard export file names, used by the CLI to find the tables in a franchise folder
+EXPORT_FILES = {
+    "players": "play.csv",
+    "picks": "drpk.csv",
+    "salaries": "slri.csv",
+    "trainers": "trvw.csv",
+    "coaches": "coch.csv",
+    "gms": "gmvw.csv",
+}
+
+class EditEngine:
+    """
+    The editor's model operations without any UI: every method validates and clamps like
+    the GUI does, writes through CSVModel.set_cell() and returns the value(s) stored.
+    The App handlers call these; the CLI (main) replays edit scripts through apply().
+    """
+    def __init__(self, model: CSVModel):
+        self.model = model
+        self._pgid_index = None  # PGID -> player row, built on first use
+
+    # ---------- Row lookup ----------
+    def _row_index(self, table, idx):
+        rows = getattr(self.model, table)
+        try:
+            idx = int(idx)
+        except (TypeError, ValueError):
+            raise EditError(f"Invalid {table} row: {idx!r}") from None
+        if not rows:
+            raise EditError(f"No {table} loaded.")
+        if not 0 <= idx < len(rows):
+            raise EditError(f"{table} row {idx} out of range (0-{len(rows) - 1})")
+        return idx
+
+    def player_by_pgid(self, pgid):
+        if self._pgid_index is None:
+            # PGID is never swapped (IMMUTABLE_KEYS) and set_raw / apply_patch refuse to write it,
+            # so the index stays valid across edits, undo and redo
+            self._pgid_index = {}
+            for i, r in enumerate(self.model.players):
+                self._pgid_index.setdefault((r.get("PGID", "") or "").strip(), i)
+        idx = self._pgid_index.get(str(pgid).strip())
+        if idx is None:
+            raise EditError(f"No player with PGID {pgid}")
+        return idx
+
+    def _require_column(self, table, col):
+        headers = getattr(self.model, TABLES[table][0]) or []
+        if col not in headers:
+            raise EditError(f"{col} not found in {table} headers.")
+
+    # ---------- Players ----------
+    def set_name(self, idx, first=None, last=None):
+        """sanitize_name() and write PFNA/PLNA (None = leave as is); returns (first, last) stored."""
+        idx = self._row_index("players", idx)
+        out = []
+        with self.model.journal.group(f"Name (player row {idx})"):
+            for col, raw in ((PLAYER_FIRST_NAME_CODE, first), (PLAYER_LAST_NAME_CODE, last)):
+                if raw is None:
+                    out.append(None)
+                    continue
+                self._require_column("players", col)
+                name = sanitize_name(raw, max_len=15)
+                self.model.set_cell("players", idx, col, name)
+                out.append(name)
+        return tuple(out)
+
+    def enforce_current_le_max(self, idx, cur_col, max_col):
+        if not cur_col or not max_col:
+            return
+        c = self.model.int_column("players", cur_col)[idx]
+        m = self.model.int_column("players", max_col)[idx]
+        if c is None or m is None:
+            return
+        if c > m:
+            self.model.set_cell("players", idx, cur_col, str(m))
+
+    def set_stat(self, idx, stat, cur=None, max_=None):
+        """
+        Set a STAT_META stat and/or its hard-coded max (clamp_stat), then keep current <= max.
+        Returns the stored (current, max) strings.
+        """
+        idx = self._row_index("players", idx)
+        if stat not in STAT_META:
+            raise EditError(f"Unknown stat: {stat}")
+        cur_col = stat if stat in (self.model.player_headers or []) else None
+        max_col = self.model.max_map.get(stat)
+        with self.model.journal.group(f"{stat} (player row {idx})"):
+            if cur is not None and cur != "" and cur_col:
+                self.model.set_cell("players", idx, cur_col, str(clamp_stat(parse_int(cur))))
+            if max_ is not None and max_ != "" and max_col:
+                self.model.set_cell("players", idx, max_col, str(clamp_stat(parse_int(max_))))
+            self.enforce_current_le_max(idx, cur_col, max_col)
+        row = self.model.players[idx]
+        return (row.get(cur_col, "") if cur_col else "", row.get(max_col, "") if max_col else "")
+
+    def filter_players(self, team=None, positions=None, age_min=None, age_max=None):
+        """
+        Row indices (ascending) of the players on `team` (team id; None = all), whose PPOS is in
+        `positions` (codes like "16" or names like "CB"; None = all) and whose PAGE is in [age_min, age_max].
+        """
+        m = self.model
+        rows = m.players_for_team(str(team).strip()) if team not in (None, "") else range(len(m.players))
+        if positions:
+            by_name = {name: code for code, name in POSITIONS.items()}
+            wanted = {safe_int(by_name.get(str(p).strip().upper(), p)) for p in positions}
+            wanted.discard(None)
+            pos = m.int_column("players", PLAYER_POS_CODE)
+            rows = [i for i in rows if pos[i] in wanted]
+        if age_min not in (None, "") or age_max not in (None, ""):
+            lo = parse_int(age_min) if age_min not in (None, "") else None
+            hi = parse_int(age_max) if age_max not in (None, "") else None
+            ages = m.int_column("players", AGE_COL)
+            out = []
+            for i in rows:
+                a = ages[i]
+                if a is not None and (lo is None or a >= lo) and (hi is None or a <= hi):
+                    out.append(i)
+            rows = out
+        return list(rows)
+
+    def bulk_stat(self, stat, op, value, rows, target="cur"):
+        """
+        Apply set / add / scale `value` to a STAT_META stat for every player index in `rows`.
+        target: "cur" (the stat), "max" (its PLAYER_MAX_HARDCODED column) or "both".
+        Works column-wise: each column is read once, new values are clamp_stat()-ed, current
+        is capped at max in the same pass, and each column is written with one set_cells().
+        Non-numeric cells are left alone by add/scale. Returns the number of players changed.
+        """
+        if stat not in STAT_META:
+            raise EditError(f"Unknown stat: {stat}")
+        if op not in BULK_STAT_OPS:
+            raise EditError(f"Unknown bulk operation: {op!r} (use {', '.join(BULK_STAT_OPS)})")
+        if target not in BULK_STAT_TARGETS:
+            raise EditError(f"Unknown bulk target: {target!r} (use {', '.join(BULK_STAT_TARGETS)})")
+        m = self.model
+        cur_col = stat if stat in (m.player_headers or []) else None
+        max_col = m.max_map.get(stat)
+        if target in ("cur", "both") and not cur_col:
+            raise EditError(f"{stat} not found in play.csv headers.")
+        if target in ("max", "both") and not max_col:
+            raise EditError(f"No max column for {stat} in play.csv.")
+        if op == "scale":
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise EditError(f"Invalid factor: {value!r}") from None
+        else:
+            value = parse_int(value)
+
+        def compute(old):
+            if op == "set":
+                return clamp_stat(value)
+            if old is None:
+                return None
+            return clamp_stat(old + value if op == "add" else round(old * value))
+
+        # parsed columns (int or None); all reads happen before the writes below
+        cur_vals = m.int_column("players", cur_col) if cur_col else None
+        max_vals = m.int_column("players", max_col) if max_col else None
+        new_max, new_cur = {}, {}
+        for i in rows:
+            mx = compute(max_vals[i]) if target != "cur" else None
+            if mx is not None:
+                new_max[i] = str(mx)
+            elif max_vals is not None:
+                mx = max_vals[i]
+            if cur_vals is None:
+                continue
+            old = cur_vals[i]
+            c = compute(old) if target != "max" else old
+            if c is None:
+                continue
+            if mx is not None and c > mx:
+                c = mx
+            if target != "max" or c != old:
+                new_cur[i] = str(c)
+        changed = set()
+        with m.journal.group(f"Bulk {op} {stat} ({len(rows)} players)"):
+            if new_max:
+                changed.update(m.set_cells("players", max_col, new_max))
+            if new_cur:
+                changed.update(m.set_cells("players", cur_col, new_cur))
+        return len(changed)
+
+    def set_age_years(self, idx, age=None, years=None):
+        idx = self._row_index("players", idx)
+        headers = self.model.player_headers or []
+        with self.model.journal.group(f"Age/years (player row {idx})"):
+            if age is not None and age != "" and AGE_COL in headers:
+                self.model.set_cell("players", idx, AGE_COL, str(max(0, min(AGE_MAX_VALUE, parse_int(age)))))
+            if years is not None and years != "" and YEARS_COL in headers:
+                self.model.set_cell("players", idx, YEARS_COL, str(max(0, min(YEARS_MAX_VALUE, parse_int(years)))))
+
+    def set_contract(self, idx, salary=None, bonus=None, salary_col=None, bonus_col=None):
+        """
+        Clamp salary/bonus to 0..PLAYER_CONTRACT_MAX_VALUE; columns default to
+        detect_contract_columns(). Returns a list of "COL=value" updates.
+        """
+        idx = self._row_index("players", idx)
+        detected_salary, detected_bonus = detect_contract_columns(self.model.player_headers)
+        updates = []
+        with self.model.journal.group(f"Contract (player row {idx})"):
+            for col, raw in ((salary_col or detected_salary, salary), (bonus_col or detected_bonus, bonus)):
+                if raw is None or raw == "":
+                    continue
+                if not col:
+                    raise EditError("No salary/bonus column detected; name it explicitly.")
+                self._require_column("players", col)
+                v = max(0, min(PLAYER_CONTRACT_MAX_VALUE, parse_int_lenient(raw)))
+                self.model.set_cell("players", idx, col, str(v))
+                updates.append(f"{col}={v}")
+        return updates
+
+    def set_raw(self, idx, col, value):
+        """Write any player column as text, except PGID (the row's identity; see player_by_pgid)."""
+        idx = self._row_index("players", idx)
+        if col == "PGID":
+            raise EditError("PGID is the player's global ID and cannot be edited.")
+        self.model.set_cell("players", idx, col, str(value))
+
+    def swap(self, idx1, idx2):
+        """HC09-safe swap (IMMUTABLE_KEYS stay with their rows)."""
+        idx1 = self._row_index("players", idx1)
+        idx2 = self._row_index("players", idx2)
+        if idx1 == idx2:
+            raise EditError("Cannot swap a player with itself.")
+        self.model.swap_players(idx1, idx2, IMMUTABLE_KEYS)
+
+    def swap_many(self, pairs):
+        """
+        N-for-N HC09-safe swap: every (idx1, idx2) pair in one batch and one undo entry.
+        A player row may appear in only one pair. Returns the number of pairs swapped.
+        """
+        checked, seen = [], set()
+        for pair in pairs:
+            idx1, idx2 = (self._row_index("players", i) for i in pair)
+            if idx1 == idx2:
+                raise EditError("Cannot swap a player with itself.")
+            if idx1 in seen or idx2 in seen:
+                raise EditError(f"Player row {idx1 if idx1 in seen else idx2} is in more than one pair.")
+            seen.update((idx1, idx2))
+            checked.append((idx1, idx2))
+        if not checked:
+            raise EditError("No pairs to swap.")
+        self.model.swap_players_many(checked, IMMUTABLE_KEYS)
+        return len(checked)
+
+    # ---------- Picks / staff / cap ----------
+    def move_pick(self, idx, to_tid):
+        """Give draft pick `idx` to team `to_tid` (DPID)."""
+        idx = self._row_index("picks", idx)
+        self._require_column("picks", DRAFT_PICK_ID)
+        self.model.set_cell("picks", idx, DRAFT_PICK_ID, str(to_tid).strip())
+
+    def trade_picks(self, a_tid, b_tid, a_picks=(), b_picks=()):
+        """
+        Package trade: picks `a_picks` (owned by team a_tid) go to b_tid and `b_picks` go to a_tid,
+        written as one set_cells() batch and one undo entry. Returns the moved pick indices.
+        """
+        a_tid, b_tid = str(a_tid).strip(), str(b_tid).strip()
+        if a_tid == b_tid:
+            raise EditError("A pick trade needs two different teams.")
+        self._require_column("picks", DRAFT_PICK_ID)
+        updates = {}
+        for owner, to, picks in ((a_tid, b_tid, a_picks), (b_tid, a_tid, b_picks)):
+            owned = set(self.model.team_picks(owner))
+            for idx in picks:
+                idx = self._row_index("picks", idx)
+                if idx not in owned:
+                    raise EditError(f"Pick row {idx} is not owned by team {owner}.")
+                updates[idx] = to
+        if not updates:
+            raise EditError("No picks selected.")
+        with self.model.journal.group(f"Pick trade {a_tid} <-> {b_tid} ({len(updates)} picks)"):
+            self.model.set_cells("picks", DRAFT_PICK_ID, updates)
+        return sorted(updates)
+
+    def set_staff_value(self, table, idx, col, value):
+        """Clamp a trainer/coach/GM numeric column to STAFF_NUMERIC_RANGES; returns (stored, requested)."""
+        if table not in ("trainers", "coaches", "gms"):
+            raise EditError(f"Not a staff table: {table}")
+        idx = self._row_index(table, idx)
+        if col not in STAFF_NUMERIC_RANGES:
+            raise EditError(f"{col} is not an editable staff column.")
+        requested = parse_int_lenient(value)
+        lo, hi = STAFF_NUMERIC_RANGES[col]
+        v = max(lo, min(hi, requested))
+        self.model.set_cell(table, idx, col, str(v))
+        return v, requested
+
+    def set_skpt(self, table, idx, value):
+        return self.set_staff_value(table, idx, "SKPT", value)
+
+    def set_cap(self, value):
+        """Clamp the salary cap (slri.csv row 0) to 0..SALARY_CAP_MAX_VALUE; returns (stored, requested)."""
+        if not self.model.salaries:
+            raise EditError("No salary data loaded.")
+        requested = parse_int_lenient(value)
+        v = max(0, min(SALARY_CAP_MAX_VALUE, requested))
+        self.model.set_cell("salaries", 0, SALARY_CAP_KEY, str(v))
+        return v, requested
+
+    # ---------- Edit scripts ----------
+    def _player(self, op, key="player"):
+        """A player is addressed by row index (op[key]) or by PGID (op[key + "_pgid"])."""
+        if key + "_pgid" in op:
+            return self.player_by_pgid(op[key + "_pgid"])
+        if key not in op:
+            raise EditError(f"missing '{key}' (row index) or '{key}_pgid'")
+        return op[key]
+
+    def _check_op(self, op):
+        """Raise EditError naming the op and the problem if `op` does not have the shape apply() needs."""
+        if not isinstance(op, dict):
+            raise EditError("expected an object with an \"op\" key")
+        kind = op.get("op")
+        if kind not in EDIT_OPS:
+            raise EditError(f"Unknown op: {kind!r}")
+        players, required = EDIT_OPS[kind]
+        for key in players:
+            if key not in op and key + "_pgid" not in op:
+                raise EditError(f"{kind}: missing '{key}' (row index) or '{key}_pgid'")
+        for key in required:
+            if key not in op:
+                raise EditError(f"{kind}: missing '{key}'")
+        for key in EDIT_OP_LISTS:
+            if op.get(key) is not None and not isinstance(op[key], list):
+                raise EditError(f"{kind}: '{key}' must be a list")
+        if kind == "swap_many":
+            pairs = op["pairs"]
+            if not isinstance(pairs, list) or not all(isinstance(p, list) and len(p) == 2 for p in pairs):
+                raise EditError("swap_many: 'pairs' must be a list of [a, b]")
+
+    def apply(self, op):
+        """
+        Apply one edit-script operation (a dict with an "op" key):
+          {"op": "name", "player": 12, "first": "John", "last": "Smith"}
+          {"op": "stat", "player_pgid": "1234", "stat": "PSPD", "cur": 90, "max": 95}
+          {"op": "age", "player": 12, "age": 27, "years": 4}
+          {"op": "bulk_stat", "stat": "PSPD", "mode": "add", "value": 5, "target": "both",
+           "team": "33", "positions": ["WR", "CB"], "age_min": 21, "age_max": 25}
+          {"op": "contract", "player": 12, "salary": 1500000, "bonus": 250000}
+          {"op": "raw", "player": 12, "col": "PHGT", "value": "75"}
+          {"op": "swap", "a": 12, "b": 40}                    (or a_pgid / b_pgid)
+          {"op": "swap_many", "pairs": [[12, 40], [13, 41]]}   (player rows; one undo entry)
+          {"op": "pick", "row": 7, "to": "14"}
+          {"op": "pick_trade", "a": "1", "b": "14", "a_picks": [7, 40], "b_picks": [102]}
+          {"op": "skpt", "table": "coaches", "row": 3, "value": 131071}
+          {"op": "staff", "table": "coaches", "row": 3, "col": "CHEM", "value": 7}
+          {"op": "cap", "value": 4294967295}
+        Required keys are listed in EDIT_OPS; a malformed op raises EditError before any write.
+        """
+        self._check_op(op)
+        kind = op.get("op")
+        if kind == "name":
+            return self.set_name(self._player(op), op.get("first"), op.get("last"))
+        if kind == "stat":
+            return self.set_stat(self._player(op), op.get("stat"), op.get("cur"), op.get("max"))
+        if kind == "age":
+            return self.set_age_years(self._player(op), op.get("age"), op.get("years"))
+        if kind == "bulk_stat":
+            rows = self.filter_players(op.get("team"), op.get("positions"), op.get("age_min"), op.get("age_max"))
+            return self.bulk_stat(op["stat"], op["mode"], op["value"], rows, op.get("target", "cur"))
+        if kind == "contract":
+            return self.set_contract(self._player(op), op.get("salary"), op.get("bonus"),
+                                     op.get("salary_col"), op.get("bonus_col"))
+        if kind == "raw":
+            return self.set_raw(self._player(op), op["col"], op["value"])
+        if kind == "swap":
+            return self.swap(self._player(op, "a"), self._player(op, "b"))
+        if kind == "swap_many":
+            return self.swap_many(op["pairs"])
+        if kind == "pick":
+            return self.move_pick(op["row"], op["to"])
+        if kind == "pick_trade":
+            return self.trade_picks(op["a"], op["b"], op.get("a_picks", ()), op.get("b_picks", ()))
+        if kind == "skpt":
+            return self.set_skpt(op["table"], op["row"], op["value"])
+        if kind == "staff":
+            return self.set_staff_value(op["table"], op["row"], op["col"], op["value"])
+        if kind == "cap":
+            return self.set_cap(op["value"])
+        raise EditError(f"Unknown op: {kind!r}")
+
+    def apply_script(self, ops):
+        """Apply a list of operations in order; an error names the failing step."""
+        for n, op in enumerate(ops, 1):
+            try:
+                self._check_op(op)  # its messages already name the op
+            except EditError as e:
+                raise EditError(f"step {n}: {e}") from None
+            try:
+                self.apply(op)
+            except (EditError, KeyError, TypeError, AttributeError, ValueError) as e:
+                raise EditError(f"step {n} ({op['op']}): {e}") from None
+        return len(ops)
+
+    # ---------- Patch files ----------
+    def _patch_key_cols(self, table):
+        headers = getattr(self.model, TABLES[table][0]) or []
+        spec = PATCH_KEYS.get(table, ())
+        cols = tuple(c for c in spec if c in headers)
+        if not cols:
+            return (PATCH_ROW_KEY,)
+        return cols + (PATCH_ROW_KEY,) if spec[-1] == PATCH_ROW_KEY else cols
+
+    def _row_keys(self, table, key_cols, origins=None):
+        """
+        Key tuple of every row of `table` (see PATCH_KEYS); `origins` (journal.first_values()) puts back
+        the values rows had before their first edit. A trailing PATCH_ROW_KEY appends the row's
+        occurrence number among rows with the same values, so repeated keys stay distinct.
+        """
+        n = len(getattr(self.model, table))
+        if list(key_cols) == [PATCH_ROW_KEY]:
+            return [(str(i),) for i in range(n)]
+        cols = [c for c in key_cols if c != PATCH_ROW_KEY]
+        values = {c: self.model.column_values(table, c) for c in cols}  # fresh lists, safe to patch
+        for (t, idx, col), old in (origins or {}).items():
+            if t == table and col in values:
+                values[col][idx] = "" if old is _MISSING or old is None else str(old)
+        keys = [tuple((v or "").strip() for v in key) for key in zip(*(values[c] for c in cols))]
+        if key_cols[-1] == PATCH_ROW_KEY:
+            seen = {}
+            for i, key in enumerate(keys):
+                nth = seen[key] = seen.get(key, -1) + 1
+                keys[i] = key + (str(nth),)
+        return keys
+
+    def make_patch(self):
+        """
+        Net effect of every edit since load (undone edits cancel out) as a patch: per table, the
+        identity columns and [key values, {column: new value}] per edited row. Keys use the values
+        the row had before its first edit, so moved picks still match the fresh export. Edits whose
+        undo entries were trimmed past JOURNAL_MAX_CELLS are kept (journal.first_values).
+        """
+        first_old = self.model.journal.first_values()  # (table, idx, col) -> value before the first edit
+        rows = {}  # (table, idx) -> {col: new}
+        data = {t: getattr(self.model, t) for t in TABLES}
+        for (table, idx, col), old in first_old.items():
+            if col is None:
+                continue
+            new = data[table][idx].get(col, _MISSING)
+            if new is _MISSING or new == old:
+                continue
+            rows.setdefault((table, idx), {})[col] = new
+        tables, keys = {}, {}
+        for (table, idx), cells in sorted(rows.items()):
+            spec = tables.get(table)
+            if spec is None:
+                spec = tables[table] = {"key": list(self._patch_key_cols(table)), "rows": []}
+                keys[table] = self._row_keys(table, spec["key"], first_old)
+            spec["rows"].append([list(keys[table][idx]), cells])
+        return {"format": PATCH_FORMAT, "version": PATCH_VERSION, "tables": tables}
+
+    def _patch_index(self, table, key_cols):
+        """Hash index: key tuple -> list of row indices (one pass over the key columns)."""
+        index = {}
+        for i, key in enumerate(self._row_keys(table, key_cols)):
+            index.setdefault(key, []).append(i)
+        return index
+
+    def apply_patch(self, patch, label="Apply patch"):
+        """
+        Replay a make_patch() result onto the loaded export (one undo entry). Rows are found
+        through a hash index per table; rows whose key is missing or not unique are skipped.
+        Returns {"rows", "cells", "unmatched", "ambiguous", "missing_columns"}.
+        """
+        if not isinstance(patch, dict) or patch.get("format") != PATCH_FORMAT:
+            raise EditError("Not an HC09 patch file.")
+        if patch.get("version", 0) > PATCH_VERSION:
+            raise EditError(f"Patch version {patch.get('version')} is newer than this editor ({PATCH_VERSION}).")
+        for _, cells in patch.get("tables", {}).get("players", {}).get("rows", ()):
+            if "PGID" in cells:
+                raise EditError("Patch changes PGID, the player's global ID; it cannot be applied.")
+        report = {"rows": 0, "cells": 0, "unmatched": [], "ambiguous": [], "missing_columns": set()}
+        m = self.model
+        with m.journal.group(label):
+            for table, spec in patch.get("tables", {}).items():
+                if table not in TABLES:
+                    raise EditError(f"Unknown table in patch: {table}")
+                key_cols = spec["key"]
+                headers = set(getattr(m, TABLES[table][0]) or [])
+                if not getattr(m, table):
+                    report["unmatched"].extend((table, key) for key, _ in spec["rows"])
+                    continue
+                named = [c for c in key_cols if c != PATCH_ROW_KEY]
+                if named and not headers.issuperset(named):
+                    report["missing_columns"].update(f"{table}.{c}" for c in named if c not in headers)
+                    report["unmatched"].extend((table, key) for key, _ in spec["rows"])
+                    continue
+                index = self._patch_index(table, key_cols)
+                updates = {}  # col -> {idx: value}, written column-wise
+                for key, cells in spec["rows"]:
+                    hits = index.get(tuple(key))
+                    if not hits:
+                        report["unmatched"].append((table, key))
+                        continue
+                    if len(hits) > 1:
+                        report["ambiguous"].append((table, key))
+                        continue
+                    report["rows"] += 1
+                    for col, value in cells.items():
+                        if col not in headers:
+                            report["missing_columns"].add(f"{table}.{col}")
+                            continue
+                        updates.setdefault(col, {})[hits[0]] = value
+                for col, col_updates in updates.items():
+                    report["cells"] += len(m.set_cells(table, col, col_updates))
+        report["missing_columns"] = sorted(report["missing_columns"])
+        return report
+
+def save_patch(patch, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(patch, f, separators=(",", ":"))
+
+def load_patch(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def patch_summary(report, limit=10):
+    """Short text for an apply_patch() report."""
+    lines = [f"{report['rows']} rows matched, {report['cells']} cells changed."]
+    for what in ("unmatched", "ambiguous"):
+        items = report[what]
+        if items:
+            lines.append(f"{len(items)} {what} rows:")
+            lines += [f"  {table} {'/'.join(key)}" for table, key in items[:limit]]
+            if len(items) > limit:
+                lines.append(f"  ... and {len(items) - limit} more")
+    if report["missing_columns"]:
+        lines.append("Missing columns: " + ", ".join(report["missing_columns"]))
+    return "\n".join(lines)
+
+def load_edit_script(path):
+    """An edit script is a JSON list of operations, or an object with an "ops" list."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    ops = data.get("ops") if isinstance(data, dict) else data
+    if not isinstance(ops, list):
+        raise EditError(f"{path}: expected a list of operations")
+    return ops
+
+def run_edit_script(ops, paths, in_place=False, dry_run=False, patch=None, patch_out=""):
+    """
+    Load the tables in `paths` (table -> csv path, players required), replay `patch` and
+    apply `ops`, write the resulting patch to `patch_out` if given, and save the edited
+    tables. Returns (written paths, apply_patch() report or None).
+    """
+    model = CSVModel(columnar=True)
+    model.load_all(paths["players"], paths.get("picks", ""), paths.get("salaries", ""),
+                   paths.get("trainers", ""), paths.get("coaches", ""), paths.get("gms", ""))
+    engine = EditEngine(model)
+    report = engine.apply_patch(patch) if patch is not None else None
+    engine.apply_script(ops or [])
+    if patch_out:
+        save_patch(engine.make_patch(), patch_out)
+    if dry_run:
+        return [], report
+    return [model.save_table(t, in_place=in_place) for t in model.dirty_tables()], report
+
+def _export_paths(folder):
+    return {t: os.path.join(folder, name) for t, name in EXPORT_FILES.items()
+            if os.path.exists(os.path.join(folder, name))}
+
+def main(argv=None):
+    """
+    No arguments: start the GUI. With --script and/or --patch: apply an edit script / replay a
+    patch headlessly to the CSVs named by --play/--drpk/... or to each franchise folder given
+    (standard file names).
+    """
+    import argparse
+    import sys
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        from hc09_gui import App  # tkinter is only imported when the GUI is started
+        App().mainloop()
+        return 0
+
+    ap = argparse.ArgumentParser(description="Apply an HC09 edit script or patch to franchise CSVs without the GUI.")
+    ap.add_argument("--script", default="", help="JSON edit script (see EditEngine.apply)")
+    ap.add_argument("--patch", default="", help="patch file to replay first (see EditEngine.make_patch)")
+    ap.add_argument("--export-patch", default="", help="write the resulting edits as a patch file (one export only)")
+    ap.add_argument("folders", nargs="*", help="franchise export folders (play.csv, drpk.csv, slri.csv, trvw.csv, coch.csv, gmvw.csv)")
+    for table, name in EXPORT_FILES.items():
+        ap.add_argument("--" + name[:-4], dest=table, default="", help=f"path to {name}")
+    ap.add_argument("--in-place", action="store_true", help="overwrite the CSVs (keeps a .bak)")
+    ap.add_argument("--dry-run", action="store_true", help="apply and validate, but do not save")
+    ap.add_argument("--profile-out", default="", help="time load/save and write the stats (JSON) here")
+    args = ap.parse_args(argv)
+
+    jobs = [(folder, _export_paths(folder)) for folder in args.folders]
+    explicit = {t: getattr(args, t) for t in EXPORT_FILES if getattr(args, t)}
+    if explicit:
+        jobs.append((explicit.get("players", "?"), explicit))
+    if not jobs:
+        ap.error("give --play (and friends) or at least one franchise folder")
+    if not args.script and not args.patch:
+        ap.error("give --script and/or --patch")
+    if args.export_patch and len(jobs) > 1:
+        ap.error("--export-patch works on one export at a time")
+
+    profiler = enable_profiling() if args.profile_out else get_profiler()
+    def read(path, loader):
+        try:
+            return loader(path)
+        except OSError as e:
+            ap.error(f"cannot read {path}: {e.strerror or e}")
+        except (EditError, ValueError) as e:  # ValueError covers json.JSONDecodeError
+            ap.error(str(e) if path in str(e) else f"{path}: {e}")
+
+    ops = read(args.script, load_edit_script) if args.script else []
+    patch = read(args.patch, load_patch) if args.patch else None
+    failed = 0
+    for label, paths in jobs:
+        try:
+            if "players" not in paths:
+                raise EditError("play.csv not found")
+            outs, report = run_edit_script(ops, paths, in_place=args.in_place, dry_run=args.dry_run,
+                                           patch=patch, patch_out=args.export_patch)
+        except (EditError, OSError, ValueError) as e:
+            failed += 1
+            print(f"{label}: FAILED: {e}", file=sys.stderr)
+            continue
+        print(f"{label}: {len(ops)} edits" + ("".join(f"\n  saved {o}" for o in outs) if outs else " (nothing saved)"))
+        if report is not None:
+            print("  patch: " + patch_summary(report).replace("\n", "\n  "))
+    if profiler is not None:
+        print(profiler.report(), file=sys.stderr)
+        if args.profile_out:
+            profiler.dump(args.profile_out)
+    return 1 if failed else 0
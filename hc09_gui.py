@@ -0,0 +1,2238 @@
+"""
+HC09 CSV Editor - Tkinter GUI
+"""
+
+import os
+import queue
+import threading
+from bisect import bisect_left
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+from hc09_core import (
+    AGE_COL, BULK_STAT_OPS, DRAFT_PICK_ID, DRAFT_PICK_NUM, DRAFT_PICK_YEAR, IMMUTABLE_KEYS, LOAD_POLL_MS, LOAD_THREADS,
+    PLAYER_FIRST_NAME_CODE, PLAYER_LAST_NAME_CODE, POSITIONS, SALARY_CAP_KEY,
+    STAFF_NUMERIC_RANGES, STAT_META, TABLES, TEAM_NAMES, YEARS_COL,
+    CSVModel, EditEngine, LoadCancelled, detect_contract_columns, get_profiler, load_patch, patch_summary,
+    sanitize_name, save_patch,
+)
+
+# -----------------------------
+# GUI
+# -----------------------------
+VIRTUAL_BUFFER_ROWS = 2  # extra Treeview items kept beyond the visible window
+SEARCH_DEBOUNCE_MS = 120  # as-you-type searches (players, coaches) run once typing pauses this long
+PLAYER_SEARCH_LIMIT = 50  # rows shown in the Players tab search results
+PROFILED_APP_PREFIXES = ("refresh_", "on_apply_")  # App handlers timed when profiling is on
+DIAGNOSTICS_REFRESH_MS = 1000  # Diagnostics window auto-refresh
+
+class VirtualTreeview(ttk.Frame):
+    """
+    Treeview that only holds items for the visible window (+ VIRTUAL_BUFFER_ROWS).
+    The rows are a list of model indices in display order; cell values are fetched from
+    a callback as rows scroll into view, so refresh and scrolling cost depend on the
+    window height, not on the table size.
+    Selection is tracked as a model index, so it survives scrolling.
+    """
+    def __init__(self, parent, height=20):
+        super().__init__(parent)
+        self.tree = ttk.Treeview(self, show="headings", height=height, selectmode="browse")
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.vsb.pack(side="right", fill="y")
+
+        self._order = []          # model indices in display order
+        self._values = None       # callable(model_idx) -> list of cell values
+        self._key = None          # optional callable(model_idx) -> sort key
+        self._keys = None         # sort keys parallel to _order (when _key is set)
+        self._top = 0             # display position shown in the first slot
+        self._visible = height    # rows that fit in the widget
+        self._slots = []          # item iids, reused for whatever rows are in view
+        self._detached = set()    # slots hidden because the rows ran out
+        self._selected = None     # selected model index
+        self._on_select = None
+
+        self._resize_slots(height + VIRTUAL_BUFFER_ROWS)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-3 if e.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(3))
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self._move_selection(-self._visible))
+        self.tree.bind("<Next>", lambda e: self._move_selection(self._visible))
+        self.tree.bind("<Home>", lambda e: self._move_selection(-len(self._order)))
+        self.tree.bind("<End>", lambda e: self._move_selection(len(self._order)))
+
+    # ----- setup -----
+    def set_columns(self, headers, width=140):
+        self.tree["columns"] = list(headers or ())
+        for h in headers or ():
+            self.tree.heading(h, text=h)
+            self.tree.column(h, width=width, anchor="w")
+
+    def set_rows(self, order, values, key=None, keys=None):
+        """
+        Show model indices `order`; values(model_idx) gives a row's cells.
+        With key(model_idx) the rows are sorted by it and kept sorted by update_row().
+        Pass `keys` (the keys of `order`, already sorted) to skip the sort.
+        """
+        self._values = values
+        self._key = key
+        if key is None:
+            self._order = list(order)
+            self._keys = None
+        elif keys is not None:
+            self._order = list(order)
+            self._keys = list(keys)
+        else:
+            keyed = sorted((key(i), i) for i in order)
+            self._order = [i for _, i in keyed]
+            self._keys = [k for k, _ in keyed]
+        if self._selected is not None and self._selected not in set(self._order):
+            self._selected = None
+        self._render()
+
+    def bind_select(self, callback):
+        """callback() runs when the selected model index changes."""
+        self._on_select = callback
+
+    # ----- queries -----
+    def selected_index(self):
+        return self._selected
+
+    def index_of_item(self, iid):
+        """Model index currently shown by item `iid` (None for an empty slot)."""
+        try:
+            pos = self._top + self._slots.index(iid)
+        except ValueError:
+            return None
+        return self._order[pos] if pos < len(self._order) else None
+
+    def rows(self):
+        return list(self._order)
+
+    # ----- updates -----
+    def select_index(self, model_idx):
+        """Select a model index and scroll it into view."""
+        if model_idx not in self._order:
+            return
+        self._selected = model_idx
+        pos = self._order.index(model_idx)
+        if not self._top <= pos < self._top + self._visible:
+            self._top = pos
+        self._render()
+
+    def scroll(self, rows):
+        self._top += rows
+        self._render()
+        return "break"
+
+    def refresh(self):
+        """Re-fetch the values of the rows in view."""
+        self._render()
+
+    def update_row(self, model_idx):
+        """
+        Re-fetch one row after an edit. Only its slot is touched unless its sort key
+        changed, in which case it is moved (bisect) and the window redrawn.
+        Selection and scroll position are kept.
+        """
+        try:
+            pos = self._order.index(model_idx)
+        except ValueError:
+            return
+        if self._key is not None:
+            new_key = self._key(model_idx)
+            if new_key != self._keys[pos]:
+                del self._order[pos]
+                del self._keys[pos]
+                pos = bisect_left(self._keys, new_key)
+                self._order.insert(pos, model_idx)
+                self._keys.insert(pos, new_key)
+                self._render()
+                return
+        k = pos - self._top
+        if 0 <= k < len(self._slots):
+            self.tree.item(self._slots[k], values=self._values(model_idx))
+
+    def _render(self):
+        n = len(self._order)
+        self._top = max(0, min(self._top, n - self._visible))
+        sel_iid = None
+        for k, iid in enumerate(self._slots):
+            pos = self._top + k
+            if pos < n:
+                idx = self._order[pos]
+                self.tree.item(iid, values=self._values(idx))
+                if iid in self._detached:
+                    self.tree.move(iid, "", k)
+                    self._detached.discard(iid)
+                if idx == self._selected:
+                    sel_iid = iid
+            elif iid not in self._detached:
+                self.tree.detach(iid)
+                self._detached.add(iid)
+        if sel_iid is not None:
+            self.tree.selection_set(sel_iid)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+        if n:
+            self.vsb.set(self._top / n, min(1.0, (self._top + self._visible) / n))
+        else:
+            self.vsb.set(0.0, 1.0)
+
+    def _resize_slots(self, count):
+        while len(self._slots) < count:
+            self._slots.append(self.tree.insert("", tk.END, iid=f"slot{len(self._slots)}", values=()))
+        while len(self._slots) > count:
+            iid = self._slots.pop()
+            self._detached.discard(iid)
+            self.tree.delete(iid)
+
+    # ----- events -----
+    def _on_scrollbar(self, *args):
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._top = int(float(args[1]) * len(self._order))
+        elif args[0] == "scroll":
+            step = self._visible if args[2] == "pages" else 1
+            self._top += int(args[1]) * step
+        self._render()
+
+    def _on_configure(self, event):
+        first = self.tree.bbox(self._slots[0]) if self._slots else None
+        if first:
+            _, y, _, row_h = first
+        else:
+            y, row_h = 24, 20
+        visible = max(1, (event.height - y) // max(1, row_h))
+        if visible != self._visible:
+            self._visible = visible
+            self._resize_slots(visible + VIRTUAL_BUFFER_ROWS)
+            self._render()
+
+    def _on_tree_select(self, event=None):
+        sel = self.tree.selection()
+        if not sel:
+            return  # selection scrolled out of view; keep the model index
+        idx = self.index_of_item(sel[0])
+        if idx is None or idx == self._selected:
+            return
+        self._selected = idx
+        if self._on_select is not None:
+            self._on_select()
+
+    def _move_selection(self, delta):
+        if not self._order:
+            return "break"
+        pos = self._order.index(self._selected) if self._selected in self._order else self._top - 1
+        pos = max(0, min(len(self._order) - 1, pos + delta))
+        if pos < self._top:
+            self._top = pos
+        elif pos >= self._top + self._visible:
+            self._top = pos - self._visible + 1
+        changed = self._order[pos] != self._selected
+        self._selected = self._order[pos]
+        self._render()
+        if changed and self._on_select is not None:
+            self._on_select()
+        return "break"
+
+def _set_combo_to_tid(cmb, tid):
+    """Select the "tid: name" entry of a team combobox (first entry if tid is not listed)."""
+    for i, label in enumerate(cmb["values"]):
+        if str(label).startswith(str(tid) + ":"):
+            cmb.current(i)
+            return
+    if cmb["values"]:
+        cmb.current(0)
+
+def _combo_tid(cmb):
+    v = cmb.get()
+    if ":" in v:
+        return v.split(":", 1)[0].strip()
+    return v.strip()
+
+class SwapTradeDialog(tk.Toplevel):
+    """
+    HC09-safe swap trade dialog:
+    pick Team 1 -> player, Team 2 -> player, then swap (without changing TGID/IDs).
+    For N-for-N trades, queue several pairs and swap them all as one batch (one undo entry).
+    """
+    def __init__(self, parent, model: CSVModel):
+        super().__init__(parent)
+        self.title("HC09-SAFE SWAP TRADE (does not change TGID)")
+        self.geometry("980x660")
+        self.minsize(900, 580)
+        self.parent = parent
+        self.model = model
+
+        self.team1 = tk.StringVar(value="33")
+        self.team2 = tk.StringVar(value="1")
+
+        self.idx1 = None  # real index into model.players
+        self.idx2 = None
+        self.queue = []  # [(idx1, idx2)] pairs waiting for "Swap All Queued"
+
+        self._build()
+
+    def _build(self):
+        top = ttk.Frame(self)
+        top.pack(fill="x", padx=10, pady=10)
+
+        warn = (
+            "This trade swaps player DATA between two roster rows, but keeps TGID/IDs unchanged.\n"
+            "That is the safest method when TGID is the only team column."
+        )
+        ttk.Label(top, text=warn).pack(anchor="w")
+
+        body = ttk.Frame(self)
+        body.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        left = ttk.LabelFrame(body, text="Team 1 (choose player to send)")
+        right = ttk.LabelFrame(body, text="Team 2 (choose player to send)")
+
+        left.pack(side="left", fill="both", expand=True, padx=(0, 8))
+        right.pack(side="left", fill="both", expand=True, padx=(8, 0))
+
+        # Team dropdowns
+        self.cmb_t1 = ttk.Combobox(left, state="readonly", width=28)
+        self.cmb_t2 = ttk.Combobox(right, state="readonly", width=28)
+
+        team_vals = [f"{tid}: {name}" for tid, name in TEAM_NAMES.items()]
+        self.cmb_t1["values"] = team_vals
+        self.cmb_t2["values"] = team_vals
+
+        # default selections
+        self._set_combo_to_tid(self.cmb_t1, "33")
+        self._set_combo_to_tid(self.cmb_t2, "1")
+
+        self.cmb_t1.pack(anchor="w", padx=10, pady=(10, 6))
+        self.cmb_t2.pack(anchor="w", padx=10, pady=(10, 6))
+
+        self.cmb_t1.bind("<<ComboboxSelected>>", lambda e: self._refresh_roster(1))
+        self.cmb_t2.bind("<<ComboboxSelected>>", lambda e: self._refresh_roster(2))
+
+        # Rosters
+        self.lst1 = tk.Listbox(left, exportselection=False)
+        self.lst2 = tk.Listbox(right, exportselection=False)
+        self.lst1.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        self.lst2.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        self.lst1.bind("<<ListboxSelect>>", lambda e: self._on_pick_player(1))
+        self.lst2.bind("<<ListboxSelect>>", lambda e: self._on_pick_player(2))
+
+        # queued pairs (N-for-N batch)
+        qfrm = ttk.LabelFrame(self, text="Queued pairs (swapped together)")
+        qfrm.pack(fill="x", padx=10, pady=(0, 10))
+        self.lst_queue = tk.Listbox(qfrm, height=5, exportselection=False)
+        self.lst_queue.pack(side="left", fill="both", expand=True, padx=10, pady=8)
+        qbtns = ttk.Frame(qfrm)
+        qbtns.pack(side="left", fill="y", padx=(0, 10), pady=8)
+        ttk.Button(qbtns, text="Add Pair", command=self._do_queue).pack(fill="x")
+        ttk.Button(qbtns, text="Remove", command=self._do_unqueue).pack(fill="x", pady=4)
+        ttk.Button(qbtns, text="Swap All Queued", command=self._do_swap_queued).pack(fill="x")
+
+        # bottom controls
+        bottom = ttk.Frame(self)
+        bottom.pack(fill="x", padx=10, pady=(0, 10))
+
+        ttk.Label(bottom, text="Immutable keys not swapped: " + ", ".join(sorted(IMMUTABLE_KEYS))).pack(side="left")
+
+        ttk.Button(bottom, text="Swap (HC09-safe trade)", command=self._do_swap).pack(side="right")
+        ttk.Button(bottom, text="Close", command=self.destroy).pack(side="right", padx=(0, 8))
+
+        self._refresh_roster(1)
+        self._refresh_roster(2)
+
+    def _set_combo_to_tid(self, cmb, tid):
+        _set_combo_to_tid(cmb, tid)
+
+    def _combo_tid(self, cmb):
+        return _combo_tid(cmb)
+
+    def _refresh_roster(self, which):
+        tid = self._combo_tid(self.cmb_t1 if which == 1 else self.cmb_t2)
+        lst = self.lst1 if which == 1 else self.lst2
+
+        lst.delete(0, tk.END)
+        mapping = []
+
+        # if somehow no team col, players_for_team() returns all rows
+        filtered = [(i, self.model.players[i]) for i in self.model.players_for_team(tid)]
+
+        for i, r in filtered:
+            pos = self.model.player_pos(r)
+            name = self.model.player_name(r)
+            mapping.append(i)
+            lst.insert(tk.END, f"{pos}  {name}   (row#{i})")
+
+        if which == 1:
+            self.map1 = mapping
+            self.idx1 = None
+        else:
+            self.map2 = mapping
+            self.idx2 = None
+
+        # auto-select first
+        if lst.size() > 0:
+            lst.selection_set(0)
+            lst.activate(0)
+            self._on_pick_player(which)
+
+    def _on_pick_player(self, which):
+        lst = self.lst1 if which == 1 else self.lst2
+        sel = lst.curselection()
+        if not sel:
+            return
+        lb_idx = sel[0]
+        if which == 1:
+            if lb_idx < len(self.map1):
+                self.idx1 = self.map1[lb_idx]
+        else:
+            if lb_idx < len(self.map2):
+                self.idx2 = self.map2[lb_idx]
+
+    def _do_swap(self):
+        if self.idx1 is None or self.idx2 is None:
+            messagebox.showwarning("Pick players", "Select one player on each side.")
+            return
+        if self.idx1 == self.idx2:
+            messagebox.showwarning("Same row", "You selected the same row on both sides.")
+            return
+
+        n1 = self.model.player_name(self.model.players[self.idx1])
+        n2 = self.model.player_name(self.model.players[self.idx2])
+
+        self.parent.engine.swap(self.idx1, self.idx2)
+
+        messagebox.showinfo("Trade complete", f"✅ HC09-SAFE SWAP TRADE COMPLETED\n\n{n1}  ⇄  {n2}")
+
+        # Refresh the parent's views
+        self.parent.refresh_players_for_team()
+        self.parent.refresh_stats_for_player()
+        self.parent.refresh_picks()
+
+    def _pair_label(self, idx1, idx2):
+        p1, p2 = self.model.players[idx1], self.model.players[idx2]
+        return (f"{self.model.player_name(p1)} ({self.model.player_team_id(p1) or '-'})  ⇄  "
+                f"{self.model.player_name(p2)} ({self.model.player_team_id(p2) or '-'})")
+
+    def _do_queue(self):
+        if self.idx1 is None or self.idx2 is None:
+            messagebox.showwarning("Pick players", "Select one player on each side.", parent=self)
+            return
+        if self.idx1 == self.idx2:
+            messagebox.showwarning("Same row", "You selected the same row on both sides.", parent=self)
+            return
+        queued = {i for pair in self.queue for i in pair}
+        if self.idx1 in queued or self.idx2 in queued:
+            messagebox.showwarning("Already queued", "A player can only be in one queued pair.", parent=self)
+            return
+        self.queue.append((self.idx1, self.idx2))
+        self.lst_queue.insert(tk.END, self._pair_label(self.idx1, self.idx2))
+
+    def _do_unqueue(self):
+        for pos in reversed(self.lst_queue.curselection()):
+            self.lst_queue.delete(pos)
+            del self.queue[pos]
+
+    def _do_swap_queued(self):
+        if not self.queue:
+            messagebox.showinfo("Nothing queued", "Add at least one pair first.", parent=self)
+            return
+        try:
+            n = self.parent.engine.swap_many(self.queue)
+        except Exception as e:
+            messagebox.showerror("Trade Error", str(e), parent=self)
+            return
+        self.queue = []
+        self.lst_queue.delete(0, tk.END)
+        messagebox.showinfo("Trade complete", f"✅ HC09-SAFE SWAP TRADE COMPLETED\n\n{n} pair(s) swapped.", parent=self)
+
+        # one refresh for the whole batch (picks are not touched by a player swap)
+        self.parent.refresh_players_for_team()
+        self.parent.refresh_stats_for_player()
+        self._refresh_roster(1)
+        self._refresh_roster(2)
+
+
+class PickTradeDialog(tk.Toplevel):
+    """
+    Draft-pick package trade builder: choose two teams, select any number of picks on each
+    side, then trade them all at once (EditEngine.trade_picks: one batched write, one undo entry).
+    """
+    def __init__(self, parent, model: CSVModel):
+        super().__init__(parent)
+        self.title("Pick Trade Builder")
+        self.geometry("900x480")
+        self.minsize(760, 400)
+        self.parent = parent
+        self.model = model
+
+        self.maps = {1: [], 2: []}  # model pick index per listbox row
+        self._build()
+
+    def _build(self):
+        body = ttk.Frame(self)
+        body.pack(fill="both", expand=True, padx=10, pady=10)
+
+        team_vals = [f"{tid}: {name}" for tid, name in TEAM_NAMES.items()]
+        self.cmbs, self.lsts = {}, {}
+        for which, default in ((1, "1"), (2, "2")):
+            side = ttk.LabelFrame(body, text=f"Team {which} sends (Ctrl/Shift-click for several)")
+            side.pack(side="left", fill="both", expand=True, padx=(0, 8) if which == 1 else (8, 0))
+            cmb = ttk.Combobox(side, state="readonly", width=28, values=team_vals)
+            cmb.pack(anchor="w", padx=10, pady=(10, 6))
+            cmb.bind("<<ComboboxSelected>>", lambda e, w=which: self._refresh_side(w))
+            lst = tk.Listbox(side, selectmode=tk.EXTENDED, exportselection=False)
+            lst.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+            lst.bind("<<ListboxSelect>>", lambda e: self._update_summary())
+            self.cmbs[which], self.lsts[which] = cmb, lst
+            _set_combo_to_tid(cmb, default)
+
+        bottom = ttk.Frame(self)
+        bottom.pack(fill="x", padx=10, pady=(0, 10))
+        self.lbl_summary = ttk.Label(bottom, text="")
+        self.lbl_summary.pack(side="left")
+        ttk.Button(bottom, text="Execute Trade", command=self._do_trade).pack(side="right")
+        ttk.Button(bottom, text="Close", command=self.destroy).pack(side="right", padx=(0, 8))
+
+        self._refresh_side(1)
+        self._refresh_side(2)
+
+    def _tid(self, which):
+        return _combo_tid(self.cmbs[which])
+
+    def _refresh_side(self, which):
+        lst = self.lsts[which]
+        lst.delete(0, tk.END)
+        picks = self.model.team_picks(self._tid(which))
+        nums = self.model.int_column("picks", DRAFT_PICK_NUM)
+        years = self.model.int_column("picks", DRAFT_PICK_YEAR)
+        year_map = self.model.pick_year_display(picks)
+        for idx in picks:
+            num, year = nums[idx], years[idx]
+            rnd = num // 32 + 1 if num is not None else "-"
+            lst.insert(tk.END, f"R{rnd}:{num + 1 if num is not None else '-'} (Yr:{year_map.get(year, '?')})  [row {idx}]")
+        self.maps[which] = picks
+        self._update_summary()
+
+    def _selected(self, which):
+        return [self.maps[which][i] for i in self.lsts[which].curselection()]
+
+    def _update_summary(self):
+        n1, n2 = len(self._selected(1)), len(self._selected(2))
+        self.lbl_summary.configure(text=f"Team {self._tid(1)} sends {n1} pick(s), team {self._tid(2)} sends {n2}.")
+
+    def _do_trade(self):
+        a, b = self._tid(1), self._tid(2)
+        try:
+            moved = self.parent.engine.trade_picks(a, b, self._selected(1), self._selected(2))
+        except Exception as e:
+            messagebox.showerror("Trade Error", str(e), parent=self)
+            return
+        # one refresh of the parent's pick views for the whole package
+        self.parent.on_picks_moved(moved)
+        self._refresh_side(1)
+        self._refresh_side(2)
+        self.lbl_summary.configure(text=f"Traded {len(moved)} pick(s) between {a} and {b}.")
+
+
+class BulkStatDialog(tk.Toplevel):
+    """
+    Bulk stat editor: set / add / scale one stat (current, max or both) for every player
+    matching a team / position / age filter. Runs through EditEngine.bulk_stat (column-wise).
+    """
+    ALL_TEAMS = "All teams"
+    ALL_POSITIONS = "All positions"
+
+    def __init__(self, parent, model: CSVModel):
+        super().__init__(parent)
+        self.title("Bulk Stat Editor")
+        self.geometry("720x260")
+        self.minsize(640, 240)
+        self.parent = parent
+        self.model = model
+
+        self.target = tk.StringVar(value="both")
+        self._build()
+
+    def _build(self):
+        frm = ttk.Frame(self)
+        frm.pack(fill="both", expand=True, padx=10, pady=10)
+
+        stats = [k for k in STAT_META if k in (self.model.player_headers or []) or k in self.model.max_map]
+        ttk.Label(frm, text="Stat:").grid(row=0, column=0, sticky="w")
+        self.cmb_stat = ttk.Combobox(frm, state="readonly", width=36,
+                                     values=[f"{k}: {STAT_META[k][0]}" for k in stats])
+        self.cmb_stat.grid(row=0, column=1, columnspan=3, sticky="w", padx=6, pady=4)
+        if stats:
+            self.cmb_stat.current(0)
+
+        ttk.Label(frm, text="Apply to:").grid(row=1, column=0, sticky="w")
+        targets = ttk.Frame(frm)
+        targets.grid(row=1, column=1, columnspan=3, sticky="w", padx=6, pady=4)
+        for value, text in (("cur", "Current"), ("max", "Max"), ("both", "Both")):
+            ttk.Radiobutton(targets, text=text, value=value, variable=self.target).pack(side="left", padx=(0, 10))
+
+        ttk.Label(frm, text="Operation:").grid(row=2, column=0, sticky="w")
+        self.cmb_op = ttk.Combobox(frm, state="readonly", width=8, values=list(BULK_STAT_OPS))
+        self.cmb_op.current(0)
+        self.cmb_op.grid(row=2, column=1, sticky="w", padx=6, pady=4)
+        ttk.Label(frm, text="Value (factor for scale):").grid(row=2, column=2, sticky="e")
+        self.ent_value = ttk.Entry(frm, width=10)
+        self.ent_value.grid(row=2, column=3, sticky="w", padx=6)
+
+        ttk.Label(frm, text="Team:").grid(row=3, column=0, sticky="w")
+        self.cmb_team = ttk.Combobox(frm, state="readonly", width=28,
+                                     values=[self.ALL_TEAMS] + [f"{tid}: {name}" for tid, name in TEAM_NAMES.items()])
+        self.cmb_team.current(0)
+        self.cmb_team.grid(row=3, column=1, sticky="w", padx=6, pady=4)
+        ttk.Label(frm, text="Position:").grid(row=3, column=2, sticky="e")
+        self.cmb_pos = ttk.Combobox(frm, state="readonly", width=10,
+                                    values=[self.ALL_POSITIONS] + list(POSITIONS.values()))
+        self.cmb_pos.current(0)
+        self.cmb_pos.grid(row=3, column=3, sticky="w", padx=6)
+
+        ttk.Label(frm, text="Age from:").grid(row=4, column=0, sticky="w")
+        ages = ttk.Frame(frm)
+        ages.grid(row=4, column=1, sticky="w", padx=6, pady=4)
+        self.ent_age_min = ttk.Entry(ages, width=5)
+        self.ent_age_min.pack(side="left")
+        ttk.Label(ages, text="to").pack(side="left", padx=4)
+        self.ent_age_max = ttk.Entry(ages, width=5)
+        self.ent_age_max.pack(side="left")
+
+        bottom = ttk.Frame(self)
+        bottom.pack(fill="x", padx=10, pady=(0, 10))
+        self.lbl_result = ttk.Label(bottom, text="Current is always kept <= max.")
+        self.lbl_result.pack(side="left")
+        ttk.Button(bottom, text="Apply", command=self._do_apply).pack(side="right")
+        ttk.Button(bottom, text="Count Matches", command=self._do_count).pack(side="right", padx=(0, 8))
+        ttk.Button(bottom, text="Close", command=self.destroy).pack(side="right", padx=(0, 8))
+
+    def _filtered_rows(self):
+        team = self.cmb_team.get()
+        pos = self.cmb_pos.get()
+        return self.parent.engine.filter_players(
+            team=None if team == self.ALL_TEAMS else team.split(":", 1)[0].strip(),
+            positions=None if pos == self.ALL_POSITIONS else [pos],
+            age_min=self.ent_age_min.get().strip(),
+            age_max=self.ent_age_max.get().strip(),
+        )
+
+    def _do_count(self):
+        try:
+            self.lbl_result.configure(text=f"{len(self._filtered_rows())} players match.")
+        except Exception as e:
+            messagebox.showerror("Filter Error", str(e), parent=self)
+
+    def _do_apply(self):
+        stat = self.cmb_stat.get().split(":", 1)[0].strip()
+        if not stat:
+            return
+        try:
+            rows = self._filtered_rows()
+            changed = self.parent.engine.bulk_stat(stat, self.cmb_op.get(), self.ent_value.get().strip(),
+                                                   rows, self.target.get())
+        except Exception as e:
+            messagebox.showerror("Bulk Edit Error", str(e), parent=self)
+            return
+        self.lbl_result.configure(text=f"{stat}: changed {changed} of {len(rows)} matching players.")
+
+        # Refresh the parent's views
+        self.parent.refresh_players_for_team()
+        self.parent.refresh_stats_for_player()
+
+
+class DiagnosticsDialog(tk.Toplevel):
+    """Live view of the profiler's per-method latency stats (only offered when profiling is on)."""
+    COLUMNS = ("name", "count", "p50_ms", "p95_ms", "max_ms")
+
+    def __init__(self, parent, profiler):
+        super().__init__(parent)
+        self.title("Diagnostics - hot-path timings")
+        self.geometry("720x420")
+        self.profiler = profiler
+        self._job = None
+        self._build()
+        self._refresh()
+
+    def _build(self):
+        self.tree = ttk.Treeview(self, columns=self.COLUMNS, show="headings")
+        for c, w in zip(self.COLUMNS, [320, 80, 90, 90, 90]):
+            self.tree.heading(c, text=c)
+            self.tree.column(c, width=w, anchor="w" if c == "name" else "e")
+        self.tree.pack(fill="both", expand=True, padx=10, pady=(10, 6))
+
+        bottom = ttk.Frame(self)
+        bottom.pack(fill="x", padx=10, pady=(0, 10))
+        ttk.Button(bottom, text="Dump to File...", command=self._do_dump).pack(side="left")
+        ttk.Button(bottom, text="Reset", command=self._do_reset).pack(side="left", padx=(8, 0))
+        ttk.Button(bottom, text="Close", command=self.destroy).pack(side="right")
+
+    def _refresh(self):
+        self.tree.delete(*self.tree.get_children())
+        for st in self.profiler.stats():
+            self.tree.insert("", tk.END, values=(st["name"], st["count"], f"{st['p50_ms']:.2f}",
+                                                 f"{st['p95_ms']:.2f}", f"{st['max_ms']:.2f}"))
+        self._job = self.after(DIAGNOSTICS_REFRESH_MS, self._refresh)
+
+    def _do_reset(self):
+        self.profiler.reset()
+
+    def _do_dump(self):
+        path = filedialog.asksaveasfilename(parent=self, title="Save timings", defaultextension=".json",
+                                            filetypes=[("JSON", "*.json"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            self.profiler.dump(path)
+        except OSError as e:
+            messagebox.showerror("Save Error", str(e), parent=self)
+
+    def destroy(self):
+        if self._job is not None:
+            self.after_cancel(self._job)
+            self._job = None
+        super().destroy()
+
+
+class App(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        # Profiling (HC09_PROFILE): wrap the handlers before _build_ui binds them as callbacks
+        self.profiler = get_profiler()
+        if self.profiler is not None:
+            self.profiler.instrument(type(self), [n for n in dir(type(self)) if n.startswith(PROFILED_APP_PREFIXES)])
+
+        self.title("HC09 CSV Editor (GUI) - Safe Trades")
+        self.geometry("1320x820")
+        self.minsize(1180, 700)
+
+        self.model = CSVModel(columnar=True, snapshots=True)
+        self._engine = None
+
+        self.selected_team_id = tk.StringVar(value="")
+        self.selected_player_index = None
+        self.selected_stat_key = None
+        self._player_index_map = []
+        self._pick_index_map = []  # For acquire picks dropdown mapping
+        self._detected_salary_col = ""
+        self._detected_bonus_col = ""
+
+        # Background load state (see _start_load / _poll_load)
+        self.load_mode = LOAD_THREADS  # LOAD_SEQUENTIAL to fall back, LOAD_PROCESSES for multi-core parsing
+        self._load_thread = None
+        self._load_queue = None
+        self._load_cancel = None
+        self._load_total_bytes = 0
+        self._load_done_bytes = {}
+
+        self._build_ui()
+
+    @property
+    def engine(self):
+        """EditEngine for the current model (the model is replaced on every load)."""
+        if self._engine is None or self._engine.model is not self.model:
+            self._engine = EditEngine(self.model)
+        return self._engine
+
+    # ---------- UI layout ----------
+    def _build_ui(self):
+        top = ttk.Frame(self)
+        top.pack(fill="x", padx=10, pady=8)
+
+        self.btn_load = ttk.Button(top, text="Load CSVs", command=self.on_load)
+        self.btn_load.pack(side="left")
+        ttk.Button(top, text="Save CSVs", command=self.on_save).pack(side="left", padx=(8, 0))
+        self.save_in_place = tk.BooleanVar(value=False)
+        ttk.Checkbutton(top, text="Save in place (keeps .bak)", variable=self.save_in_place).pack(side="left", padx=(8, 0))
+        ttk.Button(top, text="Undo", width=6, command=self.on_undo).pack(side="left", padx=(8, 0))
+        ttk.Button(top, text="Redo", width=6, command=self.on_redo).pack(side="left", padx=(4, 0))
+        self.bind_all("<Control-z>", self.on_undo)
+        self.bind_all("<Control-y>", self.on_redo)
+        self.bind_all("<Control-Z>", self.on_redo)  # Ctrl+Shift+Z
+        ttk.Button(top, text="Export Patch", command=self.on_export_patch).pack(side="left", padx=(8, 0))
+        ttk.Button(top, text="Apply Patch", command=self.on_apply_patch).pack(side="left", padx=(4, 0))
+
+        ttk.Separator(top, orient="vertical").pack(side="left", fill="y", padx=10)
+
+        ttk.Button(top, text="HC09-SAFE SWAP TRADE", command=self.on_open_swap_trade).pack(side="left")
+        self.btn_move_trade = ttk.Button(top, text="Move Player → Selected Team", command=self.on_move_trade_to_selected_team)
+        self.btn_move_trade.pack(side="left", padx=(8, 0))
+        ttk.Button(top, text="Bulk Stat Edit", command=self.on_open_bulk_stat).pack(side="left", padx=(8, 0))
+        if self.profiler is not None:
+            ttk.Button(top, text="Diagnostics", command=self.on_open_diagnostics).pack(side="left", padx=(8, 0))
+
+        self.lbl_status = ttk.Label(top, text="Load play.csv to begin.")
+        self.lbl_status.pack(side="left", padx=12)
+
+        self.lbl_dirty = ttk.Label(top, text="")
+        self.lbl_dirty.pack(side="left", padx=(0, 12))
+
+        self.btn_cancel_load = ttk.Button(top, text="Cancel", command=self.on_cancel_load)
+        self.btn_cancel_load.pack(side="right")
+        self.btn_cancel_load.state(["disabled"])
+        self.pb_load = ttk.Progressbar(top, length=180, mode="determinate", maximum=1.0)
+        self.pb_load.pack(side="right", padx=(0, 6))
+
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.tab_players = ttk.Frame(self.notebook)
+        self.tab_picks = ttk.Frame(self.notebook)
+        self.tab_cap = ttk.Frame(self.notebook)
+
+        self.notebook.add(self.tab_players, text="Players + Stats")
+        self.notebook.add(self.tab_picks, text="Draft Picks")
+        self.notebook.add(self.tab_cap, text="Salary Cap")
+
+        self._build_players_tab()
+        self._build_picks_tab()
+        self._build_cap_tab()
+        # New staff tabs
+        self._build_trainer_tab()
+        self._build_coach_tab()
+        self._build_gm_tab()
+
+    def _build_players_tab(self):
+        root = self.tab_players
+
+        # Left: Player search + Teams
+        left = ttk.Frame(root)
+        left.pack(side="left", fill="y", padx=(0, 8), pady=6)
+
+        # Search all players by name (index built at load); picking a result jumps to team + row
+        ttk.Label(left, text="Find player (first / last / \"first last\")").pack(anchor="w")
+        self.player_search_var = tk.StringVar()
+        self.ent_player_search = ttk.Entry(left, textvariable=self.player_search_var, width=30)
+        self.ent_player_search.pack(fill="x")
+        self._player_search_job = None
+        self._player_search_hits = []  # model idx per results row
+        self.player_search_var.trace_add("write", lambda *_: self._schedule_player_search())
+        self.ent_player_search.bind("<Return>", lambda e: self.refresh_player_search())
+        self.lst_player_search = tk.Listbox(left, height=8, exportselection=False)
+        self.lst_player_search.pack(fill="x", pady=(2, 8))
+        self.lst_player_search.bind("<<ListboxSelect>>", self.on_player_search_select)
+
+        ttk.Label(left, text="Teams").pack(anchor="w")
+        self.lst_teams = tk.Listbox(left, height=18, exportselection=False)
+        self.lst_teams.pack(fill="y")
+        self.lst_teams.bind("<<ListboxSelect>>", self.on_team_select)
+
+        # Middle: Players
+        mid = ttk.Frame(root)
+        mid.pack(side="left", fill="both", expand=True, padx=(0, 8), pady=6)
+
+        ttk.Label(mid, text="Players on Team (play.csv)").pack(anchor="w")
+        self.lst_players = tk.Listbox(mid, height=28, exportselection=False)
+        self.lst_players.pack(fill="both", expand=True)
+        self.lst_players.bind("<<ListboxSelect>>", self.on_player_select)
+
+        # Right: Name editor + Stats editor + Raw editor
+        right = ttk.Frame(root)
+        right.pack(side="left", fill="both", expand=True, pady=6)
+
+        # --- Name Editor ---
+        namefrm = ttk.LabelFrame(right, text="Name Editor (PFNA / PLNA) (sanitized to avoid crashes)")
+        namefrm.pack(fill="x", pady=(0, 10))
+
+        ttk.Label(namefrm, text="First (PFNA)").grid(row=0, column=0, sticky="w")
+        self.ent_first = ttk.Entry(namefrm, width=22)
+        self.ent_first.grid(row=0, column=1, sticky="w", padx=6)
+
+        ttk.Label(namefrm, text="Last (PLNA)").grid(row=0, column=2, sticky="w", padx=(10, 0))
+        self.ent_last = ttk.Entry(namefrm, width=22)
+        self.ent_last.grid(row=0, column=3, sticky="w", padx=6)
+
+        ttk.Button(namefrm, text="Apply Name", command=self.on_apply_name).grid(row=0, column=4, sticky="w", padx=8)
+        namefrm.grid_columnconfigure(5, weight=1)
+
+        ttk.Label(right, text="Stats (described only)").pack(anchor="w")
+
+        cols = ("stat", "cur_col", "cur_val", "max_col", "max_val")
+        self.tree_stats = ttk.Treeview(right, columns=cols, show="headings", height=16)
+        for c, w in zip(cols, [260, 90, 80, 90, 80]):
+            self.tree_stats.heading(c, text=c)
+            self.tree_stats.column(c, width=w, anchor="w")
+        self.tree_stats.pack(fill="both", expand=True)
+        self.tree_stats.bind("<<TreeviewSelect>>", self.on_stat_select)
+
+        self.txt_desc = tk.Text(right, height=4, wrap="word")
+        self.txt_desc.pack(fill="x", pady=(8, 8))
+        self.txt_desc.configure(state="disabled")
+
+        edit = ttk.Frame(right)
+        edit.pack(fill="x")
+
+        ttk.Label(edit, text="New CURRENT").grid(row=0, column=0, sticky="w")
+        self.ent_new_cur = ttk.Entry(edit, width=10)
+        self.ent_new_cur.grid(row=0, column=1, sticky="w", padx=(6, 10))
+
+        ttk.Label(edit, text="New MAX").grid(row=0, column=2, sticky="w")
+        self.ent_new_max = ttk.Entry(edit, width=10)
+        self.ent_new_max.grid(row=0, column=3, sticky="w", padx=(6, 10))
+
+        ttk.Button(edit, text="Apply", command=self.on_apply_stat).grid(row=0, column=4, sticky="w")
+        ttk.Button(edit, text="Set Both (Max then Cur)", command=self.on_apply_both).grid(row=0, column=5, sticky="w", padx=(8, 0))
+
+        info = ttk.Frame(right)
+        info.pack(fill="x", pady=(10, 0))
+
+        ttk.Label(info, text="Age").grid(row=0, column=0, sticky="w")
+        self.ent_age = ttk.Entry(info, width=8)
+        self.ent_age.grid(row=0, column=1, sticky="w", padx=(6, 16))
+        ttk.Label(info, text="Years").grid(row=0, column=2, sticky="w")
+        self.ent_years = ttk.Entry(info, width=8)
+        self.ent_years.grid(row=0, column=3, sticky="w", padx=(6, 16))
+        ttk.Button(info, text="Apply Age/Years", command=self.on_apply_age_years).grid(row=0, column=4, sticky="w")
+
+        contract = ttk.LabelFrame(right, text="Contract Editor (salary / bonus in play.csv)")
+        contract.pack(fill="x", pady=(10, 0))
+
+        ttk.Label(contract, text="Salary Col").grid(row=0, column=0, sticky="w")
+        self.cmb_salary_col = ttk.Combobox(contract, width=16, state="readonly")
+        self.cmb_salary_col.grid(row=0, column=1, sticky="w", padx=6)
+        self.cmb_salary_col.bind("<<ComboboxSelected>>", lambda e: self.on_contract_column_changed())
+
+        ttk.Label(contract, text="Salary Value").grid(row=0, column=2, sticky="w", padx=(10, 0))
+        self.ent_salary_val = ttk.Entry(contract, width=16)
+        self.ent_salary_val.grid(row=0, column=3, sticky="w", padx=6)
+
+        ttk.Label(contract, text="Bonus Col").grid(row=1, column=0, sticky="w", pady=(6, 0))
+        self.cmb_bonus_col = ttk.Combobox(contract, width=16, state="readonly")
+        self.cmb_bonus_col.grid(row=1, column=1, sticky="w", padx=6, pady=(6, 0))
+        self.cmb_bonus_col.bind("<<ComboboxSelected>>", lambda e: self.on_contract_column_changed())
+
+        ttk.Label(contract, text="Bonus Value").grid(row=1, column=2, sticky="w", padx=(10, 0), pady=(6, 0))
+        self.ent_bonus_val = ttk.Entry(contract, width=16)
+        self.ent_bonus_val.grid(row=1, column=3, sticky="w", padx=6, pady=(6, 0))
+
+        ttk.Button(contract, text="Apply Salary/Bonus", command=self.on_apply_contract).grid(
+            row=0, column=4, rowspan=2, sticky="w", padx=(8, 0)
+        )
+
+        self.lbl_contract_status = ttk.Label(contract, text="Load play.csv to detect contract columns.")
+        self.lbl_contract_status.grid(row=2, column=0, columnspan=5, sticky="w", pady=(8, 0))
+
+        # Raw column editor (ANY column)
+        raw = ttk.LabelFrame(right, text="Raw Column Editor (any header)")
+        raw.pack(fill="x", pady=(10, 0))
+
+        ttk.Label(raw, text="Column").grid(row=0, column=0, sticky="w")
+        self.cmb_raw_col = ttk.Combobox(raw, width=22, state="readonly")
+        self.cmb_raw_col.grid(row=0, column=1, sticky="w", padx=6)
+
+        ttk.Label(raw, text="Value").grid(row=0, column=2, sticky="w", padx=(10, 0))
+        self.ent_raw_val = ttk.Entry(raw, width=26)
+        self.ent_raw_val.grid(row=0, column=3, sticky="w", padx=6)
+
+        ttk.Button(raw, text="Apply", command=self.on_apply_raw_column).grid(row=0, column=4, sticky="w", padx=8)
+
+    def _build_picks_tab(self):
+        root = self.tab_picks
+        top = ttk.Frame(root)
+        top.pack(fill="x", padx=10, pady=10)
+
+        ttk.Label(top, text="Draft Picks (drpk.csv)").pack(side="left")
+        ttk.Button(top, text="Refresh", command=self.refresh_picks).pack(side="left", padx=8)
+
+        cols = ("team", "pick", "year_offset")
+        self.tree_picks = ttk.Treeview(root, columns=cols, show="headings", height=22)
+        for c, w in zip(cols, [320, 120, 120]):
+            self.tree_picks.heading(c, text=c)
+            self.tree_picks.column(c, width=w, anchor="w")
+        self.tree_picks.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        bottom = ttk.Frame(root)
+        bottom.pack(fill="x", padx=10, pady=(0, 10))
+
+        ttk.Label(bottom, text="Acquire picks: From Team").pack(side="left")
+        self.cmb_pick_from = ttk.Combobox(bottom, width=24, state="readonly")
+        team_vals = [f"{tid}: {name}" for tid, name in TEAM_NAMES.items()]
+        self.cmb_pick_from["values"] = team_vals
+        self.cmb_pick_from.pack(side="left", padx=6)
+        self.cmb_pick_from.bind("<<ComboboxSelected>>", self._on_from_team_changed)
+
+        ttk.Label(bottom, text="→ To Team").pack(side="left", padx=(10, 0))
+        self.cmb_pick_to = ttk.Combobox(bottom, width=24, state="readonly")
+        self.cmb_pick_to["values"] = team_vals
+        self.cmb_pick_to.pack(side="left", padx=6)
+
+        ttk.Label(bottom, text="Pick(s)").pack(side="left", padx=(10, 0))
+        self.cmb_pick_idxs = ttk.Combobox(bottom, width=30, state="readonly")
+        self.cmb_pick_idxs.pack(side="left", padx=6)
+
+        ttk.Button(bottom, text="Acquire", command=self.on_acquire_picks).pack(side="left", padx=8)
+        ttk.Button(bottom, text="Trade Builder...", command=self.on_open_pick_trade).pack(side="left")
+
+    def _build_cap_tab(self):
+        root = self.tab_cap
+        frm = ttk.Frame(root)
+        frm.pack(fill="x", padx=10, pady=14)
+
+        ttk.Label(frm, text="Salary Cap (slri.csv)").grid(row=0, column=0, sticky="w")
+        self.ent_cap = ttk.Entry(frm, width=18)
+        self.ent_cap.grid(row=0, column=1, sticky="w", padx=8)
+        ttk.Button(frm, text="Set to Max", command=self.set_cap_to_max).grid(row=0, column=2, sticky="w", padx=4)
+        ttk.Button(frm, text="Click to apply changes (max 4,294,967,295)", command=self.on_apply_cap).grid(row=0, column=3, sticky="w", padx=4)
+
+        self.lbl_cap_status = ttk.Label(root, text="Load slri.csv to edit cap.")
+        self.lbl_cap_status.pack(anchor="w", padx=10, pady=(8, 0))
+
+    # ---------- Staff Tabs (Trainer / Coach / GM) ----------
+    def _build_trainer_tab(self):
+        root = ttk.Frame(self.notebook)
+        self.tab_trainer = root
+        self.notebook.add(self.tab_trainer, text="Trainer")
+
+        top = ttk.Frame(root)
+        top.pack(fill="x", padx=10, pady=10)
+        ttk.Label(top, text="Trainer (trvw.csv)").pack(side="left")
+        ttk.Button(top, text="Refresh", command=self.refresh_trainer).pack(side="left", padx=8)
+
+        self.tree_trainer = VirtualTreeview(root, height=20)
+        self.tree_trainer.pack(fill="both", expand=True, padx=10, pady=(0, 6))
+
+        # Bottom editor for SKPT
+        btm = ttk.Frame(root)
+        btm.pack(fill="x", padx=10, pady=(0, 10))
+        ttk.Label(btm, text="Selected SKPT:").pack(side="left")
+        self.ent_trainer_skpt = ttk.Entry(btm, width=12)
+        self.ent_trainer_skpt.pack(side="left", padx=(6, 8))
+        ttk.Button(btm, text="Set to Max", command=self.set_trainer_skpt_to_max).pack(side="left", padx=4)
+        ttk.Button(btm, text="Apply SKPT", command=self._apply_trainer_skpt).pack(side="left")
+        self.tree_trainer.bind_select(self._on_trainer_select)
+        self.tree_trainer.tree.bind("<Double-1>", lambda e: self._on_tree_double_click(e, self.tree_trainer))
+
+    def _build_coach_tab(self):
+        root = ttk.Frame(self.notebook)
+        self.tab_coach = root
+        self.notebook.add(self.tab_coach, text="Coach")
+
+        top = ttk.Frame(root)
+        top.pack(fill="x", padx=10, pady=10)
+        ttk.Label(top, text="Coach (coch.csv)").pack(side="left")
+        ttk.Button(top, text="Refresh", command=self.refresh_coach).pack(side="left", padx=8)
+
+        # Search controls for coach first/last name
+        self.coach_search_var = tk.StringVar()
+        ttk.Label(top, text="Search (First Last):").pack(side="left", padx=(12, 4))
+        self.ent_coach_search = ttk.Entry(top, textvariable=self.coach_search_var, width=20)
+        self.ent_coach_search.pack(side="left")
+        # live filter (debounced); Find / Enter still filter immediately
+        self._coach_search_job = None
+        self._coach_sorted = None  # [(sort key, model idx)] for all coaches, reused while typing
+        self.coach_search_var.trace_add("write", lambda *_: self._schedule_coach_search())
+        self.ent_coach_search.bind("<Return>", lambda e: self.refresh_coach())
+        ttk.Button(top, text="Find", command=lambda: self.refresh_coach()).pack(side="left", padx=(6, 4))
+        ttk.Button(top, text="Clear", command=lambda: (self.coach_search_var.set(""), self.refresh_coach())).pack(side="left")
+
+        # Detailed help text explaining coach numeric fields (from guide)
+        help_text = (
+            "Strategy (CSPC): Defines a coach's ability to make worthwhile adjustments and suggestions on game day.\n\n"
+            "Play Call (SKPC): How good a coach is at calling plays. Raise this if you plan to let the CPU handle play calling.\n\n"
+            "Max Performance (SKPA): The coach's maximum performance potential — higher values raise the ceiling of performance reported to this coach.\n\n"
+            "Performance (SKPF): Current coach performance level affecting gameplay success rates for players who report to this coach.\n\n"
+            "Team Chemistry (CHEM): Defines a coach's ability to add innovative and effective plays to the team's playbook; raise if editing playbooks.\n\n"
+            "All values are 1–7 and will be clamped to that range. Increasing above 5 may provide diminishing or undocumented returns."
+        )
+        # place the help below the top controls so it wraps across full width
+        # place help in its own frame below the controls so it can span the full width
+        help_frame = ttk.Frame(root)
+        help_frame.pack(fill="x", padx=10)
+        tk.Label(help_frame, text=help_text, wraplength=1000, justify="left", fg="gray").pack(fill="x", pady=(6,0))
+
+        self.tree_coach = VirtualTreeview(root, height=20)
+        self.tree_coach.pack(fill="both", expand=True, padx=10, pady=(0, 6))
+
+        # Bottom editor for SKPT
+        btm = ttk.Frame(root)
+        btm.pack(fill="x", padx=10, pady=(0, 10))
+        ttk.Label(btm, text="Selected SKPT:").pack(side="left")
+        self.ent_coach_skpt = ttk.Entry(btm, width=12)
+        self.ent_coach_skpt.pack(side="left", padx=(6, 8))
+        ttk.Button(btm, text="Set to Max", command=self.set_coach_skpt_to_max).pack(side="left", padx=4)
+        ttk.Button(btm, text="Apply SKPT", command=self._apply_coach_skpt).pack(side="left")
+        self.tree_coach.bind_select(self._on_coach_select)
+        self.tree_coach.tree.bind("<Double-1>", lambda e: self._on_tree_double_click(e, self.tree_coach))
+
+    def _build_gm_tab(self):
+        root = ttk.Frame(self.notebook)
+        self.tab_gm = root
+        self.notebook.add(self.tab_gm, text="GM")
+
+        top = ttk.Frame(root)
+        top.pack(fill="x", padx=10, pady=10)
+        ttk.Label(top, text="GM (gmvw.csv)").pack(side="left")
+        ttk.Button(top, text="Refresh", command=self.refresh_gm).pack(side="left", padx=8)
+
+        self.tree_gm = VirtualTreeview(root, height=20)
+        self.tree_gm.pack(fill="both", expand=True, padx=10, pady=(0, 6))
+
+        # Bottom editor for SKPT
+        btm = ttk.Frame(root)
+        btm.pack(fill="x", padx=10, pady=(0, 10))
+        ttk.Label(btm, text="Selected SKPT:").pack(side="left")
+        self.ent_gm_skpt = ttk.Entry(btm, width=12)
+        self.ent_gm_skpt.pack(side="left", padx=(6, 8))
+        ttk.Button(btm, text="Set to Max", command=self.set_gm_skpt_to_max).pack(side="left", padx=4)
+        ttk.Button(btm, text="Apply SKPT", command=self._apply_gm_skpt).pack(side="left")
+        self.tree_gm.bind_select(self._on_gm_select)
+        self.tree_gm.tree.bind("<Double-1>", lambda e: self._on_tree_double_click(e, self.tree_gm))
+
+    # ---------- Load / Save ----------
+    def on_load(self):
+        try:
+            play = filedialog.askopenfilename(
+                title="Select play.csv (players)",
+                filetypes=[("CSV", "*.csv"), ("All files", "*.*")]
+            )
+            if not play:
+                return
+
+            drpk = filedialog.askopenfilename(
+                title="Optional: Select drpk.csv (draft picks)",
+                filetypes=[("CSV", "*.csv"), ("All files", "*.*")]
+            )
+            slri = filedialog.askopenfilename(
+                title="Optional: Select slri.csv (salary cap)",
+                filetypes=[("CSV", "*.csv"), ("All files", "*.*")]
+            )
+
+            trainer = filedialog.askopenfilename(
+                title="Optional: Select trainer.csv (staff)",
+                filetypes=[("CSV", "*.csv"), ("All files", "*.*")]
+            )
+            coach = filedialog.askopenfilename(
+                title="Optional: Select coach.csv (staff)",
+                filetypes=[("CSV", "*.csv"), ("All files", "*.*")]
+            )
+            gm = filedialog.askopenfilename(
+                title="Optional: Select gm.csv (staff)",
+                filetypes=[("CSV", "*.csv"), ("All files", "*.*")]
+            )
+
+            self._start_load(play, drpk, slri, trainer, coach, gm)
+
+        except Exception as e:
+            messagebox.showerror("Load Error", str(e))
+
+    def _start_load(self, *paths):
+        """Parse the CSVs into a fresh CSVModel on a worker thread; _poll_load() picks up the result."""
+        if self._load_thread is not None:
+            return
+        model = CSVModel(columnar=self.model.columnar, snapshots=self.model.snapshots)
+        q = queue.Queue()
+        cancel = threading.Event()
+
+        def progress(path, rows, bytes_read, total):
+            q.put(("progress", path, rows, bytes_read, total))
+
+        def work():
+            try:
+                model.load_all(*paths, progress=progress, cancel=cancel, mode=self.load_mode)
+                q.put(("done", model))
+            except LoadCancelled:
+                q.put(("cancelled",))
+            except Exception as e:
+                q.put(("error", e))
+
+        self._load_queue = q
+        self._load_cancel = cancel
+        self._load_total_bytes = sum(os.path.getsize(p) for p in paths if p and os.path.isfile(p)) or 1
+        self._load_done_bytes = {}
+        self.pb_load["value"] = 0
+        self.btn_load.state(["disabled"])
+        self.btn_cancel_load.state(["!disabled"])
+        self.lbl_status.configure(text="Loading...")
+
+        self._load_thread = threading.Thread(target=work, name="csv-load", daemon=True)
+        self._load_thread.start()
+        self.after(LOAD_POLL_MS, self._poll_load)
+
+    def on_cancel_load(self):
+        if self._load_cancel is not None:
+            self._load_cancel.set()
+            self.lbl_status.configure(text="Cancelling load...")
+
+    def _poll_load(self):
+        msg = None
+        try:
+            while True:
+                msg = self._load_queue.get_nowait()
+                if msg[0] != "progress":
+                    break
+                _, path, rows, bytes_read, total = msg
+                self._load_done_bytes[path] = bytes_read
+                self.pb_load["value"] = sum(self._load_done_bytes.values()) / self._load_total_bytes
+                self.lbl_status.configure(
+                    text=f"Loading {os.path.basename(path)}: {rows:,} rows  ({bytes_read / 1e6:.1f} / {total / 1e6:.1f} MB)"
+                )
+        except queue.Empty:
+            pass
+
+        if msg is None or msg[0] == "progress":
+            self.after(LOAD_POLL_MS, self._poll_load)
+            return
+
+        self._load_thread = None
+        self.btn_load.state(["!disabled"])
+        self.btn_cancel_load.state(["disabled"])
+        self.pb_load["value"] = 0
+
+        kind = msg[0]
+        if kind == "cancelled":
+            self.lbl_status.configure(text="Load cancelled.")
+        elif kind == "error":
+            self.lbl_status.configure(text="Load failed.")
+            messagebox.showerror("Load Error", str(msg[1]))
+        else:
+            self.model = msg[1]
+            self.model.dirty_callback = self._update_dirty_status
+            self._update_dirty_status()
+            self._after_load()
+
+    def _update_dirty_status(self):
+        files = self.model.dirty_files()
+        self.lbl_dirty.configure(text=("Unsaved: " + ", ".join(files)) if files else "")
+
+    def _after_load(self):
+        try:
+            if not self.model.team_col:
+                messagebox.showwarning(
+                    "Team Column Not Found",
+                    "Could not detect a team column in play.csv (case-sensitive search: TID/TEAM/TMID/TGID)."
+                )
+
+            timings = self.model.load_timing_report()
+            self.lbl_status.configure(
+                text=f"Loaded: {os.path.basename(self.model.play_path)}  | TeamCol={self.model.team_col or 'N/A'}  | Players={len(self.model.players)}"
+                     + (f"  | Slowest: {timings[0]}" if timings else "")
+            )
+
+            # enable/disable move-trade button
+            # If team col is TGID, we do NOT want to change it (your requirement).
+            if (self.model.team_col or "") == "TGID":
+                self.btn_move_trade.state(["disabled"])
+            else:
+                self.btn_move_trade.state(["!disabled"])
+
+            self.selected_player_index = None
+            self.refresh_teams()
+            self.refresh_player_search()
+            self.refresh_picks()
+            self.refresh_cap()
+            self.refresh_trainer()
+            self._coach_sorted = None
+            self.refresh_coach()
+            self.refresh_gm()
+            self.refresh_contract_columns()
+            self.refresh_raw_columns()
+            self._select_default_team()
+
+        except Exception as e:
+            messagebox.showerror("Load Error", str(e))
+
+    def on_save(self):
+        try:
+            if not self.model.players:
+                messagebox.showinfo("Nothing to save", "Load CSVs first.")
+                return
+
+            # Only tables with edits are written; untouched files are skipped.
+            in_place = self.save_in_place.get()
+            outs = [self.model.save_table(t, in_place=in_place) for t in self.model.dirty_tables()]
+            if not outs:
+                messagebox.showinfo("Nothing to save", "No unsaved changes.")
+                return
+
+            messagebox.showinfo("Saved", "Saved:\n\n" + "\n".join(outs))
+        except Exception as e:
+            messagebox.showerror("Save Error", str(e))
+
+    # ---------- Undo / Redo ----------
+    def on_undo(self, event=None):
+        self._replay_edit(self.model.undo, "Undo")
+        return "break"
+
+    def on_redo(self, event=None):
+        self._replay_edit(self.model.redo, "Redo")
+        return "break"
+
+    def _replay_edit(self, step, verb):
+        try:
+            result = step()
+        except Exception as e:
+            messagebox.showerror(f"{verb} Error", str(e))
+            return
+        if result is None:
+            self.lbl_status.configure(text=f"Nothing to {verb.lower()}.")
+            return
+        label, tables = result
+        self._refresh_tables(tables)
+        self.lbl_status.configure(text=f"{verb}: {label}")
+
+    def _refresh_tables(self, tables):
+        """Refresh only the views showing `tables`."""
+        if "players" in tables:
+            self.refresh_players_for_team()
+            self.refresh_player_search()
+            self.refresh_stats_for_player()
+            self.refresh_contract_values()
+        if "picks" in tables:
+            self.refresh_picks()
+        if "salaries" in tables:
+            self.refresh_cap()
+        if "trainers" in tables:
+            self.refresh_trainer()
+        if "coaches" in tables:
+            self._coach_sorted = None
+            self.refresh_coach()
+        if "gms" in tables:
+            self.refresh_gm()
+
+    # ---------- Patch files ----------
+    def on_export_patch(self):
+        patch = self.engine.make_patch()
+        if not patch["tables"]:
+            messagebox.showinfo("Nothing to export", "No edits to export.")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Save edits as patch",
+            defaultextension=".hc09patch",
+            filetypes=[("HC09 patch", "*.hc09patch"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            save_patch(patch, path)
+            n = sum(len(spec["rows"]) for spec in patch["tables"].values())
+            messagebox.showinfo("Patch saved", f"{n} edited rows written to:\n\n{path}")
+        except Exception as e:
+            messagebox.showerror("Patch Error", str(e))
+
+    def on_apply_patch(self):
+        if not self.model.players:
+            messagebox.showinfo("Load first", "Load play.csv first.")
+            return
+        path = filedialog.askopenfilename(
+            title="Select patch to replay",
+            filetypes=[("HC09 patch", "*.hc09patch"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            report = self.engine.apply_patch(load_patch(path), label=f"Patch {os.path.basename(path)}")
+        except Exception as e:
+            messagebox.showerror("Patch Error", str(e))
+            return
+        self._refresh_tables(set(TABLES))
+        messagebox.showinfo("Patch applied", patch_summary(report))
+
+    # ---------- Teams / Players ----------
+    def refresh_teams(self):
+        self.lst_teams.delete(0, tk.END)
+        for tid, name in TEAM_NAMES.items():
+            self.lst_teams.insert(tk.END, f"{tid}: {name}")
+
+    def _select_default_team(self):
+        target = "33"  # Free Agents
+        idx = None
+        for i in range(self.lst_teams.size()):
+            if self.lst_teams.get(i).startswith(target + ":"):
+                idx = i
+                break
+        if idx is None and self.lst_teams.size() > 0:
+            idx = 0
+        if idx is not None:
+            self.lst_teams.selection_clear(0, tk.END)
+            self.lst_teams.selection_set(idx)
+            self.lst_teams.activate(idx)
+            self.on_team_select()
+
+    def _select_team(self, tid):
+        """Highlight `tid` in the team list (if listed) and show its roster."""
+        self.lst_teams.selection_clear(0, tk.END)
+        for i in range(self.lst_teams.size()):
+            if self.lst_teams.get(i).startswith(tid + ":"):
+                self.lst_teams.selection_set(i)
+                self.lst_teams.activate(i)
+                self.lst_teams.see(i)
+                break
+        self.selected_team_id.set(tid)
+        self.refresh_players_for_team()
+
+    def on_team_select(self, event=None):
+        sel = self.lst_teams.curselection()
+        if not sel:
+            return
+        txt = self.lst_teams.get(sel[0])
+        tid = txt.split(":", 1)[0].strip()
+        self.selected_team_id.set(tid)
+        self.refresh_players_for_team()
+
+    def refresh_players_for_team(self):
+        self.lst_players.delete(0, tk.END)
+        self.selected_player_index = None
+        self.clear_stats_view()
+
+        tid = self.selected_team_id.get()
+        if not tid or not self.model.players:
+            return
+
+        # Roster order (position, first name, last name) is kept sorted by the model
+        self._player_index_map = self.model.roster(tid)
+        for i in self._player_index_map:
+            self.lst_players.insert(tk.END, self._player_line(i))
+
+        if self.lst_players.size() > 0:
+            self.lst_players.selection_set(0)
+            self.lst_players.activate(0)
+            self.on_player_select()
+
+    def _player_line(self, idx):
+        r = self.model.players[idx]
+        age = (r.get(AGE_COL, "") or "").strip()
+        yrs = (r.get(YEARS_COL, "") or "").strip()
+        return f"{self.model.player_pos(r)}  {self.model.player_name(r)}   (Age:{age or '-'} Yrs:{yrs or '-'})"
+
+    def _update_player_row(self, idx):
+        """
+        Redraw one edited player in the roster list without rebuilding it: the line is moved only
+        if the model repositioned the row (or dropped, if the player left the team). Keeps the selection.
+        """
+        old = self._player_index_map.index(idx) if idx in self._player_index_map else None
+        new = self.model.roster_position(self.selected_team_id.get(), idx)
+        if old is not None:
+            self.lst_players.delete(old)
+            del self._player_index_map[old]
+        if new is not None:
+            self.lst_players.insert(new, self._player_line(idx))
+            self._player_index_map.insert(new, idx)
+        if idx != self.selected_player_index:
+            return
+        if new is None:
+            self.selected_player_index = None
+            self.clear_stats_view()
+            return
+        self.lst_players.selection_clear(0, tk.END)
+        self.lst_players.selection_set(new)
+        self.lst_players.activate(new)
+        self.lst_players.see(new)
+
+    def on_player_select(self, event=None):
+        sel = self.lst_players.curselection()
+        if not sel:
+            return
+        lb_idx = sel[0]
+        real_idx = self._player_index_map[lb_idx]
+        self.selected_player_index = real_idx
+        self.refresh_stats_for_player()
+
+        r = self.model.players[real_idx]
+
+        # Prefill Age/Years
+        self.ent_age.delete(0, tk.END)
+        self.ent_age.insert(0, (r.get(AGE_COL, "") or "").strip())
+        self.ent_years.delete(0, tk.END)
+        self.ent_years.insert(0, (r.get(YEARS_COL, "") or "").strip())
+
+        # Prefill Name Editor
+        self.ent_first.delete(0, tk.END)
+        self.ent_first.insert(0, (r.get(PLAYER_FIRST_NAME_CODE, "") or "").strip())
+        self.ent_last.delete(0, tk.END)
+        self.ent_last.insert(0, (r.get(PLAYER_LAST_NAME_CODE, "") or "").strip())
+
+        # Prefill contract editor
+        self.refresh_contract_values()
+
+        # Prefill raw column value
+        self.on_raw_column_changed()
+
+    # ---------- Player search ----------
+    def refresh_player_search(self):
+        if self._player_search_job is not None:
+            self.after_cancel(self._player_search_job)
+            self._player_search_job = None
+
+        self.lst_player_search.delete(0, tk.END)
+        self._player_search_hits = self.model.find_names("players", self.player_search_var.get(),
+                                                         PLAYER_SEARCH_LIMIT)
+        for i in self._player_search_hits:
+            r = self.model.players[i]
+            tid = self.model.player_team_id(r) if self.model.team_col else ""
+            team = TEAM_NAMES.get(tid, tid or "-")
+            self.lst_player_search.insert(tk.END, f"{self.model.player_pos(r)}  {self.model.player_name(r)}  ({team})")
+
+    def _schedule_player_search(self):
+        """Debounce as-you-type search: run once typing pauses for SEARCH_DEBOUNCE_MS."""
+        if self._player_search_job is not None:
+            self.after_cancel(self._player_search_job)
+        self._player_search_job = self.after(SEARCH_DEBOUNCE_MS, self.refresh_player_search)
+
+    def on_player_search_select(self, event=None):
+        sel = self.lst_player_search.curselection()
+        if not sel:
+            return
+        self.jump_to_player(self._player_search_hits[sel[0]])
+
+    def jump_to_player(self, idx):
+        """Show player `idx`: select its team, then its row in the roster."""
+        r = self.model.players[idx]
+        if self.model.team_col:
+            self._select_team(self.model.player_team_id(r))
+        if idx not in self._player_index_map:
+            return
+        pos = self._player_index_map.index(idx)
+        self.lst_players.selection_clear(0, tk.END)
+        self.lst_players.selection_set(pos)
+        self.lst_players.activate(pos)
+        self.lst_players.see(pos)
+        self.on_player_select()
+
+    # ---------- Name Editor ----------
+    def on_apply_name(self):
+        if self.selected_player_index is None:
+            messagebox.showinfo("No player", "Select a player first.")
+            return
+
+        headers_set = set(self.model.player_headers)
+
+        fn_raw = self.ent_first.get()
+        ln_raw = self.ent_last.get()
+
+        fn = sanitize_name(fn_raw, max_len=15)
+        ln = sanitize_name(ln_raw, max_len=15)
+
+        if fn != fn_raw.strip() or ln != ln_raw.strip():
+            messagebox.showinfo(
+                "Name sanitized",
+                "Your name was sanitized to reduce HC09 crash risk.\n\n"
+                f"First: '{fn_raw.strip()}' -> '{fn}'\n"
+                f"Last:  '{ln_raw.strip()}' -> '{ln}'"
+            )
+
+        for code in (PLAYER_FIRST_NAME_CODE, PLAYER_LAST_NAME_CODE):
+            if code not in headers_set:
+                messagebox.showwarning("Missing column", f"{code} not found in play.csv headers.")
+        self.engine.set_name(self.selected_player_index,
+                             fn_raw if PLAYER_FIRST_NAME_CODE in headers_set else None,
+                             ln_raw if PLAYER_LAST_NAME_CODE in headers_set else None)
+
+        # set_name keeps the model's name index and roster order current; only the views need redrawing
+        self._update_player_row(self.selected_player_index)
+        self.refresh_player_search()
+
+    # ---------- Stats ----------
+    def clear_stats_view(self):
+        for iid in self.tree_stats.get_children():
+            self.tree_stats.delete(iid)
+        self.selected_stat_key = None
+        self._set_desc("")
+        self.ent_new_cur.delete(0, tk.END)
+        self.ent_new_max.delete(0, tk.END)
+
+    def refresh_stats_for_player(self):
+        self.clear_stats_view()
+        if self.selected_player_index is None:
+            return
+        r = self.model.players[self.selected_player_index]
+        headers_set = set(self.model.player_headers)
+
+        for base_key in STAT_META.keys():
+            cur_col = base_key if base_key in headers_set else None
+            max_col = self.model.max_map.get(base_key)
+            if not cur_col and not max_col:
+                continue
+
+            nice, _ = STAT_META.get(base_key, (base_key, ""))
+            cur_val = (r.get(cur_col, "") if cur_col else "")
+            max_val = (r.get(max_col, "") if max_col else "")
+
+            self.tree_stats.insert(
+                "",
+                tk.END,
+                iid=base_key,
+                values=(nice, cur_col or "N/A", cur_val or "-", max_col or "N/A", max_val or "-")
+            )
+
+    def on_stat_select(self, event=None):
+        sel = self.tree_stats.selection()
+        if not sel:
+            return
+        base_key = sel[0]
+        self.selected_stat_key = base_key
+
+        nice, desc = STAT_META.get(base_key, (base_key, ""))
+        self._set_desc(f"{nice} ({base_key})\n\n{desc}")
+
+        r = self.model.players[self.selected_player_index]
+        headers_set = set(self.model.player_headers)
+
+        cur_col = base_key if base_key in headers_set else None
+        max_col = self.model.max_map.get(base_key)
+
+        self.ent_new_cur.delete(0, tk.END)
+        self.ent_new_max.delete(0, tk.END)
+        if cur_col:
+            self.ent_new_cur.insert(0, (r.get(cur_col, "") or "").strip())
+        if max_col:
+            self.ent_new_max.insert(0, (r.get(max_col, "") or "").strip())
+
+    def _set_desc(self, text):
+        self.txt_desc.configure(state="normal")
+        self.txt_desc.delete("1.0", tk.END)
+        self.txt_desc.insert("1.0", text)
+        self.txt_desc.configure(state="disabled")
+
+    def on_apply_stat(self):
+        if self.selected_player_index is None or not self.selected_stat_key:
+            return
+        base_key = self.selected_stat_key
+        idx = self.selected_player_index
+
+        new_cur = self.ent_new_cur.get().strip()
+        new_max = self.ent_new_max.get().strip()
+
+        try:
+            # current and max are clamped, then current is kept <= max
+            self.engine.set_stat(idx, base_key, new_cur, new_max)
+            self.refresh_stats_for_player()
+            self.tree_stats.selection_set(base_key)
+            self.tree_stats.see(base_key)
+        except Exception as e:
+            messagebox.showerror("Apply Error", str(e))
+
+    def on_apply_both(self):
+        if self.selected_player_index is None or not self.selected_stat_key:
+            return
+        base_key = self.selected_stat_key
+        idx = self.selected_player_index
+
+        new_cur = self.ent_new_cur.get().strip()
+        new_max = self.ent_new_max.get().strip()
+
+        try:
+            self.engine.set_stat(idx, base_key, new_cur, new_max)
+            self.refresh_stats_for_player()
+            self.tree_stats.selection_set(base_key)
+            self.tree_stats.see(base_key)
+        except Exception as e:
+            messagebox.showerror("Apply Error", str(e))
+
+    def on_apply_age_years(self):
+        if self.selected_player_index is None:
+            return
+        idx = self.selected_player_index
+        a = self.ent_age.get().strip()
+        y = self.ent_years.get().strip()
+        try:
+            self.engine.set_age_years(idx, a, y)
+            self._update_player_row(idx)
+        except Exception as e:
+            messagebox.showerror("Apply Error", str(e))
+
+    # ---------- Contract Editor ----------
+    def refresh_contract_columns(self):
+        headers = self.model.player_headers or []
+        values = [""] + headers
+        self.cmb_salary_col["values"] = values
+        self.cmb_bonus_col["values"] = values
+
+        self._detected_salary_col, self._detected_bonus_col = detect_contract_columns(headers)
+
+        salary_choice = self._detected_salary_col if self._detected_salary_col in headers else ""
+        bonus_choice = self._detected_bonus_col if self._detected_bonus_col in headers else ""
+
+        self.cmb_salary_col.set(salary_choice)
+        self.cmb_bonus_col.set(bonus_choice)
+
+        status_bits = []
+        if salary_choice:
+            status_bits.append(f"Salary={salary_choice}")
+        else:
+            status_bits.append("Salary not auto-detected")
+        if bonus_choice:
+            status_bits.append(f"Bonus={bonus_choice}")
+        else:
+            status_bits.append("Bonus not auto-detected")
+        self.lbl_contract_status.configure(text=" | ".join(status_bits))
+
+        self.refresh_contract_values()
+
+    def refresh_contract_values(self):
+        if self.selected_player_index is None:
+            self.ent_salary_val.delete(0, tk.END)
+            self.ent_bonus_val.delete(0, tk.END)
+            return
+
+        row = self.model.players[self.selected_player_index]
+        salary_col = self.cmb_salary_col.get().strip()
+        bonus_col = self.cmb_bonus_col.get().strip()
+
+        self.ent_salary_val.delete(0, tk.END)
+        if salary_col:
+            self.ent_salary_val.insert(0, (row.get(salary_col, "") or "").strip())
+
+        self.ent_bonus_val.delete(0, tk.END)
+        if bonus_col:
+            self.ent_bonus_val.insert(0, (row.get(bonus_col, "") or "").strip())
+
+    def on_contract_column_changed(self):
+        self.refresh_contract_values()
+
+    def on_apply_contract(self):
+        if self.selected_player_index is None:
+            messagebox.showinfo("No player", "Select a player first.")
+            return
+
+        salary_col = self.cmb_salary_col.get().strip()
+        bonus_col = self.cmb_bonus_col.get().strip()
+        if not salary_col and not bonus_col:
+            messagebox.showwarning("No columns", "Choose a salary and/or bonus column first.")
+            return
+
+        idx = self.selected_player_index
+
+        try:
+            raw_salary = self.ent_salary_val.get().strip() if salary_col else None
+            raw_bonus = self.ent_bonus_val.get().strip() if bonus_col else None
+            updates = self.engine.set_contract(idx, raw_salary, raw_bonus, salary_col, bonus_col)
+
+            if not updates:
+                messagebox.showwarning("Nothing to apply", "Enter a salary and/or bonus value to update.")
+                return
+
+            self.refresh_contract_values()
+            self._update_player_row(idx)
+            self.refresh_stats_for_player()
+            messagebox.showinfo("Contract updated", "Updated " + ", ".join(updates))
+        except Exception as e:
+            messagebox.showerror("Contract Error", str(e))
+
+    # ---------- Trades ----------
+    def on_open_swap_trade(self):
+        if not self.model.players:
+            messagebox.showinfo("Load first", "Load play.csv first.")
+            return
+        SwapTradeDialog(self, self.model)
+
+    def on_open_bulk_stat(self):
+        if not self.model.players:
+            messagebox.showinfo("Load first", "Load play.csv first.")
+            return
+        BulkStatDialog(self, self.model)
+
+    def on_open_diagnostics(self):
+        DiagnosticsDialog(self, self.profiler)
+
+    def on_move_trade_to_selected_team(self):
+        """
+        Only works if we have a non-TGID team column.
+        Your export: TGID only -> button disabled.
+        """
+        if not self.model.players or self.selected_player_index is None:
+            return
+        if not self.model.team_col:
+            messagebox.showwarning("No team column", "Team column not detected.")
+            return
+        if self.model.team_col == "TGID":
+            messagebox.showwarning(
+                "TGID-only file",
+                "Your play.csv only has TGID as the team column.\n\n"
+                "Use 'HC09-SAFE SWAP TRADE' instead (it does NOT change TGID)."
+            )
+            return
+
+        dest_tid = self.selected_team_id.get()
+        if not dest_tid:
+            return
+
+        r = self.model.players[self.selected_player_index]
+        src_tid = self.model.player_team_id(r)
+
+        if src_tid == dest_tid:
+            messagebox.showinfo("No change", "Player already on that team.")
+            return
+
+        self.model.set_player_team_id(self.selected_player_index, dest_tid)
+        self._update_player_row(self.selected_player_index)
+
+    # ---------- Picks ----------
+    def refresh_picks(self):
+        for iid in self.tree_picks.get_children():
+            self.tree_picks.delete(iid)
+        if not self.model.picks:
+            self.cmb_pick_from.set("")
+            self.cmb_pick_to.set("")
+            self.cmb_pick_idxs.set("")
+            self.cmb_pick_idxs["values"] = []
+            return
+
+        # Sorted by team, then by year offset (0, 1, 3...), round and pick: the model keeps
+        # this order in its pick index (updated per pick on acquire)
+        for orig_idx in self.model.sorted_picks():
+            self.tree_picks.insert("", tk.END, iid=str(orig_idx), values=self._pick_values(orig_idx))
+
+        # Reset dropdowns
+        if self.cmb_pick_from["values"]:
+            self.cmb_pick_from.current(0)
+            self._on_from_team_changed()
+
+    def _pick_values(self, idx):
+        p = self.model.picks[idx]
+        tid = (p.get(DRAFT_PICK_ID, "") or "").strip()
+        pick_num = self.model.int_column("picks", DRAFT_PICK_NUM)[idx]
+        year_off = self.model.int_column("picks", DRAFT_PICK_YEAR)[idx]
+
+        pick_disp = "-" if pick_num is None else str(pick_num + 1)
+        team_name = TEAM_NAMES.get(tid, tid or "Unknown")
+        round_num = pick_num // 32 + 1 if pick_num is not None else "-"
+
+        # Display year using sequential mapping: 0→1, 1→2, 3→3, etc.
+        year_display = self.model.pick_year_display().get(year_off, "-")
+        return (f"{tid}: {team_name}", f"R{round_num}:{pick_disp}", str(year_display))
+
+    def _update_pick_items(self, idxs):
+        """
+        Move the tree items of picks that changed hands to their new sorted positions. All of them
+        are detached first, so each position is counted against items that are already in order.
+        """
+        tree = self.tree_picks
+        for idx in idxs:
+            tree.detach(str(idx))
+        for pos, idx in self.model.pick_positions(idxs):
+            tree.move(str(idx), "", pos)
+            tree.item(str(idx), values=self._pick_values(idx))
+
+    def _on_from_team_changed(self, event=None):
+        """Populate picks dropdown when 'from team' is selected."""
+        from_combo_val = self.cmb_pick_from.get()
+        if not from_combo_val or ":" not in from_combo_val:
+            self.cmb_pick_idxs["values"] = []
+            return
+
+        from_tid = from_combo_val.split(":", 1)[0].strip()
+
+        # This team's picks from the model's pick index, already sorted by year offset
+        # (ascending = most recent first), then round, then pick number
+        team_picks = self.model.team_picks(from_tid)
+        nums = self.model.int_column("picks", DRAFT_PICK_NUM)
+        years = self.model.int_column("picks", DRAFT_PICK_YEAR)
+
+        # Create a mapping of year offsets to sequential display numbers (1, 2, 3...)
+        year_map = self.model.pick_year_display(team_picks)
+
+        # Create display list with indexes and store model indices
+        pick_displays = []
+        self._pick_index_map = []  # Store model indices for later reference
+        for local_idx, model_idx in enumerate(team_picks):
+            pick_num, year_off = nums[model_idx], years[model_idx]
+            round_num = pick_num // 32 + 1 if pick_num is not None else 999
+            # Display year using sequential mapping: 0→1, 1→2, 3→3, etc.
+            year_display = year_map.get(year_off, "?") if year_off is not None else "?"
+            pick_display = f"R{round_num}:{pick_num + 1 if pick_num is not None else '-'} (Yr:{year_display})  [Idx:{local_idx}]"
+            pick_displays.append(pick_display)
+            self._pick_index_map.append(model_idx)  # Store the actual model index
+        
+        self.cmb_pick_idxs["values"] = pick_displays
+        if pick_displays:
+            self.cmb_pick_idxs.current(0)
+
+    def on_acquire_picks(self):
+        if not self.model.picks:
+            messagebox.showinfo("No picks", "Load drpk.csv to edit picks.")
+            return
+
+        from_combo_val = self.cmb_pick_from.get()
+        to_combo_val = self.cmb_pick_to.get()
+        pick_display = self.cmb_pick_idxs.get()
+
+        if not from_combo_val or not to_combo_val or not pick_display:
+            messagebox.showwarning("Missing selection", "Select from team, to team, and pick(s).")
+            return
+
+        from_tid = from_combo_val.split(":", 1)[0].strip() if ":" in from_combo_val else from_combo_val
+        to_tid = to_combo_val.split(":", 1)[0].strip() if ":" in to_combo_val else to_combo_val
+
+        # Get the current index from the dropdown
+        current_display_idx = self.cmb_pick_idxs.current()
+        if current_display_idx < 0 or current_display_idx >= len(self._pick_index_map):
+            messagebox.showwarning("Invalid selection", "Please select a valid pick.")
+            return
+
+        # Get the actual model index from the mapping
+        model_idx = self._pick_index_map[current_display_idx]
+
+        self.engine.move_pick(model_idx, to_tid)
+
+        messagebox.showinfo("Acquired", f"Moved pick from {from_tid} → {to_tid}")
+        self.on_picks_moved([model_idx])
+
+    def on_picks_moved(self, idxs):
+        """The model refiled these picks: move just their tree items and re-list the from-team's picks."""
+        self._update_pick_items(idxs)
+        self._on_from_team_changed()
+
+    def on_open_pick_trade(self):
+        if not self.model.picks:
+            messagebox.showinfo("No picks", "Load drpk.csv to edit picks.")
+            return
+        PickTradeDialog(self, self.model)
+
+    # ---------- Salary Cap ----------
+    def refresh_cap(self):
+        if not self.model.salaries:
+            self.lbl_cap_status.configure(text="Load slri.csv to edit cap.")
+            self.ent_cap.delete(0, tk.END)
+            return
+
+        cap_row = self.model.salaries[0]
+        cap_val = cap_row.get(SALARY_CAP_KEY, cap_row.get("SCAD", "0"))
+        self.ent_cap.delete(0, tk.END)
+        self.ent_cap.insert(0, str(cap_val))
+        self.lbl_cap_status.configure(text=f"Loaded slri.csv rows: {len(self.model.salaries)}")
+
+    def _populate_tree_with_rows(self, tree: VirtualTreeview, headers: list, rows: list):
+        if not headers:
+            tree.set_columns(())
+            tree.set_rows([], None)
+            return
+
+        tree.set_columns(headers, width=140)
+        tree.set_rows(range(len(rows)), lambda i: [(rows[i].get(h, "") or "") for h in headers])
+
+    def _staff_row_values(self, rows, headers):
+        """values(model_idx) callback for the staff trees (TGID shown with the team name)."""
+        def values(idx):
+            r = rows[idx]
+            vals = []
+            for h in headers:
+                if h == "TGID":
+                    tid = (r.get("TGID", "") or "").strip()
+                    vals.append(f"{tid}: {TEAM_NAMES.get(tid, tid)}" if tid else "")
+                else:
+                    vals.append((r.get(h, "") or ""))
+            return vals
+        return values
+
+    def _staff_sort_key(self, table):
+        """key(model_idx) for the staff trees: TGID (numeric first), coaches then by name."""
+        rows = getattr(self.model, table)
+        has_tgid = "TGID" in (getattr(self.model, TABLES[table][0]) or [])
+        tgids = self.model.int_column(table, "TGID") if has_tgid else None
+
+        def tg_key(i):
+            tnum = tgids[i]
+            return (0, tnum) if tnum is not None else (1, (rows[i].get("TGID", "") or "").strip())
+
+        # Model index last keeps ties in file order (same as the old stable sort)
+        if table == "coaches":
+            def name_key(r):
+                return ((r.get("CLNM", "") or ""), (r.get("CFNM", "") or ""))
+            if has_tgid:
+                return lambda i: (tg_key(i),) + name_key(rows[i]) + (i,)
+            return lambda i: name_key(rows[i]) + (i,)
+        if has_tgid:
+            return lambda i: (tg_key(i), i)
+        return None
+
+    def _update_staff_row(self, table, idx):
+        """Push one edited staff row to its tree without rebuilding it."""
+        tree = {"trainers": self.tree_trainer, "coaches": self.tree_coach, "gms": self.tree_gm}[table]
+        tree.update_row(idx)
+        if table == "coaches":
+            self._coach_sorted = None  # the row may have moved; re-sort on the next search
+
+    def refresh_trainer(self):
+        # Show TGID and SKPT if present (display team name for TGID)
+        desired = ["TGID", "SKPT"]
+        headers = [h for h in desired if h in (self.model.trainer_headers or [])]
+        if not headers:
+            self._populate_tree_with_rows(self.tree_trainer, self.model.trainer_headers, self.model.trainers)
+            return
+
+        # Only the visible window gets Treeview items; values are fetched on scroll.
+        # Sorted by TGID if present, numeric when possible
+        self.tree_trainer.set_columns(headers, width=160)
+        self.tree_trainer.set_rows(range(len(self.model.trainers)),
+                                   self._staff_row_values(self.model.trainers, headers),
+                                   key=self._staff_sort_key("trainers"))
+
+    def _on_trainer_select(self):
+        idx = self.tree_trainer.selected_index()
+        if idx is None:
+            return
+        # find SKPT value from model if present
+        row = self.model.trainers[idx]
+        sk = row.get("SKPT") if row is not None else None
+        self.ent_trainer_skpt.delete(0, tk.END)
+        if sk is not None:
+            self.ent_trainer_skpt.insert(0, str(sk))
+
+    def set_trainer_skpt_to_max(self):
+        """Auto-fill trainer SKPT entry field with maximum value (131071)."""
+        self.ent_trainer_skpt.delete(0, tk.END)
+        self.ent_trainer_skpt.insert(0, "131071")
+
+    def set_coach_skpt_to_max(self):
+        """Auto-fill coach SKPT entry field with maximum value (131071)."""
+        self.ent_coach_skpt.delete(0, tk.END)
+        self.ent_coach_skpt.insert(0, "131071")
+
+    def set_gm_skpt_to_max(self):
+        """Auto-fill GM SKPT entry field with maximum value (131071)."""
+        self.ent_gm_skpt.delete(0, tk.END)
+        self.ent_gm_skpt.insert(0, "131071")
+
+    def _apply_trainer_skpt(self):
+        idx = self.tree_trainer.selected_index()
+        if idx is None:
+            messagebox.showwarning("No selection", "Select a trainer row first.")
+            return
+        val = self.ent_trainer_skpt.get().strip()
+        try:
+            # Clamped to the allowed range
+            v, orig = self.engine.set_skpt("trainers", idx, val)
+            self._update_staff_row("trainers", idx)
+            if orig != v:
+                # show only the clamped numeric value (no decimal)
+                messagebox.showinfo("SKPT", str(v))
+        except Exception as e:
+            messagebox.showerror("Invalid SKPT", str(e))
+
+    def refresh_coach(self):
+        # Prefer TGID + name + SKPT when available
+        desired = ["TGID", "CFNM", "CLNM", "SKPT", "CSPC", "SKPC", "SKPA", "SKPF", "CHEM"]
+        headers = [h for h in desired if h in (self.model.coach_headers or [])]
+        if not headers:
+            headers = self.model.coach_headers
+
+        if self._coach_search_job is not None:
+            self.after_cancel(self._coach_search_job)
+            self._coach_search_job = None
+
+        # Search box ("first last" or just first or last) goes through the model's name index
+        matches = self.model.search_names("coaches", self.coach_search_var.get())
+
+        # Sorted by TGID if present (numeric when possible), then last/first name; the full
+        # order is sorted once and filtered per search
+        key = self._staff_sort_key("coaches")
+        if self._coach_sorted is None:
+            self._coach_sorted = sorted((key(i), i) for i in range(len(self.model.coaches)))
+        keyed = self._coach_sorted if matches is None else [ki for ki in self._coach_sorted if ki[1] in matches]
+
+        # Only the visible window gets Treeview items; values are fetched on scroll.
+        self.tree_coach.set_columns(headers or [], width=140)
+        self.tree_coach.set_rows([i for _, i in keyed],
+                                 self._staff_row_values(self.model.coaches, headers or []),
+                                 key=key, keys=[k for k, _ in keyed])
+
+    def _schedule_coach_search(self):
+        """Debounce as-you-type filtering: refresh once typing pauses for SEARCH_DEBOUNCE_MS."""
+        if self._coach_search_job is not None:
+            self.after_cancel(self._coach_search_job)
+        self._coach_search_job = self.after(SEARCH_DEBOUNCE_MS, self.refresh_coach)
+
+    def _on_coach_select(self):
+        idx = self.tree_coach.selected_index()
+        if idx is None:
+            return
+        row = self.model.coaches[idx]
+        sk = row.get("SKPT") if row is not None else None
+        self.ent_coach_skpt.delete(0, tk.END)
+        if sk is not None:
+            self.ent_coach_skpt.insert(0, str(sk))
+
+    def _apply_coach_skpt(self):
+        idx = self.tree_coach.selected_index()
+        if idx is None:
+            messagebox.showwarning("No selection", "Select a coach row first.")
+            return
+        val = self.ent_coach_skpt.get().strip()
+        try:
+            # Clamped to the allowed range
+            v, orig = self.engine.set_skpt("coaches", idx, val)
+            self._update_staff_row("coaches", idx)
+            if orig != v:
+                messagebox.showinfo("SKPT", str(v))
+        except Exception as e:
+            messagebox.showerror("Invalid SKPT", str(e))
+
+    def refresh_gm(self):
+        # Show TGID and SKPT if present (display team name for TGID)
+        desired = ["TGID", "SKPT"]
+        headers = [h for h in desired if h in (self.model.gm_headers or [])]
+        if not headers:
+            self._populate_tree_with_rows(self.tree_gm, self.model.gm_headers, self.model.gms)
+            return
+
+        # Only the visible window gets Treeview items; values are fetched on scroll.
+        # Sorted by TGID if present, numeric when possible
+        self.tree_gm.set_columns(headers, width=160)
+        self.tree_gm.set_rows(range(len(self.model.gms)),
+                              self._staff_row_values(self.model.gms, headers),
+                              key=self._staff_sort_key("gms"))
+
+    def _on_gm_select(self):
+        idx = self.tree_gm.selected_index()
+        if idx is None:
+            return
+        row = self.model.gms[idx]
+        sk = row.get("SKPT") if row is not None else None
+        self.ent_gm_skpt.delete(0, tk.END)
+        if sk is not None:
+            self.ent_gm_skpt.insert(0, str(sk))
+
+    def _apply_gm_skpt(self):
+        idx = self.tree_gm.selected_index()
+        if idx is None:
+            messagebox.showwarning("No selection", "Select a GM row first.")
+            return
+        val = self.ent_gm_skpt.get().strip()
+        try:
+            # Clamped to the allowed range
+            v, orig = self.engine.set_skpt("gms", idx, val)
+            self._update_staff_row("gms", idx)
+            if orig != v:
+                messagebox.showinfo("SKPT", str(v))
+        except Exception as e:
+            messagebox.showerror("Invalid SKPT", str(e))
+
+    def _on_tree_double_click(self, event, vtree: VirtualTreeview):
+        tree = vtree.tree
+        # Identify clicked row/column
+        region = tree.identify_region(event.x, event.y)
+        if region != "cell":
+            return
+        rowid = tree.identify_row(event.y)
+        col = tree.identify_column(event.x)  # returns like '#1'
+        if not rowid or not col:
+            return
+        idx = vtree.index_of_item(rowid)
+        if idx is None:
+            return
+        try:
+            col_idx = int(col.replace('#', '')) - 1
+        except Exception:
+            return
+        cols = list(tree["columns"]) if tree["columns"] else []
+        if col_idx < 0 or col_idx >= len(cols):
+            return
+        colname = cols[col_idx]
+        # Allow editing SKPT and new coach numeric columns
+        if colname not in STAFF_NUMERIC_RANGES:
+            return
+
+        bbox = tree.bbox(rowid, column=col)
+        if not bbox:
+            return
+        x, y, w, h = bbox
+
+        # Create entry overlay
+        entry = ttk.Entry(tree)
+        entry.place(x=x, y=y, width=w, height=h)
+        # prefill with current value
+        cur = tree.set(rowid, colname)
+        entry.insert(0, cur)
+        entry.focus_set()
+
+        def finish(save: bool):
+            val = entry.get().strip()
+            entry.destroy()
+            if not save:
+                return
+            try:
+                target = None
+                if vtree is self.tree_trainer:
+                    target = "trainers"
+                elif vtree is self.tree_coach:
+                    target = "coaches"
+                elif vtree is self.tree_gm:
+                    target = "gms"
+                if target is None:
+                    return
+                # write back (integer or integer-like float, clamped to the column's range)
+                self.engine.set_staff_value(target, idx, colname, val)
+                # update just the edited row
+                self._update_staff_row(target, idx)
+            except Exception as e:
+                messagebox.showerror("Invalid SKPT", str(e))
+
+        entry.bind("<Return>", lambda e: finish(True))
+        entry.bind("<FocusOut>", lambda e: finish(True))
+        entry.bind("<Escape>", lambda e: finish(False))
+
+    def set_cap_to_max(self):
+        """Auto-fill the salary cap entry field with maximum value."""
+        self.ent_cap.delete(0, tk.END)
+        self.ent_cap.insert(0, "4294967295")
+
+    def on_apply_cap(self):
+        if not self.model.salaries:
+            messagebox.showinfo("No salary data", "Load slri.csv first.")
+            return
+        
+        raw = self.ent_cap.get().strip()
+        if not raw:
+            messagebox.showwarning("Empty field", "Enter a salary cap value.")
+            return
+        
+        try:
+            # Parse (integer, with float fallback) and clamp to 0–4,294,967,295 = 0xFFFFFFFF
+            v, orig_v = self.engine.set_cap(raw)
+            
+            # Update display
+            self.ent_cap.delete(0, tk.END)
+            self.ent_cap.insert(0, str(v))
+            self.lbl_cap_status.configure(text=f"Updated to {v}")
+            
+            # Show result message
+            if orig_v != v:
+                messagebox.showinfo("Clamped", f"Value {orig_v} was clamped to {v}. Click 'Save' to write to file.")
+            else:
+                messagebox.showinfo("Updated", f"Salary cap set to {v}. Click 'Save' to write to file.")
+            
+        except Exception as e:
+            messagebox.showerror("Cap Error", str(e))
+
+    # ---------- Raw Column Editor ----------
+    def refresh_raw_columns(self):
+        if not self.model.player_headers:
+            self.cmb_raw_col["values"] = []
+            return
+        self.cmb_raw_col["values"] = self.model.player_headers
+        self.cmb_raw_col.current(0)
+        self.cmb_raw_col.bind("<<ComboboxSelected>>", lambda e: self.on_raw_column_changed())
+
+    def on_raw_column_changed(self):
+        if self.selected_player_index is None:
+            return
+        col = self.cmb_raw_col.get().strip()
+        if not col:
+            return
+        r = self.model.players[self.selected_player_index]
+        self.ent_raw_val.delete(0, tk.END)
+        self.ent_raw_val.insert(0, (r.get(col, "") or "").strip())
+
+    def on_apply_raw_column(self):
+        if self.selected_player_index is None:
+            messagebox.showinfo("No player", "Select a player first.")
+            return
+        col = self.cmb_raw_col.get().strip()
+        if not col:
+            return
+        val = self.ent_raw_val.get()
+        try:
+            self.engine.set_raw(self.selected_player_index, col, val)
+        except Exception as e:
+            messagebox.showerror("Apply Error", str(e))
+            return
+        self.refresh_stats_for_player()
+        self._update_player_row(self.selected_player_index)